@@ -0,0 +1,48 @@
+"""Benchmark of copy_scenario_state on scenarios of increasing size.
+
+Usage: PYTHONPATH=pineapple python benchmarks/copy_scenario.py [sizes...]
+
+Each scenario is a chain of Nodes : every Node reads the output of the previous one and
+flows to the next one. The time per Node should stay roughly constant when the size of
+the scenario grows (linear scaling).
+"""
+
+import sys
+import time
+
+from pineapple_core.core.node import copy_scenario_state
+from pineapple_nodes.nodes.flow_nodes import null_node
+from pineapple_nodes.nodes.math_nodes import add_node
+
+
+def build_chain(size):
+    first = add_node().connect_input(a=0, b=1)
+    previous = first
+    for _ in range(size - 1):
+        current = add_node().connect_input(a=previous["out"], b=1)
+        previous.connect_flow(null_node())
+        previous.connect_flow(current)
+        previous = current
+    return first
+
+
+def measure(size, repeat=3):
+    start_node = build_chain(size)
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        copy_scenario_state(start_node)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main(sizes):
+    print(f"{'nodes':>8} {'seconds':>10} {'us/node':>10}")
+    for size in sizes:
+        duration = measure(size)
+        nodes = size * 2
+        print(f"{nodes:>8} {duration:>10.4f} {duration / nodes * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [250, 500, 1000, 2000])
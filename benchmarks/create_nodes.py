@@ -0,0 +1,44 @@
+"""Benchmark of the creation of Nodes, in microseconds per Node.
+
+Usage: PYTHONPATH=pineapple python benchmarks/create_nodes.py [nodes]
+
+Each kind creates the given amount of Nodes (the best of several repeats is kept).
+    - value: Value Nodes with a hidden input
+    - math: Math Nodes with two inputs
+    - switch: Switch Nodes (input and flows)
+    - copy: copies of a Math Node
+"""
+
+import sys
+import time
+
+from pineapple_nodes.nodes.flow_nodes import switch_node
+from pineapple_nodes.nodes.math_nodes import add_node
+from pineapple_nodes.nodes.value_nodes import int_node
+
+KINDS = {
+    "value": int_node,
+    "math": add_node,
+    "switch": switch_node,
+    "copy": add_node().copy,
+}
+
+
+def measure(create, size, repeats=5):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(size):
+            create()
+        best = min(best, time.perf_counter() - start)
+    return best / size * 1e6
+
+
+def main(size):
+    print(f"{'kind':>8} {'us/node':>10}")
+    for kind, create in KINDS.items():
+        print(f"{kind:>8} {measure(create, size):>10.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
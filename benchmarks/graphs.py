@@ -0,0 +1,77 @@
+"""Generators of synthetic scenarios used by the benchmarks.
+
+Usage: from graphs import GENERATORS (benchmarks/suite.py)
+
+Every generator takes the amount of Nodes (or of inputs for fan_in) and returns the Node
+that triggers the scenario along with all the Nodes of the scenario.
+    - chain: Null Nodes connected by flows
+    - fan_in: a Report Node reading the results of AssertEquals Nodes through its *args
+    - autotrigger_tree: a complete binary tree of Add Nodes, the root autotriggers
+      all the others and the leaves read constants
+    - random_dag: Add / Subtract Nodes reading constants or the outputs of random
+      previous Nodes, a Null Node flows to every Node whose output is not read
+"""
+
+import random
+
+from pineapple_nodes.nodes.assertion_nodes import assert_equals_node
+from pineapple_nodes.nodes.flow_nodes import null_node
+from pineapple_nodes.nodes.math_nodes import add_node, subtract_node
+from pineapple_nodes.nodes.reporting_nodes import report_node
+
+
+def build_chain(size):
+    nodes = [null_node()]
+    for _ in range(size - 1):
+        nodes.append(null_node())
+        nodes[-2].connect_flow(nodes[-1])
+    return nodes[0], nodes
+
+
+def build_fan_in(size):
+    assertions = [
+        assert_equals_node().connect_input(a=index, b=index, message="{} == {}")
+        for index in range(size)
+    ]
+    report = report_node().connect_input(*assertions)
+    return report, assertions + [report]
+
+
+def build_autotrigger_tree(size):
+    nodes = [add_node() for _ in range(size)]
+    for index, current in enumerate(nodes):
+        children = [child for child in (2 * index + 1, 2 * index + 2) if child < size]
+        current.connect_input(
+            a=nodes[children[0]]["out"] if children else index,
+            b=nodes[children[1]]["out"] if len(children) > 1 else 1,
+        )
+    return nodes[0], nodes
+
+
+def build_random_dag(size, density=0.5, seed=0):
+    generator = random.Random(seed)
+    nodes, read = [], set()
+    for index in range(size):
+        current = generator.choice((add_node, subtract_node))()
+        sources = {}
+        for name in ("a", "b"):
+            if nodes and generator.random() < density:
+                source = generator.randrange(len(nodes))
+                read.add(source)
+                sources[name] = nodes[source]["out"]
+            else:
+                sources[name] = generator.randrange(10)
+        nodes.append(current.connect_input(**sources))
+    start = null_node()
+    for index, current in enumerate(nodes):
+        if index not in read:
+            start.connect_flow(current)
+    return start, [start] + nodes
+
+
+GENERATORS = {
+    "chain": build_chain,
+    "fan_in": build_fan_in,
+    "autotrigger_tree": build_autotrigger_tree,
+    "random_dag": build_random_dag,
+}
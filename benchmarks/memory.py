@@ -0,0 +1,77 @@
+"""Benchmark of the memory used by scenarios, in bytes per Node.
+
+Usage: PYTHONPATH=pineapple python benchmarks/memory.py [nodes]
+
+Each shape builds a scenario of the given amount of Nodes and measures the memory
+allocated while building it (with tracemalloc), the Nodes being kept alive.
+    - value: Value Nodes with a constant input
+    - math: Math Nodes reading the output of the previous Node
+    - flow: Null Nodes connected by flows
+    - switch: Switch Nodes with 4 branches each
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from pineapple_nodes.nodes.flow_nodes import null_node, switch_node
+from pineapple_nodes.nodes.math_nodes import add_node
+from pineapple_nodes.nodes.value_nodes import int_node
+
+
+def build_values(size):
+    return [int_node().connect_input(a=index) for index in range(size)]
+
+
+def build_math(size):
+    nodes = [add_node().connect_input(a=0, b=1)]
+    for _ in range(size - 1):
+        nodes.append(add_node().connect_input(a=nodes[-1]["out"], b=1))
+    return nodes
+
+
+def build_flow(size):
+    nodes = [null_node()]
+    for _ in range(size - 1):
+        nodes.append(null_node())
+        nodes[-2].connect_flow(nodes[-1])
+    return nodes
+
+
+def build_switch(size):
+    nodes = []
+    for _ in range(size // 5):
+        switch = switch_node().connect_input(branch=0)
+        nodes.append(switch)
+        for branch in range(4):
+            nodes.append(null_node())
+            switch.connect_flow(nodes[-1], branch)
+    return nodes
+
+
+SHAPES = {
+    "value": build_values,
+    "math": build_math,
+    "flow": build_flow,
+    "switch": build_switch,
+}
+
+
+def measure(build, size):
+    gc.collect()
+    tracemalloc.start()
+    nodes = build(size)
+    gc.collect()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / len(nodes)
+
+
+def main(size):
+    print(f"{'shape':>8} {'bytes/node':>12}")
+    for shape, build in SHAPES.items():
+        print(f"{shape:>8} {measure(build, size):>12.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
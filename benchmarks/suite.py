@@ -0,0 +1,191 @@
+"""Benchmark suite of the hot paths of the engine, on scenarios of increasing size.
+
+Usage: PYTHONPATH=pineapple python benchmarks/suite.py [-o results.json]
+       [-s sizes...] [-c cases...] [-r repeats] [--compare baseline.json] [--threshold 1.25]
+
+Each case is measured for every size (the best of several repeats is kept, the scenario
+is built before the timer starts) and reported in microseconds per unit :
+    - create_nodes: creation of Add Nodes (unit: Node)
+    - connect_input: connection of both inputs of Add Nodes to a NodeOutput (unit: Node)
+    - trigger_chain: trigger of a chain of Null Nodes already triggered once (unit: Node)
+    - fan_in: first trigger of a Report Node with one *args input by AssertEquals
+      Node (unit: input)
+    - autotrigger_tree: first trigger of the root of a tree of Add Nodes (unit: Node)
+    - autotrigger_tree_fresh: trigger of the same tree once all its Nodes are fresh
+      (unit: Node)
+    - random_dag: first trigger of a random DAG of Math Nodes (unit: Node)
+    - copy_scenario_state: copy of a random DAG (unit: Node)
+    - dump: Node.dump of the Nodes of a random DAG (unit: Node)
+    - output_set_int / output_set_dict: NodeOutput.set with the type check of an int /
+      of a dict of the AssertEquals Node (unit: set)
+    - output_set_list: NodeOutput.set of a list of ints with a [int] type (unit: item)
+The results are written as JSON, when a baseline (a previous results file) is given the
+cases slower than threshold times the baseline are listed and the exit code is 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from graphs import build_autotrigger_tree, build_chain, build_fan_in, build_random_dag
+from pineapple_core.core.node import copy_scenario_state
+from pineapple_core.core.node_output import NodeOutput
+from pineapple_nodes.nodes.assertion_nodes import assert_equals_node
+from pineapple_nodes.nodes.math_nodes import add_node
+from pineapple_nodes.nodes.value_nodes import int_node
+
+SIZES = [100, 1000, 5000]
+
+
+def setup_connect_input(size):
+    return int_node().connect_input(a=1)["out"], [add_node() for _ in range(size)]
+
+
+def run_connect_input(state):
+    source, nodes = state
+    for current in nodes:
+        current.connect_input(a=source, b=source)
+
+
+def warm(build):
+    def setup(size):
+        start_node, nodes = build(size)
+        start_node.trigger()
+        return start_node, nodes
+
+    return setup
+
+
+def setup_output_set(output_type, value, size):
+    output = NodeOutput(int_node(), "out", output_type)
+    return output, value, size
+
+
+def run_output_set(state):
+    output, value, size = state
+    for _ in range(size):
+        output.set(value)
+
+
+def trigger_start(state):
+    state[0].trigger()
+
+
+# name: (unit, setup, run), setup builds the state of the run (not measured)
+CASES = {
+    "create_nodes": ("node", lambda size: size, lambda size: [add_node() for _ in range(size)]),
+    "connect_input": ("node", setup_connect_input, run_connect_input),
+    "trigger_chain": ("node", warm(build_chain), trigger_start),
+    "fan_in": ("input", build_fan_in, trigger_start),
+    "autotrigger_tree": ("node", build_autotrigger_tree, trigger_start),
+    "autotrigger_tree_fresh": ("node", warm(build_autotrigger_tree), trigger_start),
+    "random_dag": ("node", build_random_dag, trigger_start),
+    "copy_scenario_state": (
+        "node",
+        build_random_dag,
+        lambda state: copy_scenario_state(state[0]),
+    ),
+    "dump": ("node", build_random_dag, lambda state: [node.dump() for node in state[1]]),
+    "output_set_int": (
+        "set",
+        lambda size: setup_output_set(int, 1, size),
+        run_output_set,
+    ),
+    "output_set_dict": (
+        "set",
+        lambda size: setup_output_set(
+            assert_equals_node()["out"].output_type, {"result": True, "message": ""}, size
+        ),
+        run_output_set,
+    ),
+    "output_set_list": (
+        "item",
+        lambda size: setup_output_set([int], list(range(size)), 1),
+        run_output_set,
+    ),
+}
+
+
+def measure(case, size, repeats):
+    _, setup, run = CASES[case]
+    best = float("inf")
+    for _ in range(repeats):
+        state = setup(size)
+        start = time.perf_counter()
+        run(state)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_suite(cases, sizes, repeats):
+    results = []
+    for case in cases:
+        for size in sizes:
+            seconds = measure(case, size, repeats)
+            results.append(
+                {
+                    "case": case,
+                    "size": size,
+                    "unit": CASES[case][0],
+                    "seconds": seconds,
+                    "us_per_unit": seconds / size * 1e6,
+                }
+            )
+    return results
+
+
+def find_regressions(results, baseline, threshold):
+    previous = {(result["case"], result["size"]): result for result in baseline["results"]}
+    regressions = []
+    for result in results:
+        reference = previous.get((result["case"], result["size"]))
+        if reference and result["us_per_unit"] > reference["us_per_unit"] * threshold:
+            regressions.append((result, reference["us_per_unit"]))
+    return regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Benchmarks of the hot paths of the engine")
+    parser.add_argument("-o", "--output", default="benchmark_results.json")
+    parser.add_argument("-s", "--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("-c", "--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("-r", "--repeats", type=int, default=5)
+    parser.add_argument("--compare", help="results file of a previous run")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    parsed_args = parser.parse_args(args)
+
+    results = run_suite(parsed_args.cases, parsed_args.sizes, parsed_args.repeats)
+    print(f"{'case':>24} {'size':>8} {'us/unit':>16}")
+    for result in results:
+        unit = f"{result['us_per_unit']:.2f}/{result['unit']}"
+        print(f"{result['case']:>24} {result['size']:>8} {unit:>16}")
+    with open(os.path.join(os.path.dirname(__file__), "..", "pineapple", "VERSION")) as file:
+        version = file.read().strip()
+    report = {
+        "version": version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.time(),
+        "repeats": parsed_args.repeats,
+        "results": results,
+    }
+    with open(parsed_args.output, "w") as output_file:
+        json.dump(report, output_file, indent=4)
+
+    if parsed_args.compare:
+        with open(parsed_args.compare) as baseline_file:
+            regressions = find_regressions(results, json.load(baseline_file), parsed_args.threshold)
+        for result, reference in regressions:
+            print(
+                f"regression: {result['case']} size {result['size']}: "
+                f"{result['us_per_unit']:.2f} us/{result['unit']} (was {reference:.2f})"
+            )
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""Benchmark of the flow scheduling of a Switch Node with many branches.
+
+Usage: PYTHONPATH=pineapple python benchmarks/switch_flows.py [branches...]
+
+The Switch Node enables a single branch out of all of its Flows and is triggered
+many times, the time per trigger should stay roughly constant when the amount
+of branches grows.
+"""
+
+import sys
+import time
+
+from pineapple_nodes.nodes.flow_nodes import null_node, switch_node
+
+
+def build_switch(branches):
+    switch = switch_node().connect_input(branch=0)
+    for branch in range(branches):
+        switch.connect_flow(null_node(), branch)
+    return switch
+
+
+def measure(branches, triggers=200):
+    switch = build_switch(branches)
+    start = time.perf_counter()
+    for trigger in range(triggers):
+        switch.inputs["branch"].set(trigger % branches)
+        switch.trigger()
+    return (time.perf_counter() - start) / triggers
+
+
+def main(branch_counts):
+    print(f"{'branches':>8} {'us/trigger':>12}")
+    for branches in branch_counts:
+        print(f"{branches:>8} {measure(branches) * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main([int(branches) for branches in sys.argv[1:]] or [10, 100, 500, 1000])
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""This module contains everything that is related to batch execution.
+A batch execution evaluates a Node (and the autotrigger Nodes it depends on) for many
+rows of input values at once : the ExecutionPlan is compiled once and every Node is
+evaluated column by column, in the order of the plan.
+Nodes that don't depend on any batch input are executed only once, batch-capable Nodes
+(see batch attribute on Node class) receive whole columns and the other
+Nodes are called once per row.
+The values of the batch inputs and of the NodeOutputs that depend on them are
+restored once the batch is done.
+"""
+
+from typing import Any, Dict, List, Tuple, Union
+
+from pineapple_core.core.exceptions import InvalidBatchInputError
+from pineapple_core.core.node_input import NodeInput
+from pineapple_core.core.node_output import NodeOutput
+from pineapple_core.core.planner import get_plan, get_sources
+
+
+class BatchResult:
+    """Class that holds the results of a batch execution, column by column
+
+    Attributes
+    ==========
+    node: Node
+        Reference to the Node the batch was executed for
+    size: int
+        Amount of rows in the batch
+    columns: Dict[NodeOutput, List[Any]]
+        Values of the NodeOutputs that depend on the batch inputs, one per row
+    errors: List[Exception]
+        Exception raised for each row (None if the row succeeded), a row that failed
+        is not evaluated further and its values are None
+    """
+
+    def __init__(self, node: "Node", size: int):
+        """BatchResult constructor
+
+        Parameters
+        ==========
+        node: Node
+            Reference to the Node the batch is executed for
+        size: int
+            Amount of rows in the batch
+        """
+        self.node = node
+        self.size = size
+        self.columns = {}
+        self.errors = [None] * size
+
+    def column(self, output: NodeOutput) -> List[Any]:
+        """Gets the values of a NodeOutput for all the rows
+
+        Parameters
+        ==========
+        output: NodeOutput
+            Reference to a NodeOutput of the Node or one of its autotrigger dependencies
+
+        Returns
+        =======
+        List[Any]:
+            One value per row, NodeOutputs that don't depend on the batch inputs
+            have the same value for every row
+        """
+        if output in self.columns:
+            return self.columns[output]
+        return [output.get()] * self.size
+
+    def failed_rows(self) -> List[int]:
+        """Lists the rows that raised an Exception
+
+        Returns
+        =======
+        List[int]:
+            Indexes of the rows that failed
+        """
+        return [row for row, error in enumerate(self.errors) if error is not None]
+
+    def __getitem__(self, name: Any) -> List[Any]:
+        return self.column(self.node.outputs[name])
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchResult({self.node}, size={self.size}, "
+            f"failures={len(self.failed_rows())})"
+        )
+
+
+def trigger_batch(
+    node: "Node", inputs: Dict[Union["Node", NodeInput], List[Any]]
+) -> BatchResult:
+    """Evaluates a Node and its autotrigger dependencies for every row of a batch.
+    Flows are not followed and trigger callbacks are not called.
+
+    Parameters
+    ==========
+    node: Node
+        Reference to the Node to evaluate
+    inputs: Dict[Union[Node, NodeInput], List[Any]]
+        Values of the batch inputs, one list per NodeInput (all of the same length).
+        A Node with a single NodeInput (a Value Node for example) can be
+        given instead of its NodeInput
+
+    Returns
+    =======
+    BatchResult:
+        The values of the NodeOutputs for every row
+
+    Raises
+    ======
+    InvalidBatchInputError:
+        If a batch input is not a NodeInput or the columns don't have the same length
+    """
+    entries = {
+        _get_entry_input(key): list(values) for key, values in inputs.items()
+    }
+    sizes = {len(values) for values in entries.values()}
+    if len(sizes) > 1:
+        raise InvalidBatchInputError(
+            node, f"all the columns should have the same length, got {sorted(sizes)}"
+        )
+    result = BatchResult(node, sizes.pop() if sizes else 1)
+    steps = [(step.autotriggered_node, step.sources) for step in get_plan(node).steps]
+    values_backup = {node_input: node_input.value for node_input in entries}
+    outputs_backup = {}
+    try:
+        for current_node, sources in steps + [(node, get_sources(node))]:
+            _execute_column(current_node, sources, entries, result, outputs_backup)
+    finally:
+        for node_input, value in values_backup.items():
+            node_input.value = value
+        for output, (value, stamp) in outputs_backup.items():
+            output.value, output.stamp = value, stamp
+    return result
+
+
+def _get_entry_input(key: Union["Node", NodeInput]) -> NodeInput:
+    from pineapple_core.core.node import Node
+
+    if isinstance(key, NodeInput):
+        return key
+    if isinstance(key, Node):
+        node_inputs = key._find_all_possible_inputs()
+        if len(node_inputs) == 1:
+            return node_inputs[0]
+    raise InvalidBatchInputError(key, "expected a NodeInput or a Node with a single input")
+
+
+def _execute_column(
+    node: "Node",
+    sources: List[NodeOutput],
+    entries: Dict[NodeInput, List[Any]],
+    result: BatchResult,
+    outputs_backup: Dict[NodeOutput, Tuple[Any, int]],
+):
+    varying_inputs = [
+        node_input for node_input in node._find_all_possible_inputs() if node_input in entries
+    ]
+    varying_sources = [source for source in sources if source in result.columns]
+    if not (varying_inputs or varying_sources):
+        node._execute_with_retries()
+        return
+
+    def load_row(row: int):
+        for node_input in varying_inputs:
+            node_input.value = entries[node_input][row]
+        for source in varying_sources:
+            source.value = result.columns[source][row]
+
+    for output in node.outputs.values():
+        outputs_backup[output] = (output.value, output.stamp)
+    columns = {output: [None] * result.size for output in node.outputs.values()}
+    rows = [row for row, error in enumerate(result.errors) if error is None]
+    if node.batch:
+        arguments = []
+        for row in rows:
+            load_row(row)
+            arguments.append(node._get_arguments())
+        try:
+            values = _call_batch_function(node, arguments) if rows else []
+        except Exception as exception:
+            for row in rows:
+                result.errors[row] = exception
+            values = []
+        for row, value in zip(rows, values):
+            try:
+                node._set_result(value)
+            except Exception as exception:
+                result.errors[row] = exception
+                continue
+            for output, column in columns.items():
+                column[row] = output.get()
+    else:
+        for row in rows:
+            load_row(row)
+            try:
+                node._execute_with_retries()
+            except Exception as exception:
+                result.errors[row] = exception
+                continue
+            for output, column in columns.items():
+                column[row] = output.get()
+    result.columns.update(columns)
+
+
+def _call_batch_function(
+    node: "Node", arguments: List[Tuple[List[Any], Dict[str, Any]]]
+) -> List[Any]:
+    args_columns = [list(column) for column in zip(*[args for args, _ in arguments])]
+    if node.is_aware:
+        args_columns[node.function_arg_spec.args.index("self")] = node
+    kwargs_columns = {
+        name: [kwargs[name] for _, kwargs in arguments] for name in arguments[0][1]
+    }
+    values = node._call_with_retries(
+        lambda: list(node.function(*args_columns, **kwargs_columns))
+    )
+    if len(values) != len(arguments):
+        raise InvalidBatchInputError(
+            node, f"expected {len(arguments)} results from the function, got {len(values)}"
+        )
+    return values
@@ -2,12 +2,14 @@
 """This module contains everything that is related to callbacks.
 It contains two classes : CallbackManager and NodeCallbacks
 CallbackManager is a class that allows you to manage a collection of Callables
-NodeCallbacks acts as a static container of CallbackManagers
+NodeCallbacks acts as a static container of CallbackManagers, created lazily
 """
-from typing import Any, Callable
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple
 
 from pineapple_core.core.exceptions import (
     CallbackManagerNotFoundError,
+    EmptyCallbackManagerError,
     NoCallbacksError,
 )
 from pineapple_core.core.flows import Flow
@@ -25,6 +27,8 @@ class CallbackManager:
         Dictionnary of callbacks (functions) where the key is equal to the value
     """
 
+    __slots__ = ("name", "callbacks", "signature")
+
     def __init__(self, name: str, *signature: type):
         """CallbackManager constructor
 
@@ -107,7 +111,7 @@ class CallbackManager:
         CallbackManager:
             A reference to the newly created copy of the CallbackManager
         """
-        new_callback_manager = CallbackManager(self.signature)
+        new_callback_manager = CallbackManager(self.name, *self.signature)
         new_callback_manager.callbacks = {
             callback_name: callback_function
             for callback_name, callback_function in self.callbacks.items()
@@ -115,146 +119,237 @@ class CallbackManager:
         return new_callback_manager
 
 
-class NodeCallbacks(object):
-    """Class that acts as a storage for all Node's CallbackManagers
+class _EmptyCallbackManager:
+    """Class that stands for the CallbackManager of an event that never received
+    any callback. There is a single immutable instance per event, shared by all the
+    NodeCallbacks, the actual CallbackManager is only created by NodeCallbacks.add
     """
 
-    Callbacks = [
-        "add_output",
-        "after_flow",
-        "before_flow",
-        "connect_flow",
-        "connect_input",
-        "flow_failure",
-        "set_input_value",
-        "trigger",
-        "trigger_input",
-    ]
+    __slots__ = ("name",)
 
-    def __init__(self):
-        from pineapple_core.core.node import Node
+    def __init__(self, name: str):
+        object.__setattr__(self, "name", name)
 
-        """
-        add_output:
-            Callback triggered when a NodeOutput is added to the Node using the
-            add_output method
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"CallbackManager '{self.name}' is not created yet")
+
+    @property
+    def callbacks(self) -> Dict[Callable, Callable]:
+        return {}
+
+    @property
+    def signature(self) -> Tuple[type]:
+        return _get_signatures()[self.name]
+
+    def add(self, *callbacks: Callable):
+        raise EmptyCallbackManagerError(self.name)
+
+    def remove(self, callback: Callable):
+        raise KeyError(callback)
+
+    def remove_all(self):
+        pass
+
+    def __call__(self, *args: Any, **kwargs: Any):
+        raise NoCallbacksError(self.name)
+
+    def __bool__(self) -> bool:
+        return False
+
+    def copy(self) -> CallbackManager:
+        return CallbackManager(self.name, *self.signature)
+
+
+@lru_cache(maxsize=None)
+def _get_signatures() -> Dict[str, Tuple[type]]:
+    """Gets the signature of every event of NodeCallbacks and of the execution hooks
+    (see pineapple_core.core.hooks), the events they share have the same signature
+
+    Returns
+    =======
+    Dict[str, Tuple[type]]:
+        Types of the arguments of each event
+    """
+    from pineapple_core.core.node import Node
+
+    return {
+        "add_output": (Node, NodeOutput),
+        "after_flow": (Node, Flow),
+        "after_trigger": (Node,),
+        "before_flow": (Node, Flow),
+        "connect_flow": (Node, Flow),
+        "connect_input": (Node, NodeInput, NodeOutput),
+        "failure": (Node, Exception),
+        "flow_failure": (Node, Flow, Exception),
+        "function_start": (Node,),
+        "outputs_set": (Node, float),
+        "set_input_value": (Node, NodeInput, Any),
+        "trigger": (Node,),
+        "trigger_end": (Node, float),
+        "trigger_failure": (Node, Exception),
+        "trigger_input": (Node, NodeInput, Node),
+        "trigger_start": (Node,),
+    }
+
+
+class NodeCallbacks(object):
+    """Class that acts as a storage for all Node's CallbackManagers.
+    A CallbackManager is only created the first time a callback is added to it
+    with add, until then the attribute is an empty stand-in (falsy, like an empty
+    CallbackManager) shared by all the NodeCallbacks
+
+    Callbacks
+    =========
+    add_output:
+        Callback triggered when a NodeOutput is added to the Node using the
+        add_output method
 
-        Parameters
-        ==========
         node: Node
             Reference to the Node you're adding a NodeOutput to
         output: NodeOutput
             Reference to the newly created NodeOutput
-        """
-        self.add_output = CallbackManager("add_output", Node, NodeOutput)
-        """
-        after_flow:
-            Callback triggered when a flow has completed its actions
+    after_flow:
+        Callback triggered when a flow has completed its actions
 
-        Parameters
-        ==========
         node: Node
             Reference to the Node that triggered the flow
         flow: Flow
             Reference to the flow that was being triggered
-        """
-        self.after_flow = CallbackManager("after_flow", Node, Flow)
-        """
-        before_flow:
-            Callback triggered before a flow is executed
+    after_trigger:
+        Callback triggered when the function of a Node succeeded and its result
+        has been set in its NodeOutputs
+
+        node: Node
+            Reference to the triggered Node
+    before_flow:
+        Callback triggered before a flow is executed
 
-        Parameters
-        ==========
         node: Node
             Reference to the Node that will trigger the flow
         output: NodeOutput
             Reference to the flow that will be triggered
-        """
-        self.before_flow = CallbackManager("before_flow", Node, Flow)
-        """
-        connect_flow:
-            Callback triggered when a new flow is connected from a Node to another
+    connect_flow:
+        Callback triggered when a new flow is connected from a Node to another
 
-        Parameters
-        ==========
         node: Node
             Reference to the Node you connect a flow from
         flow: Flow
             Reference to the newly created flow
-        """
-        self.connect_flow = CallbackManager("connect_flow", Node, Flow)
-        """
-        connect_input:
-            Callback triggered when a NodeInput is being connected to a NodeOutput
+    connect_input:
+        Callback triggered when a NodeInput is being connected to a NodeOutput
 
-        Parameters
-        ==========
         node: Node
             Reference to the Node which owns the NodeInput
         input: NodeInput
             Reference to the NodeInput being connected to a NodeOutput
         output: NodeOutput
             Reference to the NodeOutput being connected to a NodeInput
-        """
-        self.connect_input = CallbackManager(
-            "connect_input", Node, NodeInput, NodeOutput
-        )
-        """
-        flow_failure:
-            Callback triggered when triggering a flow raises an Exception
+    flow_failure:
+        Callback triggered when triggering a flow raises an Exception
 
-        Parameters
-        ==========
         node: Node
             Reference to the Node that triggered the flow that raised an Exception
         flow: Flow
             Reference to the flow that raised an Exception
         exception: Exception
             Reference to the Exception
-        """
-        self.flow_failure = CallbackManager("flow_failure", Node, Flow, Exception)
-        """
-        set_input_value:
-            Callback triggered when you set a value to a NodeInput
+    set_input_value:
+        Callback triggered when you set a value to a NodeInput
 
-        Parameters
-        ==========
         node: Node
             Reference to the Node which owns the NodeInput
         input: NodeInput
             Reference to the NodeInput you set a value to
         value: Any
             New value of the NodeInput
-        """
-        self.set_input_value = CallbackManager("set_input_value", Node, NodeInput, Any)
-        """
-        trigger:
-            Callback triggered when a Node is being triggered
+    trigger:
+        Callback triggered when a Node is being triggered
 
-        Parameters
-        ==========
         node: Node
             Reference to the Node being triggered
-        """
-        self.trigger = CallbackManager("trigger", Node)
-        """
-        trigger_input:
-            Callback triggered when a Node triggers another Node through the autotrigger mechanism
+    trigger_failure:
+        Callback triggered when the trigger of a Node fails (its function or
+        the resolution of its inputs)
+
+        node: Node
+            Reference to the Node that failed
+        exception: Exception
+            Reference to the Exception
+    trigger_input:
+        Callback triggered when a Node triggers another Node through the autotrigger mechanism
 
-        Parameters
-        ==========
         node: Node
             Reference to the Node that triggers another Node
         input: NodeInput
             Reference to the NodeInput that requires a value
         autotriggered_node: Node
             Reference to the Node that will be triggered
+    """
+
+    Callbacks = [
+        "add_output",
+        "after_flow",
+        "after_trigger",
+        "before_flow",
+        "connect_flow",
+        "connect_input",
+        "flow_failure",
+        "set_input_value",
+        "trigger",
+        "trigger_failure",
+        "trigger_input",
+    ]
+
+    __slots__ = tuple(Callbacks)
+
+    def __init__(self):
+        for name, empty_callback_manager in _EMPTY_CALLBACK_MANAGERS.items():
+            object.__setattr__(self, name, empty_callback_manager)
+
+    def add(self, name: str, *callbacks: Callable):
+        """Adds callbacks to an event, its CallbackManager is created by the first one
+
+        Parameters
+        ==========
+        name: str
+            Name of the event (see Callbacks)
+        *callbacks: Callable
+            Callables to add to the CallbackManager of the event
         """
-        self.trigger_input = CallbackManager("trigger_input", Node, NodeInput, Node)
+        callback_manager = self._get_created(name)
+        if callback_manager is None:
+            callback_manager = self._create(name)
+        callback_manager.add(*callbacks)
+
+    def remove(self, name: str, callback: Callable):
+        """Removes an existing callback from an event
+
+        Parameters
+        ==========
+        name: str
+            Name of the event (see Callbacks)
+        callback: Callable
+            Callback to remove from the CallbackManager of the event
+        """
+        callback_manager = self._get_created(name)
+        if callback_manager is None:
+            raise KeyError(callback)
+        callback_manager.remove(callback)
+
+    def _get_created(self, name: str) -> CallbackManager:
+        if name not in NodeCallbacks.Callbacks:
+            raise CallbackManagerNotFoundError(name)
+        callback_manager = getattr(self, name)
+        return callback_manager if isinstance(callback_manager, CallbackManager) else None
+
+    def _create(self, name: str) -> CallbackManager:
+        callback_manager = CallbackManager(name, *_get_signatures()[name])
+        object.__setattr__(self, name, callback_manager)
+        return callback_manager
 
     def copy(self) -> "NodeCallbacks":
         """Returns a copy of the NodeCallbacks
-        It will copy every contained CallbackManager
+        It will only copy the CallbackManagers that were created
 
         Returns
         =======
@@ -263,16 +358,22 @@ class NodeCallbacks(object):
         """
         node_callbacks_copy = NodeCallbacks()
         for callback_name in NodeCallbacks.Callbacks:
-            callback_copy = getattr(self, callback_name).copy()
-            setattr(node_callbacks_copy, callback_name, callback_copy)
+            callback_manager = self._get_created(callback_name)
+            if callback_manager is not None:
+                object.__setattr__(node_callbacks_copy, callback_name, callback_manager.copy())
         return node_callbacks_copy
 
     def __setattr__(self, name, value):
-        if name in NodeCallbacks.Callbacks:
-            if name in self.__dict__ and not isinstance(value, CallbackManager):
-                getattr(self, name).remove_all()
-                getattr(self, name).add(value)
-            else:
-                self.__dict__[name] = value
-        else:
+        if name not in NodeCallbacks.Callbacks:
             raise CallbackManagerNotFoundError(name)
+        if isinstance(value, (CallbackManager, _EmptyCallbackManager)):
+            object.__setattr__(self, name, value)
+        else:
+            callback_manager = self._get_created(name)
+            if callback_manager is None:
+                callback_manager = self._create(name)
+            callback_manager.remove_all()
+            callback_manager.add(value)
+
+
+_EMPTY_CALLBACK_MANAGERS = {name: _EmptyCallbackManager(name) for name in NodeCallbacks.Callbacks}
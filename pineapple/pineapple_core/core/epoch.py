@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""This module contains everything that is related to evaluation epochs.
+An evaluation epoch starts with every top-level trigger, all the values computed
+during the epoch are stamped so that an autotrigger Node which is still fresh
+(already executed during the epoch and whose sources did not change since) is not
+executed again.
+Stamps are taken from a single monotonic clock so they can be compared with each other.
+The current epoch is stored in a context variable so concurrent scenarios (asyncio tasks
+or threads) each have their own.
+"""
+
+from contextvars import ContextVar
+from itertools import count
+
+_clock = count(1)
+_current_epoch = ContextVar("pineapple_current_epoch", default=0)
+
+
+def next_stamp() -> int:
+    """Gets a new stamp from the monotonic clock
+
+    Returns
+    =======
+    int:
+        A stamp greater than all the previous ones
+    """
+    return next(_clock)
+
+
+def current_epoch() -> int:
+    """Gets the current evaluation epoch
+
+    Returns
+    =======
+    int:
+        Stamp of the beginning of the current epoch
+    """
+    return _current_epoch.get()
+
+
+def new_epoch() -> int:
+    """Starts a new evaluation epoch, every Node executed before is considered outdated
+
+    Returns
+    =======
+    int:
+        The previous epoch, so it can be restored once the new one is over
+    """
+    previous_epoch = _current_epoch.get()
+    _current_epoch.set(next_stamp())
+    return previous_epoch
+
+
+def restore_epoch(epoch: int):
+    """Restores an epoch returned by new_epoch, it is used when a top-level trigger
+    happens while another one is running (in a callback for example)
+
+    Parameters
+    ==========
+    epoch: int
+        Epoch to restore
+    """
+    _current_epoch.set(epoch)
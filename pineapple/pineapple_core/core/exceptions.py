@@ -161,13 +161,14 @@ class InvalidNodeFunctionReturnTypeError(Exception):
     - A dict
     """
 
-    def __init__(self, node: "Node", node_function: Callable):
+    def __init__(self, node: Union["Node", "NodeModel"], node_function: Callable):
         """InvalidNodeFunctionReturnTypeError constructor
 
         Parameters
         ==========
-        node: Node
-            Reference to the Node that holds the function with the wrong return type
+        node: Union[Node, NodeModel]
+            Reference to the Node (or NodeModel) that holds the function with the wrong
+            return type
         node_function: Callable
             Reference to the function with the wrong return type
         """
@@ -232,3 +233,116 @@ class NoCallbacksError(Exception):
         super().__init__(
             f"CallbackManager '{callback_manager_name}' does not contain any callbacks !"
         )
+
+
+class EmptyCallbackManagerError(Exception):
+    def __init__(self, callback_manager_name):
+        super().__init__(
+            f"CallbackManager '{callback_manager_name}' is not created yet, "
+            f"use node.on.add('{callback_manager_name}', callback) to add a callback"
+        )
+
+
+class AutotriggerCycleError(Exception):
+    """Exception raised when an autotrigger Node depends on its own outputs,
+    directly or through other autotrigger Nodes
+    """
+
+    def __init__(self, node: "Node", cycle: "List[Node]"):
+        """AutotriggerCycleError constructor
+
+        Parameters
+        ==========
+        node: Node
+            Reference to the Node whose autotrigger dependencies contain a cycle
+        cycle: List[Node]
+            Nodes that form the cycle, the first and last Nodes are the same
+        """
+        super().__init__(
+            f"Can't resolve the inputs of {node.full_name()}, autotrigger cycle detected : "
+            + " => ".join(cycle_node.full_name() for cycle_node in cycle)
+        )
+
+
+class InvalidProcessNodeError(Exception):
+    """Exception raised when a Node is supposed to run its function in another process
+    but the function can't be sent to a worker process
+    """
+
+    def __init__(self, node: "Node", reason: str):
+        """InvalidProcessNodeError constructor
+
+        Parameters
+        ==========
+        node: Node
+            Reference to the Node that can't run in another process
+        reason: str
+            Why the function can't be sent to a worker process
+        """
+        super().__init__(f"{node.full_name()} can't run in another process : {reason}")
+
+
+class InvalidBatchInputError(Exception):
+    """Exception raised when a batch execution can't be done with the given inputs
+    """
+
+    def __init__(self, reference: Any, reason: str):
+        """InvalidBatchInputError constructor
+
+        Parameters
+        ==========
+        reference: Any
+            Reference to the invalid batch input (or the Node executed in batch)
+        reason: str
+            Why the batch can't be executed
+        """
+        super().__init__(f"Invalid batch input {reference} : {reason}")
+
+
+class InvalidLoadTestError(Exception):
+    """Exception raised when a load test is configured with invalid parameters
+    """
+
+    def __init__(self, reason: str):
+        """InvalidLoadTestError constructor
+
+        Parameters
+        ==========
+        reason: str
+            Why the load test can't be executed
+        """
+        super().__init__(f"Invalid load test : {reason}")
+
+
+class InvalidTypeCheckPolicyError(Exception):
+    """Exception raised when a TypeCheckPolicy is configured with invalid parameters
+    """
+
+    def __init__(self, reason: str):
+        """InvalidTypeCheckPolicyError constructor
+
+        Parameters
+        ==========
+        reason: str
+            Why the policy can't be used
+        """
+        super().__init__(f"Invalid type check policy : {reason}")
+
+
+class RunningEventLoopError(Exception):
+    """Exception raised when a Node whose function is a coroutine is triggered
+    synchronously from a running event loop
+    """
+
+    def __init__(self, node: "Node"):
+        """RunningEventLoopError constructor
+
+        Parameters
+        ==========
+        node: Node
+            Reference to the Node whose coroutine can't be run
+        """
+        super().__init__(
+            f"{node.full_name()} is asynchronous and can't be run by trigger() while an "
+            "event loop is running in this thread, use 'await node.atrigger()' instead"
+        )
@@ -1,12 +1,16 @@
 # -*- coding: utf-8 -*-
 """This module contains everything that is related to flows.
-This module contains one class : Flow.
+This module contains two classes : Flow and FlowQueue, and the copy_flows function.
 """
 
-from typing import Any, Dict
+import heapq
+from itertools import count
+from typing import Any, Dict, Iterable, List
 
 from pineapple_core.utils.serialization import make_value_serializable
 
+_revisions = count(1)  # next() is atomic, every change of priority gets its own number
+
 
 class Flow:
     """Class that represents a flow
@@ -20,22 +24,14 @@ class Flow:
         It the number is positive, the flow is enabled, otherwise it's disabled
     node: Node
         The next node to execute with this flow
+    parallel: bool
+        Whether the flow can be executed concurrently with the other parallel flows
+        that directly follow or precede it in the order of priority
     """
 
-    @staticmethod
-    def from_reference(flow: "Flow"):
-        """Creates a fake exact copy of a Flow by usurpating its hash
+    __slots__ = ("node", "_priority", "_revision", "name", "parallel", "pretty_name")
 
-        Parameters
-        ==========
-        flow: Flow
-            Reference to the flow you want to create an exact copy of
-        """
-        new_flow = flow.copy()
-        new_flow.inject_reference(flow)
-        return new_flow
-
-    def __init__(self, node: "Node", name: Any, priority: int):
+    def __init__(self, node: "Node", name: Any, priority: int, parallel: bool = False):
         """Flow constructor
 
         Parameters
@@ -46,12 +42,40 @@ class Flow:
             Name of the flow
         priority: int
             Priority of the flow
+        parallel: bool [False]
+            Whether the flow can be executed concurrently with its neighbours
         """
         self.node = node
+        self._revision = [0]
         self.priority = priority
         self.name = name
+        self.parallel = parallel
         self.pretty_name = name
-        self._ref = None
+
+    @property
+    def priority(self) -> int:
+        return self._priority
+
+    @priority.setter
+    def priority(self, priority: int):
+        """Changes of priority are recorded in the revision the Flow shares with
+        the other Flows of its Node, so a FlowQueue knows in constant time when
+        the order of its Flows has to be evaluated again
+        """
+        self._priority = priority
+        self._revision[0] = next(_revisions)
+
+    def share_revision(self, flow: "Flow"):
+        """Makes the Flow record its changes of priority in the revision of another
+        Flow of the same Node (the first one), the Flow counts as changed
+
+        Parameters
+        ==========
+        flow: Flow
+            Reference to the Flow whose revision is shared
+        """
+        self._revision = flow._revision
+        self._revision[0] = next(_revisions)
 
     def toggle(self):
         """Toggle a flow (enables it if it was disabled, disables it otherwise)
@@ -61,13 +85,14 @@ class Flow:
     def disable(self):
         """Disables a flow (make its priority negative)
         """
-        if self.priority > 0:
-            self.toggle()
+        if self._priority > 0:
+            self.priority = -self._priority
 
     def enable(self):
         """Enables a flow (gives an absolute priority to the flow)
         """
-        self.priority = abs(self.priority)
+        if self._priority < 0:
+            self.priority = -self._priority
 
     def increase_priority(self):
         """Increases the priority of the flow with the given name
@@ -79,33 +104,6 @@ class Flow:
         """
         self.priority -= 1
 
-    def inject_reference(self, ref: "Flow"):
-        """Stores a reference of the Flow to usurp
-
-        Parameters
-        ==========
-        ref: Flow
-            Reference to the Flow you want to usurp
-        """
-        self._ref = ref
-
-    def __eq__(self, other) -> bool:
-        return self.__hash__() == other.__hash__()
-
-    def __hash__(self) -> int:
-        """Implement of special method __hash__
-        It allows a Flow to usurpate another one by giving its underlying _ref __hash__
-        with _ref being the Flow you want to usurp
-
-        Returns
-        =======
-        int:
-            Hash of the Flow object
-        """
-        if not self._ref:
-            return super().__hash__()
-        return self._ref.__hash__()
-
     def copy(self) -> "Flow":
         """Copies a Flow, name and priority will be copied while
         the Node inside the flow will be the same reference
@@ -115,7 +113,7 @@ class Flow:
         Flow:
             Reference to the newly copied Flow
         """
-        flow_copy = Flow(self.node, self.name, self.priority)
+        flow_copy = Flow(self.node, self.name, self.priority, self.parallel)
         flow_copy.pretty_name = self.pretty_name
         return flow_copy
 
@@ -135,3 +133,96 @@ class Flow:
 
     def __repr__(self):
         return f"Flow(name='{self.name}', priority={self.priority}, node={self.node})"
+
+
+class FlowQueue:
+    """Class that yields the enabled Flows of a Node that were not executed yet,
+    by order of priority (Flows with the same priority keep their order of connection).
+    The Flows are kept in a heap that is only rebuilt when the priority of one of its
+    Flows changed (or a Flow was connected) since it was built, so Flows enabled,
+    disabled or reordered by a previous Flow are taken into account.
+    The Flows of a Node share their revision (see Flow.share_revision), so checking
+    whether the heap is outdated does not depend on the amount of Flows.
+
+    Attributes
+    ==========
+    flows: List[Flow]
+        Flows of the Node
+    executed: Set[Flow]
+        Flows that were already yielded
+    """
+
+    __slots__ = ("flows", "executed", "_heap", "_revision")
+
+    def __init__(self, flows: List[Flow], executed: Iterable[Flow] = ()):
+        """FlowQueue constructor
+
+        Parameters
+        ==========
+        flows: List[Flow]
+            Flows of the Node
+        executed: Iterable[Flow] [()]
+            Flows that were already executed and should not be yielded
+        """
+        self.flows = flows
+        self.executed = set(executed)
+        self._heap = []
+        self._revision = None
+
+    def peek(self) -> Flow:
+        """Gets the next Flow without marking it as executed
+
+        Returns
+        =======
+        Flow:
+            Reference to the enabled Flow with the highest priority, None if there is none
+        """
+        revision = (len(self.flows), self.flows[0]._revision[0]) if self.flows else None
+        if self._revision != revision:
+            self._revision = revision
+            self._heap = [
+                (-flow._priority, index, flow)
+                for index, flow in enumerate(self.flows)
+                if flow._priority > 0 and flow not in self.executed
+            ]
+            heapq.heapify(self._heap)
+        return self._heap[0][2] if self._heap else None
+
+    def pop(self) -> Flow:
+        """Gets the next Flow and marks it as executed
+
+        Returns
+        =======
+        Flow:
+            Reference to the enabled Flow with the highest priority, None if there is none
+        """
+        flow = self.peek()
+        if flow is not None:
+            heapq.heappop(self._heap)
+            self.executed.add(flow)
+        return flow
+
+    def reset(self):
+        """Forgets the executed Flows so they can all be yielded again
+        """
+        self.executed.clear()
+        self._revision = None
+
+
+def copy_flows(flows: List[Flow]) -> List[Flow]:
+    """Copies the Flows of a Node, the copies share their revision
+
+    Parameters
+    ==========
+    flows: List[Flow]
+        Flows of the Node
+
+    Returns
+    =======
+    List[Flow]:
+        The copies of the Flows
+    """
+    flows_copy = [flow.copy() for flow in flows]
+    for flow in flows_copy[1:]:
+        flow.share_revision(flows_copy[0])
+    return flows_copy
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""This module contains everything that is related to execution hooks.
+A HookRegistry observes every Node of the process (global_hooks) or of a scenario
+(see attach_hooks) without registering callbacks on each Node, to attach a profiler
+to a whole graph for example.
+When no hook is subscribed in any registry, the only cost for the Nodes is
+the check of the enabled flag of this module.
+
+Events
+======
+trigger_start:
+    Called when a Node is triggered, before its inputs are resolved
+
+    node: Node
+        Reference to the Node being triggered
+function_start:
+    Called when the inputs of a Node are resolved, before its function is called
+
+    node: Node
+        Reference to the triggered Node
+outputs_set:
+    Called when the result of the function of a Node has been set in its NodeOutputs
+
+    node: Node
+        Reference to the Node
+    duration: float
+        Duration of the setting of the NodeOutputs (type checks included), in seconds
+trigger_end:
+    Called when the function of a Node succeeded
+
+    node: Node
+        Reference to the triggered Node
+    duration: float
+        Duration of the function of the Node, in seconds
+failure:
+    Called when the trigger of a Node fails (its function or the resolution of its inputs)
+
+    node: Node
+        Reference to the Node that failed
+    exception: Exception
+        Reference to the Exception
+before_flow:
+    Called before a flow is executed
+
+    node: Node
+        Reference to the Node that will trigger the flow
+    flow: Flow
+        Reference to the flow that will be triggered
+after_flow:
+    Called when a flow has completed its actions
+
+    node: Node
+        Reference to the Node that triggered the flow
+    flow: Flow
+        Reference to the flow that was triggered
+"""
+
+from threading import Lock
+from typing import Any, Callable
+
+from pineapple_core.core.callbacks import CallbackManager, _get_signatures
+from pineapple_core.core.exceptions import CallbackManagerNotFoundError
+
+enabled = False  # Whether at least one hook is subscribed, in any registry
+_subscriptions = 0
+_subscriptions_lock = Lock()
+
+
+def _count_subscriptions(amount: int):
+    global enabled, _subscriptions
+    with _subscriptions_lock:
+        _subscriptions += amount
+        enabled = _subscriptions > 0
+
+
+class HookRegistry:
+    """Class that holds the hooks of every event (see the documentation of the module)
+
+    Attributes
+    ==========
+    managers: Dict[str, CallbackManager]
+        CallbackManager of each event, created when a hook is first subscribed to it.
+        Hooks have to be added with subscribe and removed with unsubscribe
+    """
+
+    Events = [
+        "after_flow",
+        "before_flow",
+        "failure",
+        "function_start",
+        "outputs_set",
+        "trigger_end",
+        "trigger_start",
+    ]
+
+    __slots__ = ("managers", "__weakref__")
+
+    def __init__(self):
+        """HookRegistry constructor
+        """
+        self.managers = {}
+
+    def subscribe(self, event: str, hook: Callable) -> Callable:
+        """Subscribes a hook to an event
+
+        Parameters
+        ==========
+        event: str
+            Name of the event, one of HookRegistry.Events
+        hook: Callable
+            Function called with the arguments of the event
+
+        Returns
+        =======
+        Callable:
+            The hook, so the method can be used as a decorator
+        """
+        if event not in HookRegistry.Events:
+            raise CallbackManagerNotFoundError(event)
+        manager = self.managers.get(event)
+        if manager is None:
+            manager = CallbackManager(event, *_get_signatures()[event])
+            self.managers[event] = manager
+        if hook not in manager.callbacks:
+            manager.add(hook)
+            _count_subscriptions(1)
+        return hook
+
+    def unsubscribe(self, event: str, hook: Callable):
+        """Unsubscribes a hook from an event
+
+        Parameters
+        ==========
+        event: str
+            Name of the event the hook was subscribed to
+        hook: Callable
+            The subscribed hook
+        """
+        manager = self.managers.get(event)
+        if manager is None:
+            raise KeyError(hook)
+        manager.remove(hook)
+        _count_subscriptions(-1)
+
+    def clear(self):
+        """Unsubscribes all the hooks of the registry
+        """
+        _count_subscriptions(-sum(len(manager.callbacks) for manager in self.managers.values()))
+        self.managers = {}
+
+    def emit(self, event: str, *args: Any):
+        """Calls all the hooks subscribed to an event
+
+        Parameters
+        ==========
+        event: str
+            Name of the event
+        *args: Any
+            Arguments of the event
+        """
+        manager = self.managers.get(event)
+        if manager:
+            manager(*args)
+
+    def __repr__(self) -> str:
+        hooks = {event: len(manager.callbacks) for event, manager in self.managers.items()}
+        return f"HookRegistry({hooks})"
+
+
+global_hooks = HookRegistry()
+
+
+def emit(node: "Node", event: str, *args: Any):
+    """Calls the hooks of the global registry then the ones of the registry of the
+    scenario of the Node, it should only be called when enabled is True
+
+    Parameters
+    ==========
+    node: Node
+        Reference to the Node the event is about
+    event: str
+        Name of the event
+    *args: Any
+        Other arguments of the event
+    """
+    global_hooks.emit(event, node, *args)
+    if node.hook_registry is not None:
+        node.hook_registry.emit(event, node, *args)
+
+
+def attach_hooks(registry: HookRegistry, start_node: "Node"):
+    """Makes all the Nodes of a scenario (see get_whole_scenario) use a registry
+
+    Parameters
+    ==========
+    registry: HookRegistry
+        The registry of the scenario, None to detach the current one
+    start_node: Node
+        Starting Node of the scenario
+    """
+    from pineapple_core.core.node import get_whole_scenario
+
+    for node in get_whole_scenario(start_node):
+        node.hook_registry = registry
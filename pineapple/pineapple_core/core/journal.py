@@ -0,0 +1,475 @@
+# -*- coding: utf-8 -*-
+"""This module contains everything that is related to execution journals.
+An ExecutionJournal adds callbacks (see NodeCallbacks) to the Nodes of a scenario
+and records every step of the execution as an entry :
+    - trigger: a Node is triggered
+    - autotrigger: a Node triggers an autotrigger Node ("source") to get the value
+      of one of its inputs ("input")
+    - result: the function of a Node succeeded, with the hashes of the values of its
+      inputs ("inputs") and the values set in its NodeOutputs ("outputs")
+    - flow: a Node executes one of its Flows ("target" is the Node of the Flow)
+    - flow_end: a Flow is done
+    - failure: the trigger of a Node failed ("exception")
+Entries are written as NDJSON (one JSON object by line) by a background thread
+so the Nodes never wait for the disk. Without file, the last entries are kept in a
+bounded ring buffer instead, to inspect them after a failure.
+The hashes of the inputs (variadic ones included) and the values of the NodeOutputs
+are computed on the thread of the Node when it succeeds, so values modified in place
+later on are journaled as they were (values that can't be converted to JSON are written
+with their repr), only the writing is left to the background thread.
+A JournalReplay steps through the entries of a journal and the recorded values
+without executing the functions of the Nodes, the pineapple_replay command prints them.
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+from itertools import count
+from queue import SimpleQueue
+from typing import Any, Dict, Iterator, List, Tuple
+
+from klotan.match import OptionalKey
+
+JOURNAL_VERSION = 1
+
+
+def hash_value(value: Any) -> str:
+    """Hashes a value using its JSON representation
+
+    Parameters
+    ==========
+    value: Any
+        Value to hash
+
+    Returns
+    =======
+    str:
+        Hexadecimal digest of 16 characters
+    """
+    return hashlib.blake2b(_dumps(value).encode(), digest_size=8).hexdigest()
+
+
+def _dumps(value: Any) -> str:
+    try:
+        return json.dumps(value, sort_keys=True, default=_safe_repr)
+    except Exception:
+        return json.dumps(_safe_repr(value))
+
+
+def _safe_repr(value: Any) -> str:
+    try:
+        return repr(value)
+    except Exception:
+        return f"<{type(value).__name__} without repr>"
+
+
+def _output_name(key: Any) -> str:
+    return str(key.key if isinstance(key, OptionalKey) else key)
+
+
+class ExecutionJournal:
+    """Class that records the execution of the scenarios it is attached to,
+    see the documentation of the module
+
+    Attributes
+    ==========
+    path: str
+        File the entries are appended to, None to keep them in the ring buffer
+    ring: deque
+        Last recorded entries when there is no file (None otherwise)
+    nodes: List[Node]
+        Nodes the journal is attached to
+    start_time: float
+        perf_counter when the journal was created, the time of the entries is
+        relative to it
+    """
+
+    __slots__ = (
+        "path",
+        "ring",
+        "nodes",
+        "start_time",
+        "_names",
+        "_sequence",
+        "_queue",
+        "_writer",
+        "_callbacks",
+    )
+
+    def __init__(self, path: str = None, ring_size: int = 10000):
+        """ExecutionJournal constructor
+
+        Parameters
+        ==========
+        path: str [None]
+            File the entries are appended to, None to keep them in memory
+        ring_size: int [10000]
+            Amount of entries kept in memory when there is no file
+        """
+        self.path = path
+        self.ring = deque(maxlen=ring_size) if path is None else None
+        self.nodes = []
+        self.start_time = time.perf_counter()
+        self._names = {}
+        self._sequence = count()
+        self._queue = None
+        self._writer = None
+        self._callbacks = {
+            "after_flow": self._on_after_flow,
+            "after_trigger": self._on_after_trigger,
+            "before_flow": self._on_before_flow,
+            "trigger": self._on_trigger,
+            "trigger_failure": self._on_trigger_failure,
+            "trigger_input": self._on_trigger_input,
+        }
+
+    def attach(self, start_node: "Node") -> "ExecutionJournal":
+        """Adds the callbacks of the journal to all the Nodes of a scenario
+        (see get_whole_scenario) and starts the writer thread
+
+        Parameters
+        ==========
+        start_node: Node
+            Starting Node of the scenario
+
+        Returns
+        =======
+        ExecutionJournal:
+            The journal itself
+        """
+        from pineapple_core.core.node import get_whole_scenario
+
+        if self.path is not None and self._writer is None:
+            self._queue = SimpleQueue()
+            self._writer = threading.Thread(
+                target=self._write, name="pineapple-journal", daemon=True
+            )
+            self._writer.start()
+        for node in get_whole_scenario(start_node):
+            if node in self._names:
+                continue
+            self._names[node] = node.full_name()
+            self.nodes.append(node)
+            for name, callback in self._callbacks.items():
+                node.on.add(name, callback)
+        return self
+
+    def detach(self):
+        """Removes the callbacks of the journal from all the Nodes it is attached to
+        """
+        for node in self.nodes:
+            for name, callback in self._callbacks.items():
+                node.on.remove(name, callback)
+        self.nodes = []
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Waits until all the entries recorded so far are written
+
+        Parameters
+        ==========
+        timeout: float [5.0]
+            Maximum amount of seconds to wait for the writer thread
+
+        Returns
+        =======
+        bool:
+            True if the entries were written, False if the writer thread is not running
+            or did not write them in time
+        """
+        if self._writer is None or not self._writer.is_alive():
+            return False
+        written = threading.Event()
+        self._queue.put(written)
+        return written.wait(timeout)
+
+    def close(self, timeout: float = 5.0):
+        """Detaches the journal, writes the remaining entries and stops the writer thread
+
+        Parameters
+        ==========
+        timeout: float [5.0]
+            Maximum amount of seconds to wait for the writer thread
+        """
+        self.detach()
+        if self._writer is not None:
+            if self._writer.is_alive():
+                self._queue.put(None)
+                self._writer.join(timeout)
+            self._writer = None
+
+    def __enter__(self) -> "ExecutionJournal":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Serialises the entries of the ring buffer
+
+        Returns
+        =======
+        List[Dict[str, Any]]:
+            The last recorded entries (empty when the entries are written to a file)
+        """
+        if self.ring is None:
+            return []
+        return [json.loads(self._safe_serialise(record)) for record in list(self.ring)]
+
+    def replay(self) -> "JournalReplay":
+        """Loads the entries of the journal, from its file (once written, see flush)
+        or from the ring buffer
+
+        Returns
+        =======
+        JournalReplay:
+            Replay of the recorded entries
+        """
+        if self.path is not None:
+            return load_journal(self.path)
+        return JournalReplay(self.entries())
+
+    def _record(self, kind: str, node: "Node", data: Any = None):
+        record = (next(self._sequence), time.perf_counter() - self.start_time, kind, node, data)
+        if self._queue is not None:
+            self._queue.put(record)
+        else:
+            self.ring.append(record)
+
+    def _name(self, node: "Node") -> str:
+        name = self._names.get(node)
+        return name if name is not None else node.full_name()
+
+    def _serialise(self, record: Tuple[Any, ...]) -> str:
+        sequence, at, kind, node, data = record
+        entry = {"seq": sequence, "t": at, "kind": kind, "node": self._name(node)}
+        if kind == "result":
+            entry["inputs"], outputs = data
+            line = json.dumps(entry, default=_safe_repr)
+            return f'{line[:-1]}, "outputs": {outputs}}}'
+        if kind == "autotrigger":
+            entry["input"], entry["source"] = data[0], self._name(data[1])
+        elif kind in ("flow", "flow_end"):
+            entry["target"] = self._name(data[0])
+        elif kind == "failure":
+            entry["exception"] = _safe_repr(data)
+        return json.dumps(entry, default=_safe_repr)
+
+    def _safe_serialise(self, record: Tuple[Any, ...]) -> str:
+        try:
+            return self._serialise(record)
+        except Exception as exception:
+            sequence, at, kind, node, _ = record
+            return json.dumps(
+                {
+                    "seq": sequence,
+                    "t": at,
+                    "kind": kind,
+                    "node": self._names.get(node),
+                    "error": f"entry could not be serialised: {_safe_repr(exception)}",
+                }
+            )
+
+    def _write(self):
+        with open(self.path, "a") as journal_file:
+            header = {"kind": "journal", "version": JOURNAL_VERSION, "time": time.time()}
+            journal_file.write(json.dumps(header) + "\n")
+            while True:
+                record = self._queue.get()
+                if record is None:
+                    break
+                try:
+                    if isinstance(record, threading.Event):
+                        journal_file.flush()
+                    else:
+                        journal_file.write(self._safe_serialise(record) + "\n")
+                except Exception:  # An entry that can't be written must not stop the writer
+                    pass
+                finally:
+                    if isinstance(record, threading.Event):
+                        record.set()
+
+    def _on_trigger(self, node: "Node"):
+        self._record("trigger", node)
+
+    def _on_trigger_input(self, node: "Node", node_input: "NodeInput", source: "Node"):
+        self._record("autotrigger", node, (node_input.name, source))
+
+    def _on_after_trigger(self, node: "Node"):
+        inputs = {
+            node_input.name: hash_value(node_input.get())
+            for node_input in (
+                *node.inputs.values(),
+                *node.args_inputs,
+                *node.kwargs_inputs.values(),
+            )
+        }
+        outputs = _dumps({_output_name(key): output.value for key, output in node.outputs.items()})
+        self._record("result", node, (inputs, outputs))
+
+    def _on_before_flow(self, node: "Node", flow: "Flow"):
+        self._record("flow", node, (flow.node,))
+
+    def _on_after_flow(self, node: "Node", flow: "Flow"):
+        self._record("flow_end", node, (flow.node,))
+
+    def _on_trigger_failure(self, node: "Node", exception: Exception):
+        self._record("failure", node, exception)
+
+    def __repr__(self) -> str:
+        return f"ExecutionJournal(path={self.path}, nodes={len(self.nodes)})"
+
+
+class JournalReplay:
+    """Class that steps through the entries of a journal, keeping the values
+    of the NodeOutputs as they were after the last entry stepped through
+
+    Attributes
+    ==========
+    entries: List[Dict[str, Any]]
+        Entries of the journal, in the order they were recorded
+    position: int
+        Index of the next entry
+    outputs: Dict[str, Dict[str, Any]]
+        Values of the NodeOutputs by full name of Node and name of NodeOutput
+    """
+
+    def __init__(self, entries: List[Dict[str, Any]]):
+        """JournalReplay constructor
+
+        Parameters
+        ==========
+        entries: List[Dict[str, Any]]
+            Entries of the journal (the header entries are ignored)
+        """
+        self.entries = sorted(
+            (entry for entry in entries if entry.get("kind") != "journal"),
+            key=lambda entry: entry["seq"],
+        )
+        self.position = 0
+        self.outputs = {}
+
+    def step(self) -> Dict[str, Any]:
+        """Moves to the next entry
+
+        Returns
+        =======
+        Dict[str, Any]:
+            The entry, None if the end of the journal is reached
+        """
+        if self.position >= len(self.entries):
+            return None
+        entry = self.entries[self.position]
+        self.position += 1
+        if entry["kind"] == "result":
+            self.outputs.setdefault(entry["node"], {}).update(entry["outputs"])
+        return entry
+
+    def seek(self, position: int):
+        """Moves to an entry, the values of the NodeOutputs are the ones recorded
+        before it
+
+        Parameters
+        ==========
+        position: int
+            Index of the entry
+        """
+        self.position = 0
+        self.outputs = {}
+        while self.position < position and self.step() is not None:
+            pass
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        entry = self.step()
+        while entry is not None:
+            yield entry
+            entry = self.step()
+
+    def find(self, kind: str = None, node: str = None) -> List[Dict[str, Any]]:
+        """Lists the entries of a kind and / or of a Node
+
+        Parameters
+        ==========
+        kind: str [None]
+            Kind of the entries, any kind if None
+        node: str [None]
+            Full name of the Node, any Node if None
+
+        Returns
+        =======
+        List[Dict[str, Any]]:
+            The matching entries
+        """
+        return [
+            entry
+            for entry in self.entries
+            if (kind is None or entry["kind"] == kind) and (node is None or entry["node"] == node)
+        ]
+
+    def apply(self, start_node: "Node"):
+        """Sets the current values in the NodeOutputs of a scenario, the Nodes are
+        matched by full name and the values are set without type checks
+
+        Parameters
+        ==========
+        start_node: Node
+            Starting Node of the scenario
+        """
+        from pineapple_core.core.node import get_whole_scenario
+
+        for node in get_whole_scenario(start_node):
+            values = self.outputs.get(node.full_name(), {})
+            for key, output in node.outputs.items():
+                if _output_name(key) in values:
+                    output.value = values[_output_name(key)]
+
+    def __repr__(self) -> str:
+        return f"JournalReplay(position={self.position}, entries={len(self.entries)})"
+
+
+def load_journal(path: str) -> JournalReplay:
+    """Loads a journal file written by an ExecutionJournal
+
+    Parameters
+    ==========
+    path: str
+        Path of the NDJSON file
+
+    Returns
+    =======
+    JournalReplay:
+        Replay of the entries of the file
+    """
+    with open(path) as journal_file:
+        return JournalReplay([json.loads(line) for line in journal_file if line.strip()])
+
+
+def main(args: List[str] = None):
+    """Entry point of the pineapple_replay command, prints the entries of a journal
+    one by one as JSON
+
+    Parameters
+    ==========
+    args: List[str] [None]
+        Command line arguments (sys.argv is used if None)
+    """
+    parser = argparse.ArgumentParser(
+        prog="pineapple_replay", description="Steps through an execution journal"
+    )
+    parser.add_argument("journal", help="path of the journal file")
+    parser.add_argument("-k", "--kind", help="only prints the entries of this kind")
+    parser.add_argument("-n", "--node", help="only prints the entries of this Node (full name)")
+    parser.add_argument(
+        "-i", "--interactive", action="store_true", help="waits for Enter between entries"
+    )
+    parsed_args = parser.parse_args(args)
+    for entry in load_journal(parsed_args.journal):
+        if parsed_args.kind is not None and entry["kind"] != parsed_args.kind:
+            continue
+        if parsed_args.node is not None and entry["node"] != parsed_args.node:
+            continue
+        print(json.dumps(entry))
+        if parsed_args.interactive:
+            input()
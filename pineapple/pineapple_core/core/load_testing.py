@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+"""This module contains everything that is related to load testing.
+A load test triggers the same scenario many times concurrently (on threads,
+asyncio tasks or processes) and reports the throughput, the errors and the latencies
+of the scenario and of each of its Nodes (estimated from the histograms of their
+trigger_log, see pineapple_core.core.metrics).
+It can be used from Python with run_load_test or from the command line
+with the pineapple_load command.
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import math
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Sequence, Union
+
+from pineapple_core.core.exceptions import InvalidLoadTestError
+from pineapple_core.core.metrics import merge_trigger_log, new_trigger_log
+from pineapple_core.core.runs import RunContext
+
+MODES = ("threads", "asyncio", "processes")
+
+
+class WorkerStats:
+    """Class that holds the measures of a single load test worker,
+    it only contains picklable values so it can be sent back by a worker process
+
+    Attributes
+    ==========
+    errors: Counter
+        Amount of failed iterations by name of Exception
+    latencies: List[float]
+        Duration of each iteration of the scenario, in seconds
+    trigger_logs: List[Dict[str, Any]]
+        trigger_log of each Node during the run of the worker, its histograms hold
+        the duration of every trigger. Nodes are indexed in the order of get_whole_scenario
+    """
+
+    def __init__(self):
+        """WorkerStats constructor
+        """
+        self.errors = Counter()
+        self.latencies = []
+        self.trigger_logs = []
+
+
+class LoadTestReport:
+    """Class that represents the results of a load test
+
+    Attributes
+    ==========
+    mode: str
+        How the copies of the scenario were executed (threads, asyncio or processes)
+    concurrency: int
+        Amount of copies of the scenario executed concurrently
+    iterations: int
+        Total amount of times the scenario was triggered
+    duration: float
+        Wall time of the whole load test, in seconds
+    errors: Counter
+        Amount of failed iterations by name of Exception
+    latencies: List[float]
+        Duration of each iteration of the scenario, in seconds
+    trigger_logs: Dict[str, Dict[str, Any]]
+        trigger_log of each Node merged from all the workers, by full name of Node
+    """
+
+    def __init__(
+        self, mode: str, concurrency: int, iterations: int, node_names: List[str]
+    ):
+        """LoadTestReport constructor
+
+        Parameters
+        ==========
+        mode: str
+            How the copies of the scenario are executed
+        concurrency: int
+            Amount of copies of the scenario executed concurrently
+        iterations: int
+            Total amount of times the scenario is triggered
+        node_names: List[str]
+            Full names of the Nodes of the scenario, in the order of get_whole_scenario
+        """
+        self.mode = mode
+        self.concurrency = concurrency
+        self.iterations = iterations
+        self.duration = 0.0
+        self.errors = Counter()
+        self.latencies = []
+        self.trigger_logs = {node_name: new_trigger_log() for node_name in node_names}
+
+    def add(self, stats: WorkerStats):
+        """Merges the measures of a worker into the report
+
+        Parameters
+        ==========
+        stats: WorkerStats
+            Measures of a worker
+        """
+        self.errors.update(stats.errors)
+        self.latencies += stats.latencies
+        for total, trigger_log in zip(self.trigger_logs.values(), stats.trigger_logs):
+            merge_trigger_log(total, trigger_log)
+
+    @property
+    def throughput(self) -> float:
+        """Amount of iterations per second"""
+        return self.iterations / self.duration if self.duration else 0.0
+
+    @property
+    def error_count(self) -> int:
+        """Amount of failed iterations"""
+        return sum(self.errors.values())
+
+    def dump(self, percentiles: Sequence[float] = (50, 90, 99)) -> Dict[str, Any]:
+        """Dumps the report, the percentiles of the Nodes are estimated from
+        the durations of all their triggers (self_time histograms of their trigger_log)
+
+        Parameters
+        ==========
+        percentiles: Sequence[float] [(50, 90, 99)]
+            Percentiles of the latencies to compute
+
+        Returns
+        =======
+        dict:
+            A dictionnary representing the report (trivially convertable to JSON)
+        """
+        return {
+            "mode": self.mode,
+            "concurrency": self.concurrency,
+            "iterations": self.iterations,
+            "duration": self.duration,
+            "throughput": self.throughput,
+            "errors": dict(self.errors),
+            "latency": get_percentiles(self.latencies, percentiles),
+            "nodes": {
+                node_name: {
+                    "count": trigger_log["success"],
+                    **{
+                        f"p{percentile:g}": trigger_log["self_time"].percentile(percentile)
+                        for percentile in percentiles
+                    },
+                }
+                for node_name, trigger_log in self.trigger_logs.items()
+                if trigger_log["success"]
+            },
+        }
+
+
+def get_percentiles(
+    values: List[float], percentiles: Sequence[float]
+) -> Dict[str, float]:
+    """Computes percentiles using the nearest-rank method
+
+    Parameters
+    ==========
+    values: List[float]
+        Values to compute the percentiles of
+    percentiles: Sequence[float]
+        Percentiles to compute (between 0 and 100)
+
+    Returns
+    =======
+    Dict[str, float]:
+        Value of each percentile with keys like "p50", None if there are no values
+    """
+    sorted_values = sorted(values)
+    result = {}
+    for percentile in percentiles:
+        key = f"p{percentile:g}"
+        if not sorted_values:
+            result[key] = None
+            continue
+        rank = max(math.ceil(percentile / 100 * len(sorted_values)), 1)
+        result[key] = sorted_values[rank - 1]
+    return result
+
+
+def load_scenario(path: str) -> "Node":
+    """Loads a scenario from its import path
+
+    Parameters
+    ==========
+    path: str
+        Path of the scenario like "package.module:name", name being either a Node
+        or a function without parameters that builds the scenario and returns
+        its starting Node
+
+    Returns
+    =======
+    Node:
+        Reference to the starting Node of the scenario
+    """
+    from pineapple_core.core.node import Node
+
+    module_name, _, name = path.partition(":")
+    if not name:
+        raise InvalidLoadTestError(f"scenario path should be 'module:name', got '{path}'")
+    scenario = getattr(importlib.import_module(module_name), name)
+    return scenario if isinstance(scenario, Node) else scenario()
+
+
+def run_load_test(
+    scenario: Union["Node", str],
+    concurrency: int = 1,
+    iterations: int = 1,
+    mode: str = "threads",
+) -> LoadTestReport:
+    """Triggers a scenario concurrently and measures it.
+    The scenario is used as a ScenarioTemplate, the Nodes are not copied : each worker
+    has its own RunContext and triggers the scenario iterations / concurrency times
+    within it, one iteration after another.
+
+    Parameters
+    ==========
+    scenario: Union[Node, str]
+        Starting Node of the scenario or its import path (see load_scenario),
+        the import path is required by the processes mode since Nodes can't be pickled
+    concurrency: int [1]
+        Amount of copies of the scenario executed concurrently
+    iterations: int [1]
+        Total amount of times the scenario is triggered
+    mode: str ["threads"]
+        How the copies are executed : "threads", "asyncio" (using Node.atrigger)
+        or "processes"
+
+    Returns
+    =======
+    LoadTestReport:
+        Throughput, errors and latencies of the scenario
+
+    Raises
+    ======
+    InvalidLoadTestError:
+        If the parameters of the load test are not valid
+    """
+    from pineapple_core.core.node import get_whole_scenario
+
+    if mode not in MODES:
+        raise InvalidLoadTestError(f"mode should be one of {MODES}, got '{mode}'")
+    if concurrency < 1 or iterations < 0:
+        raise InvalidLoadTestError("concurrency should be positive and iterations not negative")
+    if mode == "processes" and not isinstance(scenario, str):
+        raise InvalidLoadTestError("the processes mode requires the import path of the scenario")
+    start_node = load_scenario(scenario) if isinstance(scenario, str) else scenario
+    report = LoadTestReport(
+        mode,
+        concurrency,
+        iterations,
+        [node.full_name() for node in get_whole_scenario(start_node)],
+    )
+    shares = [
+        iterations // concurrency + (1 if worker < iterations % concurrency else 0)
+        for worker in range(concurrency)
+    ]
+    start = time.perf_counter()
+    if mode == "asyncio":
+        worker_stats = asyncio.run(_run_async_workers(start_node, shares))
+    else:
+        if mode == "threads":
+            pool, worker_scenario = ThreadPoolExecutor(concurrency), start_node
+        else:
+            pool, worker_scenario = ProcessPoolExecutor(concurrency), scenario
+        with pool:
+            futures = [pool.submit(_run_worker, worker_scenario, share) for share in shares]
+            worker_stats = [future.result() for future in futures]
+    report.duration = time.perf_counter() - start
+    for stats in worker_stats:
+        report.add(stats)
+    return report
+
+
+def _prepare_worker(scenario: Union["Node", str]):
+    from pineapple_core.core.node import get_whole_scenario
+
+    start_node = load_scenario(scenario) if isinstance(scenario, str) else scenario
+    return start_node, get_whole_scenario(start_node), WorkerStats(), RunContext()
+
+
+def _reset_trigger_logs(nodes: List["Node"]):
+    for node in nodes:
+        node.trigger_log = new_trigger_log()
+
+
+def _collect_trigger_logs(stats: WorkerStats, nodes: List["Node"]):
+    stats.trigger_logs = [node.trigger_log for node in nodes]
+
+
+def _run_worker(scenario: Union["Node", str], iterations: int) -> WorkerStats:
+    start_node, nodes, stats, run = _prepare_worker(scenario)
+    with run.activate():
+        _reset_trigger_logs(nodes)
+        for _ in range(iterations):
+            start = time.perf_counter()
+            try:
+                start_node.trigger()
+            except Exception as exception:
+                stats.errors[type(exception).__name__] += 1
+            stats.latencies.append(time.perf_counter() - start)
+        _collect_trigger_logs(stats, nodes)
+    return stats
+
+
+async def _run_async_worker(scenario: "Node", iterations: int) -> WorkerStats:
+    start_node, nodes, stats, run = _prepare_worker(scenario)
+    with run.activate():
+        _reset_trigger_logs(nodes)
+        for _ in range(iterations):
+            start = time.perf_counter()
+            try:
+                await start_node.atrigger()
+            except Exception as exception:
+                stats.errors[type(exception).__name__] += 1
+            stats.latencies.append(time.perf_counter() - start)
+        _collect_trigger_logs(stats, nodes)
+    return stats
+
+
+async def _run_async_workers(scenario: "Node", shares: List[int]) -> List[WorkerStats]:
+    return await asyncio.gather(*[_run_async_worker(scenario, share) for share in shares])
+
+
+def main(args: List[str] = None):
+    """Entry point of the pineapple_load command, prints the report as JSON
+
+    Parameters
+    ==========
+    args: List[str] [None]
+        Command line arguments (sys.argv is used if None)
+    """
+    parser = argparse.ArgumentParser(
+        prog="pineapple_load", description="Runs many copies of a scenario concurrently"
+    )
+    parser.add_argument("scenario", help="import path of the scenario, like package.module:name")
+    parser.add_argument("-c", "--concurrency", type=int, default=1)
+    parser.add_argument("-n", "--iterations", type=int, default=1)
+    parser.add_argument("-m", "--mode", choices=MODES, default="threads")
+    parsed_args = parser.parse_args(args)
+    report = run_load_test(
+        parsed_args.scenario, parsed_args.concurrency, parsed_args.iterations, parsed_args.mode
+    )
+    print(json.dumps(report.dump(), indent=4))
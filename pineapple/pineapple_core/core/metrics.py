@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""This module contains everything that is related to the metrics of the Nodes.
+Every successful trigger of a Node records its durations in the trigger_log
+of the Node, each one in a LatencyHistogram (added to the trigger_log the first time
+the Node succeeds) :
+    - wall_time: whole trigger of the Node (inputs resolution and function)
+    - wait_time: time spent waiting for the backtriggered (autotrigger) inputs
+    - self_time: time spent in the function of the Node
+    - cpu_time: CPU time of the thread during the function of the Node, reading the CPU
+      clock is a system call so it is only measured on one trigger in CPU_SAMPLE_RATE
+Histograms have fixed buckets so recording a value is cheap enough to stay enabled,
+percentiles are estimated from the buckets.
+"""
+
+from bisect import bisect_left
+from math import ceil
+from typing import Any, Dict, Iterable, Sequence
+
+# Upper bounds of the buckets in seconds, from 1 microsecond to ~18 minutes,
+# each bucket is ~19% wider than the previous one
+BOUNDS = tuple(1e-6 * 2 ** (index / 4) for index in range(121))
+HISTOGRAMS = ("wall_time", "wait_time", "self_time", "cpu_time")
+CPU_SAMPLE_RATE = 8
+
+
+class LatencyHistogram:
+    """Class that represents the distribution of durations with fixed buckets
+
+    Attributes
+    ==========
+    count: int
+        Amount of recorded values
+    total: float
+        Sum of the recorded values, in seconds
+    maximum: float
+        Greatest recorded value, in seconds
+    buckets: Dict[int, int]
+        Amount of values by index of bucket (see BOUNDS, the index len(BOUNDS) holds
+        the values above the last bound), only non-empty buckets are stored
+    """
+
+    __slots__ = ("count", "total", "maximum", "buckets")
+
+    def __init__(self):
+        """LatencyHistogram constructor
+        """
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.buckets = {}
+
+    def record(self, value: float):
+        """Records a duration
+
+        Parameters
+        ==========
+        value: float
+            Duration in seconds
+        """
+        index = bisect_left(BOUNDS, value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.maximum:
+            self.maximum = value
+
+    def percentile(self, percentile: float) -> float:
+        """Estimates a percentile using the nearest-rank method, the value returned is
+        the upper bound of the bucket of the value (at most maximum)
+
+        Parameters
+        ==========
+        percentile: float
+            Percentile to estimate (between 0 and 100)
+
+        Returns
+        =======
+        float:
+            The estimated percentile in seconds, None if no value was recorded
+        """
+        if not self.count:
+            return None
+        rank = max(ceil(percentile / 100 * self.count), 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                break
+        return min(BOUNDS[index], self.maximum) if index < len(BOUNDS) else self.maximum
+
+    def merge(self, other: "LatencyHistogram"):
+        """Adds the values of another histogram to this one
+
+        Parameters
+        ==========
+        other: LatencyHistogram
+            Histogram to add
+        """
+        for index, amount in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + amount
+        self.count += other.count
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+
+    def copy(self) -> "LatencyHistogram":
+        """Copies the histogram
+
+        Returns
+        =======
+        LatencyHistogram:
+            Reference to the newly copied histogram
+        """
+        histogram_copy = LatencyHistogram()
+        histogram_copy.merge(self)
+        return histogram_copy
+
+    def dump(self, percentiles: Sequence[float] = (50, 95, 99)) -> Dict[str, Any]:
+        """Dumps the histogram
+
+        Parameters
+        ==========
+        percentiles: Sequence[float] [(50, 95, 99)]
+            Percentiles to estimate
+
+        Returns
+        =======
+        dict:
+            A dictionnary representing the histogram (trivially convertable to JSON),
+            buckets are couples of upper bound and amount, only non-empty ones are kept
+        """
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else None,
+            "max": self.maximum,
+            **{f"p{percentile:g}": self.percentile(percentile) for percentile in percentiles},
+            "buckets": [
+                [BOUNDS[index] if index < len(BOUNDS) else None, self.buckets[index]]
+                for index in sorted(self.buckets)
+            ],
+        }
+
+    def __repr__(self) -> str:
+        return f"LatencyHistogram(count={self.count}, p50={self.percentile(50)})"
+
+
+def new_trigger_log() -> Dict[str, Any]:
+    """Creates the trigger_log of a Node
+
+    Returns
+    =======
+    Dict[str, Any]:
+        Counters of the triggers, the histograms are added by record_trigger
+    """
+    return {"success": 0, "failure": 0, "trigger": 0, "duration": 0.0}
+
+
+def record_trigger(
+    trigger_log: Dict[str, Any], wait: float, duration: float, cpu: float = None
+):
+    """Records a successful trigger in a trigger_log
+
+    Parameters
+    ==========
+    trigger_log: Dict[str, Any]
+        The trigger_log of the Node
+    wait: float
+        Time spent waiting for the inputs, in seconds
+    duration: float
+        Time spent in the function, in seconds
+    cpu: float [None]
+        CPU time of the function in seconds, None if it was not measured
+    """
+    trigger_log["success"] += 1
+    trigger_log["duration"] += duration
+    if "wall_time" not in trigger_log:
+        for name in HISTOGRAMS:
+            trigger_log[name] = LatencyHistogram()
+    trigger_log["wall_time"].record(wait + duration)
+    trigger_log["wait_time"].record(wait)
+    trigger_log["self_time"].record(duration)
+    if cpu is not None:
+        trigger_log["cpu_time"].record(cpu)
+
+
+def copy_trigger_log(trigger_log: Dict[str, Any]) -> Dict[str, Any]:
+    """Copies a trigger_log, histograms are copied too
+
+    Parameters
+    ==========
+    trigger_log: Dict[str, Any]
+        The trigger_log to copy
+
+    Returns
+    =======
+    Dict[str, Any]:
+        The copy of the trigger_log
+    """
+    return {
+        key: value.copy() if isinstance(value, LatencyHistogram) else value
+        for key, value in trigger_log.items()
+    }
+
+
+def dump_trigger_log(
+    trigger_log: Dict[str, Any], percentiles: Sequence[float] = (50, 95, 99)
+) -> Dict[str, Any]:
+    """Dumps a trigger_log
+
+    Parameters
+    ==========
+    trigger_log: Dict[str, Any]
+        The trigger_log to dump
+    percentiles: Sequence[float] [(50, 95, 99)]
+        Percentiles to estimate for each histogram
+
+    Returns
+    =======
+    dict:
+        A dictionnary representing the trigger_log (trivially convertable to JSON)
+    """
+    return {
+        key: value.dump(percentiles) if isinstance(value, LatencyHistogram) else value
+        for key, value in trigger_log.items()
+    }
+
+
+def merge_trigger_log(total: Dict[str, Any], trigger_log: Dict[str, Any]):
+    """Adds the counters and the histograms of a trigger_log to another one
+
+    Parameters
+    ==========
+    total: Dict[str, Any]
+        The trigger_log to add to, modified in place
+    trigger_log: Dict[str, Any]
+        The trigger_log to add
+    """
+    for key, value in trigger_log.items():
+        if isinstance(value, LatencyHistogram):
+            total.setdefault(key, LatencyHistogram()).merge(value)
+        else:
+            total[key] = total.get(key, 0) + value
+
+
+def aggregate_trigger_logs(nodes: Iterable["Node"]) -> Dict[str, Any]:
+    """Sums the trigger_logs of several Nodes
+
+    Parameters
+    ==========
+    nodes: Iterable[Node]
+        Nodes to aggregate, like the ones returned by get_whole_scenario
+
+    Returns
+    =======
+    Dict[str, Any]:
+        A trigger_log holding the counters and the histograms of all the Nodes
+    """
+    total = new_trigger_log()
+    for name in HISTOGRAMS:
+        total[name] = LatencyHistogram()
+    for node in nodes:
+        merge_trigger_log(total, node.trigger_log)
+    return total
+
+
+def get_scenario_metrics(
+    start_node: "Node", percentiles: Sequence[float] = (50, 95, 99)
+) -> Dict[str, Any]:
+    """Dumps the metrics of all the Nodes of a scenario and their aggregation
+
+    Parameters
+    ==========
+    start_node: Node
+        Starting Node of the scenario (see get_whole_scenario)
+    percentiles: Sequence[float] [(50, 95, 99)]
+        Percentiles to estimate for each histogram
+
+    Returns
+    =======
+    dict:
+        The dumped trigger_log of each Node by full name of Node ("nodes") and the
+        aggregated trigger_log of the scenario ("scenario"), trivially convertable to JSON
+    """
+    from pineapple_core.core.node import get_whole_scenario
+
+    nodes = get_whole_scenario(start_node)
+    return {
+        "nodes": {
+            node.full_name(): dump_trigger_log(node.trigger_log, percentiles)
+            for node in nodes
+        },
+        "scenario": dump_trigger_log(aggregate_trigger_logs(nodes), percentiles),
+    }
@@ -3,31 +3,50 @@
 This module contains the Node class and several helper functions.
 """
 
+import asyncio
+import inspect
+import threading
 import time
-from inspect import getfullargspec
+from concurrent.futures import Executor
+from contextvars import ContextVar
 from typing import Any, Callable, Dict, List, Tuple, Union
 from uuid import UUID, uuid4
 
 from klotan.match import OptionalKey
 
+from pineapple_core.core import hooks
+from pineapple_core.core.batch import trigger_batch
 from pineapple_core.core.callbacks import NodeCallbacks
+from pineapple_core.core.epoch import current_epoch, new_epoch, next_stamp, restore_epoch
 from pineapple_core.core.exceptions import (
     AmbiguousNodeOutputError,
     InexistantOutputResultError,
-    InvalidNodeFunctionReturnTypeError,
     NodeDoesNotAllowArgsError,
     NodeDoesNotAllowKwargsError,
     NodeOutputNotFoundError,
     NotANodeOutputError,
     ResultOutputMismatchError,
     NoOutputError,
+    RunningEventLoopError,
 )
-from pineapple_core.core.flows import Flow
-from pineapple_core.core.input_flags import Hidden, Optional, InputFlag, contains_flag
-from pineapple_core.core.node_input import NodeInput
+from pineapple_core.core.flows import Flow, FlowQueue, copy_flows
+from pineapple_core.core.metrics import (
+    CPU_SAMPLE_RATE,
+    copy_trigger_log,
+    new_trigger_log,
+    record_trigger,
+)
+from pineapple_core.core.node_input import InputTemplate, NodeInput
+from pineapple_core.core.node_model import NodeModel, get_node_model
 from pineapple_core.core.node_output import NodeOutput
+from pineapple_core.core.planner import get_plan, invalidate_plans
+from pineapple_core.core.processes import check_process_node, submit_node_function
+from pineapple_core.core.runs import RunState, current_run
+from pineapple_core.core.scheduler import AsyncFlowScheduler, FlowScheduler
 from pineapple_core.core.store import model_store, node_store
-from pineapple_core.core.types import PineappleType
+from pineapple_core.core.type_checks import get_type_check_policy
+
+_awaited = ContextVar("pineapple_awaited", default=False)
 
 
 class Node:
@@ -50,36 +69,132 @@ class Node:
     autotrigger: bool
         Whether the Node can be triggered automatically through its outputs when a connected
         node needs the result of self node
+    pure: bool
+        Whether the function of the Node only depends on its inputs, an autotrigger Node
+        that is pure is not executed again as long as its inputs don't change
+    process: bool
+        Whether the function of the Node is executed in a worker process (see
+        pineapple_core.core.processes), useful for CPU-bound functions.
+        The values of the inputs and the result have to be picklable
+    batch: bool
+        Whether the function of the Node can process whole columns of values at once
+        during a batch execution (see pineapple_core.core.batch) : it then receives a
+        list of values for each argument and returns the list of its results
+    barrier: bool
+        Whether the Node waits for all the parallel Flows that reach it before
+        being triggered, once (see Join in pineapple_nodes)
+    hook_registry: HookRegistry
+        Hooks of the scenario of the Node, called along with the global ones
+        (see pineapple_core.core.hooks)
+    type_check_policy: TypeCheckPolicy
+        How the values of the outputs are checked, the global policy is used
+        if None (see pineapple_core.core.type_checks)
+    plan_lock: RLock
+        Held while the Node is checked and triggered as a step of an ExecutionPlan,
+        so that concurrent branches needing the same autotrigger Node execute it once
+    model: NodeModel
+        The introspected description of the function (inputs, outputs, argument spec),
+        shared by all the Nodes created from the same function
+
+    The trigger log of a Node counts its triggers and holds the histograms of its
+    durations (see pineapple_core.core.metrics)
+    The Flows, trigger log, stamps and stream of a Node belong to the active run
+    when the Node is part of a ScenarioTemplate (see pineapple_core.core.runs), a run
+    copies the Flows of a Node the first time it uses them
     """
 
-    def __init__(self, function: Callable, module: str, name: str, autotrigger: bool):
+    __slots__ = (
+        "id",
+        "model",
+        "function",
+        "module",
+        "name",
+        "autotrigger",
+        "pure",
+        "process",
+        "batch",
+        "barrier",
+        "function_arg_spec",
+        "on",
+        "inputs",
+        "args_inputs",
+        "kwargs_inputs",
+        "allow_args",
+        "allow_kwargs",
+        "outputs",
+        "is_aware",
+        "origin",
+        "delay",
+        "retries",
+        "plan",
+        "plan_lock",
+        "type_check_policy",
+        "hook_registry",
+        "_flow_index",
+        "_flows_template",
+        "trigger_log_template",
+        "stamp_template",
+        "epoch_template",
+        "stream_template",
+        "__dict__",  # Helper functions and decorator arguments can add attributes
+        "__weakref__",
+    )
+
+    _flows = RunState(copy=copy_flows)
+    trigger_log = RunState(copy=copy_trigger_log)
+    stamp = RunState()
+    epoch = RunState()
+    stream = RunState()
+
+    def __init__(
+        self,
+        function: Callable,
+        module: str,
+        name: str,
+        autotrigger: bool,
+        pure: bool = False,
+        process: bool = False,
+        batch: bool = False,
+        model: NodeModel = None,
+    ):
+        self.model = model if model is not None else get_node_model(
+            function, module, name, autotrigger, pure, process, batch
+        )
         self.id = uuid4()
         self.function = function
         self.module = module
         self.name = name
         self.flows = []
         self.autotrigger = autotrigger
-        self.function_arg_spec = getfullargspec(self.function)
+        self.pure = pure
+        self.process = process
+        self.batch = batch
+        self.barrier = False
+        self.stream = None
+        self.function_arg_spec = self.model.function_arg_spec
         self.on = NodeCallbacks()
-        function_inputs = self._find_input_arguments(function)
-        self.inputs = {}
-        for (input_name, input_value) in function_inputs.items():
-            self.inputs[input_name] = self._build_node_input(input_name, input_value)
-
+        self.inputs = {
+            input_name: NodeInput(self, input_name, input_type, hidden, optional)
+            for input_name, input_type, hidden, optional in self.model.inputs
+        }
         self.args_inputs, self.kwargs_inputs = [], {}
-        self.allow_args = self.function_arg_spec.varargs is not None
-        self.allow_kwargs = self.function_arg_spec.varkw is not None
+        self.allow_args = self.model.allow_args
+        self.allow_kwargs = self.model.allow_kwargs
         self.outputs = {
-            key: NodeOutput(self, key, output_type)
-            for key, output_type in self._build_return_types().items()
+            key: NodeOutput(self, key, output_type, validator)
+            for key, output_type, validator in self.model.outputs
         }
-        self.is_aware = False
+        self.is_aware = self.model.is_aware
         self.origin = self
-        if "self" in self.inputs:
-            self.is_aware = True
         self.delay = 0
         self.retries = 0
-        self.trigger_log = {"success": 0, "failure": 0, "trigger": 0}
+        self.trigger_log = new_trigger_log()
+        self.plan = None
+        self.plan_lock = threading.RLock()
+        self.type_check_policy = None
+        self.hook_registry = None
+        self.epoch = 0
+        self.stamp = 0
 
     def set_retries(self, retries: int, delay: float = 0) -> "Node":
         """Set the amount of retries a Node can call its function and
@@ -107,15 +222,10 @@ class Node:
         flow_nodes = [flow.node for flow in self.flows]
         input_nodes = [
             input.connected_output.node
-            for input in (
-                list(self.inputs.values())
-                + self.args_inputs
-                + list(self.kwargs_inputs.values())
-            )
+            for input in self._find_all_possible_inputs()
             if input.connected_output
         ]
-        connected_nodes = flow_nodes + input_nodes
-        return list(set(connected_nodes))
+        return list(dict.fromkeys(flow_nodes + input_nodes))
 
     def copy(self):
         """Copies a Node.
@@ -126,25 +236,41 @@ class Node:
         Node:
             Reference to the newly copied Node
         """
-        node_copy = Node(self.function, self.module, self.name, self.autotrigger)
+        node_copy = Node(
+            self.function,
+            self.module,
+            self.name,
+            self.autotrigger,
+            self.pure,
+            self.process,
+            self.batch,
+            model=self.model,
+        )
         node_copy.id = self.id
         node_copy.inputs = {key: value.copy() for key, value in self.inputs.items()}
         node_copy.outputs = {key: value.copy() for key, value in self.outputs.items()}
         node_copy.allow_args, node_copy.allow_args = self.allow_args, self.allow_kwargs
         node_copy.on = self.on.copy()
-        node_copy.flows = [flow.copy() for flow in self.flows]
+        node_copy.flows = copy_flows(self.flows)
         node_copy.args_inputs = [arg_input.copy() for arg_input in self.args_inputs]
         node_copy.kwargs_inputs = {
             key: value.copy() for key, value in self.kwargs_inputs.items()
         }
         node_copy.is_aware = self.is_aware
+        node_copy.barrier = self.barrier
         node_copy.origin = self.origin
         node_copy.retries = self.retries
         node_copy.delay = self.delay
-        node_copy.trigger_log = {key: value for key, value in self.trigger_log.items()}
+        node_copy.type_check_policy = self.type_check_policy
+        node_copy.hook_registry = self.hook_registry
+        node_copy.trigger_log = copy_trigger_log(self.trigger_log)
         return node_copy
 
-    def update_references(self, scenario_state: Dict[UUID, "Node"]):
+    def update_references(
+        self,
+        scenario_state: Dict[UUID, "Node"],
+        outputs_index: Dict[UUID, NodeOutput] = None,
+    ):
         """Update all references within the Node (to other Nodes) based
         on a Dictionnary containing all the new Node references.
 
@@ -152,62 +278,24 @@ class Node:
         ==========
         scenario_state: Dict[UUID, Node]
             All Nodes the current Node can use to update its internal references.
+        outputs_index: Dict[UUID, NodeOutput] [None]
+            All the NodeOutputs of the Nodes in scenario_state by id, it is built from
+            scenario_state if not given (pass it when updating several Nodes)
         """
-
-        def find_output(search_output):
-            for current_node in scenario_state.values():
-                for output in current_node.outputs.values():
-                    if search_output.id == output.id:
-                        return output
-            return None
-
-        for node_input in self.inputs.values():
+        if outputs_index is None:
+            outputs_index = index_outputs(scenario_state.values())
+        for node_input in self._find_all_possible_inputs():
             if node_input.node:
                 node_input.node = scenario_state[node_input.node.id]
             if node_input.connected_output:
-                node_input.connected_output = find_output(node_input.connected_output)
+                node_input.connected_output = outputs_index.get(
+                    node_input.connected_output.id
+                )
         for output in self.outputs.values():
             if output.node:
                 output.node = scenario_state[output.node.id]
         for flow in self.flows:
             flow.node = scenario_state[flow.node.id]
-        for node_input in self.args_inputs:
-            node_input.node = scenario_state[node_input.node.id]
-        for node_input in self.kwargs_inputs.values():
-            node_input.node = scenario_state[node_input.node.id]
-
-    def _build_return_types(self) -> Dict[Any, Any]:
-        return_types = (
-            self.function.__annotations__["return"]
-            if "return" in self.function.__annotations__
-            else None
-        )
-        if isinstance(return_types, (list, tuple)):
-            return_types = {key: value for key, value in enumerate(return_types)}
-        elif isinstance(return_types, (PineappleType, type)):
-            return_types = {"out": return_types}
-        elif return_types is None:
-            return_types = {}
-        elif not isinstance(return_types, dict):
-            raise InvalidNodeFunctionReturnTypeError(self, self.function)
-        return return_types
-
-    def _build_node_input(self, name: str, value: Any) -> NodeInput:
-        input_type = value.underlying_type if isinstance(value, InputFlag) else value
-        optional = contains_flag(value, Optional)
-        hidden = contains_flag(value, Hidden)
-        return NodeInput(self, name, input_type, hidden, optional)
-
-    def _find_input_arguments(self, function: Callable) -> Dict[str, Any]:
-        temp_inputs = {}
-        for name, value in function.__annotations__.items():
-            if name not in [
-                "return",
-                self.function_arg_spec.varargs,
-                self.function_arg_spec.varkw,
-            ]:
-                temp_inputs[name] = value
-        return temp_inputs
 
     def _args_keys_to_index(self, values: Dict[str, Any]) -> List[Any]:
         """
@@ -242,8 +330,29 @@ class Node:
         """
         return f"{self.module}.{self.name}({self.id})"
 
+    @property
+    def flows(self) -> List[Flow]:
+        """Flows of the Node, in their order of connection
+        """
+        return self._flows
+
+    @flows.setter
+    def flows(self, flows: List[Flow]):
+        self._flows = flows
+        self._flow_index = {}
+        for position, flow in enumerate(flows):
+            self._index_flow(flow, position)
+
+    def _index_flow(self, flow: Flow, position: int):
+        if position > 0:
+            flow.share_revision(self.flows[0])
+        try:
+            self._flow_index.setdefault(flow.name, position)
+        except TypeError:  # Unhashable names can only be found by get_flow's linear scan
+            pass
+
     def get_flow(self, name: Any) -> Flow:
-        """Gets the Flow by its name.
+        """Gets the Flow by its name (using an index of the Flows by name).
         If the Flow does not exists, it will return None.
 
         Parameters
@@ -256,10 +365,11 @@ class Node:
         Flow:
             Reference to the Flow you retrieved.
         """
-        for flow in self.flows:
-            if flow.name == name:
-                return flow
-        return None
+        try:
+            position = self._flow_index.get(name)
+        except TypeError:
+            return next((flow for flow in self.flows if flow.name == name), None)
+        return None if position is None else self.flows[position]
 
     def add_output(self, output: NodeOutput):
         """
@@ -271,6 +381,8 @@ class Node:
             NodeOutput to add to the Node
         """
         self.outputs[output.name] = output
+        self.stamp = 0
+        invalidate_plans()
         if self.on.add_output:
             self.on.add_output(self, output)
 
@@ -298,6 +410,7 @@ class Node:
         Node:
             Returns itself
         """
+        invalidate_plans()
         for arg_name, arg_value in kwargs.items():
             if arg_name in self.inputs.keys():
                 _connect_or_set_input(self.inputs[arg_name], arg_value)
@@ -348,7 +461,11 @@ class Node:
         return args[index_arg:]
 
     def connect_flow(
-        self, next_node: "Node", name: Any = None, disabled: bool = False
+        self,
+        next_node: "Node",
+        name: Any = None,
+        disabled: bool = False,
+        parallel: bool = False,
     ) -> "Node":
         """
         Connects a Node to another one
@@ -362,6 +479,10 @@ class Node:
             Name you want to give to the Flow (can be of any type)
         disabled: bool
             Whether the Flow is disabled by default or not
+        parallel: bool
+            Whether the Flow can run concurrently with the parallel Flows connected
+            right before or after it (see FlowScheduler), use a Join Node
+            to continue once all of them are done
 
         Returns
         =======
@@ -370,11 +491,13 @@ class Node:
         """
         if name is None:
             name = len(self.flows)
-            while [flow for flow in self.flows if flow.name == name]:
+            while self.get_flow(name) is not None:
                 name += 1
         for flow in self.flows:
             flow.priority += 1
-        self.flows.append(Flow(next_node, name, (-1 if disabled else 1)))
+        self.flows.append(Flow(next_node, name, (-1 if disabled else 1), parallel))
+        self._index_flow(self.flows[-1], len(self.flows) - 1)
+        invalidate_plans()
         if self.on.connect_flow:
             self.on.connect_flow(self, self.flows[-1])
         return self
@@ -386,16 +509,67 @@ class Node:
             + list(self.kwargs_inputs.values())
         )
 
-    def _execute_function(self):
+    def _get_arguments(self) -> Tuple[List[Any], Dict[str, Any]]:
         positional_inputs = {inp.name: inp.get() for inp in self.inputs.values()}
         if self.is_aware:
             positional_inputs["self"] = self
         positional_args = self._args_keys_to_index(positional_inputs)
-        result = self.function(
-            *positional_args,
-            *[inp.get() for inp in self.args_inputs],
-            **{inp.name: inp.get() for inp in self.kwargs_inputs.values()},
+        return (
+            [*positional_args, *[inp.get() for inp in self.args_inputs]],
+            {inp.name: inp.get() for inp in self.kwargs_inputs.values()},
         )
+
+    def _execute_function(self):
+        args, kwargs = self._get_arguments()
+        if self.process:
+            result = submit_node_function(self, args, kwargs).result()
+        else:
+            token = _awaited.set(False)
+            try:
+                result = self.function(*args, **kwargs)
+            finally:
+                _awaited.reset(token)
+        if inspect.iscoroutine(result):
+            result = self._run_coroutine(result)
+        if inspect.isgenerator(result):
+            self.stream = result
+        else:
+            self._set_result(result)
+
+    def _run_coroutine(self, coroutine: Any) -> Any:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        coroutine.close()
+        raise RunningEventLoopError(self)
+
+    async def _aexecute_function(self):
+        args, kwargs = self._get_arguments()
+        if self.process:
+            result = await asyncio.wrap_future(submit_node_function(self, args, kwargs))
+        else:
+            token = _awaited.set(True)
+            try:
+                result = self.function(*args, **kwargs)
+            finally:
+                _awaited.reset(token)
+        if inspect.iscoroutine(result):
+            result = await result
+        if inspect.isgenerator(result):
+            self.stream = result
+        else:
+            self._set_result(result)
+
+    def _set_result(self, result: Any):
+        if hooks.enabled:
+            start = time.perf_counter()
+            self._set_outputs(result)
+            hooks.emit(self, "outputs_set", time.perf_counter() - start)
+        else:
+            self._set_outputs(result)
+
+    def _set_outputs(self, result: Any):
         if isinstance(result, OutputWrapper):
             result = result()
             if isinstance(result, (list, tuple)):
@@ -422,65 +596,277 @@ class Node:
         - Call the next node using the flow
         If the result of the function is a list or a dictionnary,
         it can be bound to multiple outputs
+        The next nodes are executed by a FlowScheduler so that long chains of flows
+        (and loops) don't grow the Python stack
+        Each call starts a new evaluation epoch, autotrigger Nodes are executed
+        at most once per epoch unless one of their sources changes
+        Independent autotrigger Nodes feeding the inputs of a Node are resolved
+        concurrently when the active run has an executor (see RunContext and
+        ScenarioTemplate in pineapple_core.core.runs), otherwise one after another
+        """
+        run = current_run()
+        previous_epoch = new_epoch()
+        try:
+            FlowScheduler(self, executor=run.executor if run is not None else None).run()
+        finally:
+            restore_epoch(previous_epoch)
+
+    async def atrigger(self):
         """
+        Triggers the Node from a running event loop, it works like trigger
+        but Node functions defined with "async def" are awaited instead of
+        being run in a new event loop, independent autotrigger Nodes are
+        resolved concurrently and retry delays don't block the event loop
+        """
+        previous_epoch = new_epoch()
+        try:
+            await AsyncFlowScheduler(self).run()
+        finally:
+            restore_epoch(previous_epoch)
+
+    def trigger_batch(self, inputs: Dict[Union["Node", NodeInput], List[Any]]):
+        """
+        Evaluates the Node and the autotrigger Nodes it depends on for every row of
+        a batch of input values, without walking the graph once per row
+        (see pineapple_core.core.batch)
+
+        Parameters
+        ----------
+        inputs: Dict[Union[Node, NodeInput], List[Any]]
+            Values of the batch inputs, one list per NodeInput (or Node with a
+            single NodeInput, a Value Node for example)
+
+        Returns
+        -------
+        BatchResult:
+            The values of the NodeOutputs and the Exceptions, one per row
+        """
+        return trigger_batch(self, inputs)
+
+    def _trigger_self(
+        self, resolve_inputs: bool = True, executor: Executor = None
+    ) -> List[int]:
+        """
+        Function for internal use only
+        Triggers the Node without executing its flows, the priorities the function
+        gives to the flows are temporary : the caller has to restore them once done
+
+        Parameters
+        ----------
+        resolve_inputs: bool [True]
+            Whether the autotrigger Nodes connected to the inputs have to be
+            triggered first (using the ExecutionPlan of the Node)
+        executor: Executor [None]
+            Executor used to resolve independent autotrigger Nodes concurrently
+
+        Returns
+        -------
+        List[int]
+            Priorities of the Flows of the Node before it was triggered
+        """
+        priorities = self._begin_trigger()
+        try:
+            wait_start = time.perf_counter()
+            if resolve_inputs:
+                get_plan(self).execute(executor)
+            if hooks.enabled:
+                hooks.emit(self, "function_start")
+            cpu_start = self._start_cpu_clock()
+            stamp, start = next_stamp(), time.perf_counter()
+            self._execute_with_retries()
+        except Exception as exception:
+            self._abort_trigger(priorities, exception)
+            raise
+        self._end_trigger(stamp, wait_start, start, cpu_start)
+        return priorities
+
+    async def _atrigger_self(self, resolve_inputs: bool = True) -> List[int]:
+        """
+        Function for internal use only
+        Asynchronous version of _trigger_self
+
+        Parameters
+        ----------
+        resolve_inputs: bool [True]
+            Whether the autotrigger Nodes connected to the inputs have to be
+            triggered first (using the ExecutionPlan of the Node)
+
+        Returns
+        -------
+        List[int]
+            Priorities of the Flows of the Node before it was triggered
+        """
+        priorities = self._begin_trigger()
+        try:
+            wait_start = time.perf_counter()
+            if resolve_inputs:
+                await get_plan(self).aexecute()
+            if hooks.enabled:
+                hooks.emit(self, "function_start")
+            cpu_start = self._start_cpu_clock()
+            stamp, start = next_stamp(), time.perf_counter()
+            await self._aexecute_with_retries()
+        except Exception as exception:
+            self._abort_trigger(priorities, exception)
+            raise
+        self._end_trigger(stamp, wait_start, start, cpu_start)
+        return priorities
+
+    def _begin_trigger(self) -> List[int]:
         self.trigger_log["trigger"] += 1
-        flows_backup = [flow for flow in self.flows]
-        self.flows = [Flow.from_reference(flow) for flow in self.flows]
-        if self.on.trigger:
-            self.on.trigger(self)
-        for inp in self._find_all_possible_inputs():
-            inp.backtrigger()
-        self._execute_with_retries()
-        self.trigger_log["success"] += 1
-        for flow in self.get_next_flow():
-            if flow.priority >= 0:
-                if self.on.before_flow:
-                    self.on.before_flow(self, flow)
-                try:
-                    flow.node.trigger()
-                except Exception as exception:
-                    if self.on.flow_failure:
-                        self.on.flow_failure(self, flow, exception)
-                    else:
-                        raise exception
-                if self.on.after_flow:
-                    self.on.after_flow(self, flow)
-        self.flows = [flow for flow in flows_backup]
-
-    def get_next_flow(self):
-        executed_flows = []
-
-        def get_sorted_flows():
-            return sorted(
-                [
-                    flow
-                    for flow in self.flows
-                    if (flow not in executed_flows and flow.priority > 0)
-                ],
-                key=lambda x: x.priority,
-                reverse=True,
-            )
-
-        while True:
-            sorted_flows = get_sorted_flows()
-            if len(sorted_flows) > 0:
-                next_flow = sorted_flows[0]
-                executed_flows.append(next_flow)
-                yield next_flow
-            else:
-                break
+        priorities = [flow.priority for flow in self.flows]
+        try:
+            if self.on.trigger:
+                self.on.trigger(self)
+        except Exception:
+            self._abort_trigger(priorities)
+            raise
+        if hooks.enabled:
+            hooks.emit(self, "trigger_start")
+        return priorities
+
+    def _abort_trigger(self, priorities: List[int], exception: Exception = None):
+        self.restore_priorities(priorities)
+        self.stamp = 0
+        if exception is not None:
+            if self.on.trigger_failure:
+                self.on.trigger_failure(self, exception)
+            if hooks.enabled:
+                hooks.emit(self, "failure", exception)
+
+    def restore_priorities(self, priorities: List[int]):
+        """Gives back their priorities to the Flows of the Node, only the
+        Flows whose priority changed are modified
+
+        Parameters
+        ==========
+        priorities: List[int]
+            Priorities of the Flows (in their order of connection)
+        """
+        for flow, priority in zip(self.flows, priorities):
+            if flow.priority != priority:
+                flow.priority = priority
+
+    def _start_cpu_clock(self) -> float:
+        if self.trigger_log["trigger"] % CPU_SAMPLE_RATE == 1:
+            return time.thread_time()
+        return None
+
+    def _end_trigger(self, stamp: int, wait_start: float, start: float, cpu_start: float):
+        duration = time.perf_counter() - start
+        cpu = time.thread_time() - cpu_start if cpu_start is not None else None
+        self.stamp = stamp
+        self.epoch = current_epoch()
+        record_trigger(self.trigger_log, start - wait_start, duration, cpu)
+        if self.on.after_trigger:
+            self.on.after_trigger(self)
+        if hooks.enabled:
+            hooks.emit(self, "trigger_end", duration)
+
+    def is_fresh(self, sources: List[NodeOutput]) -> bool:
+        """Checks whether the values of the Node are up to date : the last execution of
+        the Node succeeded and none of its inputs or sources changed since.
+        A Node that is not pure also needs to be executed during the current evaluation
+        epoch to be considered fresh.
+
+        Parameters
+        ==========
+        sources: List[NodeOutput]
+            NodeOutputs the Node reads its values from
+
+        Returns
+        =======
+        bool:
+            True if the Node does not need to be executed again, False otherwise
+        """
+        if not self.stamp or (not self.pure and self.epoch != current_epoch()):
+            return False
+        return all(
+            node_input.stamp < self.stamp for node_input in self._find_all_possible_inputs()
+        ) and all(source.stamp < self.stamp for source in sources)
+
+    def get_next_flow(self, executed_flows: List[Flow] = None):
+        """Yields the enabled Flows of the Node by order of priority.
+        Priorities are evaluated again after each Flow so that a Flow
+        can enable or disable the next ones.
+
+        Parameters
+        ==========
+        executed_flows: List[Flow] [None]
+            Flows that were already executed and should not be yielded again,
+            yielded Flows are appended to it
+
+        Returns
+        =======
+        Generator[Flow]:
+            Enabled Flows that were not executed yet
+        """
+        if executed_flows is None:
+            executed_flows = []
+        flow_queue = FlowQueue(self.flows, executed_flows)
+        next_flow = flow_queue.pop()
+        while next_flow is not None:
+            executed_flows.append(next_flow)
+            yield next_flow
+            next_flow = flow_queue.pop()
+
+    def has_pending_flow(self, executed_flows: List[Flow]) -> bool:
+        """Checks whether the Node still has an enabled Flow to execute
+
+        Parameters
+        ==========
+        executed_flows: List[Flow]
+            Flows that were already executed
+
+        Returns
+        =======
+        bool:
+            True if an enabled Flow was not executed yet, False otherwise
+        """
+        executed_flows = set(executed_flows)
+        return any(
+            flow.priority > 0 and flow not in executed_flows for flow in self.flows
+        )
 
     def _execute_with_retries(self):
+        self._call_with_retries(self._execute_function)
+
+    def _call_with_retries(self, function: Callable[[], Any]) -> Any:
+        """
+        Function for internal use only
+        Calls a function until it succeeds, at most retries + 1 times,
+        waiting delay seconds after each failure
+
+        Parameters
+        ----------
+        function: Callable[[], Any]
+            Function to call (the function of the Node with its arguments)
+
+        Returns
+        -------
+        Any
+            Value returned by the function
+        """
         for x in range(self.retries + 1):
             try:
-                self._execute_function()
-                break
+                return function()
             except Exception as e:
                 time.sleep(self.delay)
                 if x == self.retries:
                     self.trigger_log["failure"] += 1
                     raise e
 
+    async def _aexecute_with_retries(self):
+        for x in range(self.retries + 1):
+            try:
+                await self._aexecute_function()
+                break
+            except Exception as e:
+                await asyncio.sleep(self.delay)
+                if x == self.retries:
+                    self.trigger_log["failure"] += 1
+                    raise e
+
     def dump(self, active: bool = True) -> Dict[str, Any]:
         """
         Dumps a Node as a dict representation
@@ -506,6 +892,7 @@ class Node:
             "autotrigger": self.autotrigger,
             "inputs": {key: value.dump(active) for key, value in self.inputs.items()},
             "outputs": {key: value.dump(active) for key, value in self.outputs.items()},
+            "type_check_policy": get_type_check_policy(self).dump(),
         }
         if active:
             base = {
@@ -566,6 +953,9 @@ def node(
     name: str,
     autotrigger: bool = False,
     helper_function: Callable = None,
+    pure: bool = False,
+    process: bool = False,
+    batch: bool = False,
     **decorator_kwargs: Any,
 ) -> Node:
     """
@@ -581,6 +971,14 @@ def node(
         says what kind of action the Node does
     autotrigger: bool [False]
         See autotrigger attribute on Node class
+    pure: bool [False]
+        See pure attribute on Node class
+    process: bool [False]
+        See process attribute on Node class, the function is checked when the Node
+        is created and InvalidProcessNodeError is raised if it can't run in
+        another process
+    batch: bool [False]
+        See batch attribute on Node class
     helper_function: Callable
         Function to call before creating a Node instance, the Node and all
         additional *args and **kwargs passed on the Node creation will be
@@ -605,9 +1003,8 @@ def node(
         Node:
             Reference to the newly created Node
         """
-        model_store[f"{module}.{name}"] = Node(
-            node_function, module, name, autotrigger
-        )  # TODO: make real model
+        model = get_node_model(node_function, module, name, autotrigger, pure, process, batch)
+        model_store[model.full_name()] = model
 
         def node_sub_wrapper(*args: Any, **kwargs: Any) -> Node:
             """Wrapper for the Node decorator wrapper, takes the variadic arguments
@@ -623,7 +1020,9 @@ def node(
             Node:
                 Reference to the newly created Node
             """
-            new_node = Node(node_function, module, name, autotrigger)
+            new_node = model.create()
+            if process:
+                check_process_node(new_node)
             node_store[str(new_node.id)] = new_node
             if helper_function is not None:
                 helper_function(new_node, *args, **kwargs)
@@ -652,6 +1051,16 @@ class OutputWrapper:
             Value that you want to wrap, can be anything
         """
         self.underlying_value = underlying_value
+        self._template = None
+
+    @property
+    def template(self) -> InputTemplate:
+        """The underlying value compiled into an InputTemplate (see NodeInput.get),
+        it is compiled again only if underlying_value is replaced
+        """
+        if self._template is None or self._template.value is not self.underlying_value:
+            self._template = InputTemplate(self.underlying_value)
+        return self._template
 
     def __call__(self) -> Any:
         """Special method __call__
@@ -660,6 +1069,19 @@ class OutputWrapper:
         return self.underlying_value
 
 
+def is_awaited() -> bool:
+    """Checks whether the function of the Node being executed is called by atrigger,
+    a blocking function (sleeping or waiting for I/O) can then return a coroutine
+    that will be awaited instead of blocking the event loop
+
+    Returns
+    =======
+    bool:
+        True if the result of the function will be awaited, False otherwise
+    """
+    return _awaited.get()
+
+
 def wrap(underlying_value: Any) -> OutputWrapper:
     """Helper function to build an OutputWrapper
 
@@ -763,16 +1185,34 @@ def get_whole_scenario(starting_node: Node):
     List[Node]:
         Reference to all Nodes in the scenario
     """
-    connected_nodes = starting_node.get_connected_nodes() + [starting_node]
+    connected_nodes = list(
+        dict.fromkeys(starting_node.get_connected_nodes() + [starting_node])
+    )
+    visited_nodes = set(connected_nodes)
     for connected_node in connected_nodes:
-        connected_nodes += [
-            node
-            for node in connected_node.get_connected_nodes()
-            if node not in connected_nodes
-        ]
+        for node in connected_node.get_connected_nodes():
+            if node not in visited_nodes:
+                visited_nodes.add(node)
+                connected_nodes.append(node)
     return connected_nodes
 
 
+def index_outputs(nodes: List[Node]) -> Dict[UUID, NodeOutput]:
+    """Indexes the NodeOutputs of several Nodes by id
+
+    Parameters
+    ==========
+    nodes: List[Node]
+        Nodes whose NodeOutputs have to be indexed
+
+    Returns
+    =======
+    Dict[UUID, NodeOutput]:
+        Reference to every NodeOutput by id
+    """
+    return {output.id: output for node in nodes for output in node.outputs.values()}
+
+
 def copy_scenario_state(starting_node: Node):
     """Copies a whole scenario.
 
@@ -790,6 +1230,7 @@ def copy_scenario_state(starting_node: Node):
     """
     connected_nodes = get_whole_scenario(starting_node)
     scenario_state = {node.id: node.copy() for node in connected_nodes}
+    outputs_index = index_outputs(scenario_state.values())
     for current_node in scenario_state.values():
-        current_node.update_references(scenario_state)
+        current_node.update_references(scenario_state, outputs_index)
     return scenario_state[starting_node.id]
@@ -3,63 +3,106 @@
 This module contains the NodeInput class.
 """
 
-from copy import deepcopy
-from typing import Any, Dict
-from uuid import uuid4
+from typing import Any, Callable, Dict, List, Tuple
+from uuid import UUID, uuid4
 
+from pineapple_core.core.epoch import next_stamp
 from pineapple_core.core.exceptions import HiddenNodeInputConnectError
 from pineapple_core.core.node_output import NodeOutput
+from pineapple_core.core.planner import invalidate_plans
+from pineapple_core.core.runs import RunState
 from pineapple_core.utils.serialization import make_value_serializable
 
 
-def _process_list(input_list, func, override):
-    from pineapple_core.core.node import Node
+_REFERENCE = object()
+
+
+class InputTemplate:
+    """Class that represents the value of an OutputWrapper compiled once, it holds the paths
+    of the Nodes and NodeOutputs embedded in lists, tuples and dicts (as values or keys).
+    Resolving the template only rebuilds the containers along those paths, every other
+    part of the value is shared.
+    Changes made in place to the value after it is compiled are not tracked
+
+    Attributes
+    ==========
+    value: Any
+        The compiled value
+    references: Tuple[Union[Node, NodeOutput]]
+        Nodes and NodeOutputs embedded in the value, depth-first
+    """
+
+    __slots__ = ("value", "references", "_paths")
+
+    def __init__(self, value: Any):
+        """InputTemplate constructor
+
+        Parameters
+        ==========
+        value: Any
+            The value to compile
+        """
+        references = []
+        self.value = value
+        self._paths = _compile_paths(value, references)
+        self.references = tuple(references)
 
-    for i, value in enumerate(input_list):
-        if isinstance(value, (Node, NodeOutput)):
-            if override:
-                input_list[i] = func(value)
-            else:
-                func(value)
-        if isinstance(value, (list, tuple)):
-            _process_list(value, func, override)
-        elif isinstance(value, dict):
-            _process_dict(value, func, override)
+    def resolve(self, resolve_reference: Callable[[Any], Any]) -> Any:
+        """Builds the value with the embedded Nodes and NodeOutputs replaced
 
+        Parameters
+        ==========
+        resolve_reference: Callable[[Any], Any]
+            Function returning the replacement of a Node or NodeOutput
 
-def _process_dict(input_dict, func, override):
+        Returns
+        =======
+        Any:
+            The resolved value, the value itself if it does not embed any reference
+        """
+        if self._paths is None:
+            return self.value
+        return _rebuild(self.value, self._paths, resolve_reference)
+
+
+def _compile_paths(value: Any, references: List[Any]) -> List[Tuple[Any, bool, Any]]:
     from pineapple_core.core.node import Node
 
-    for key, value in input_dict.items():
-        if isinstance(value, (Node, NodeOutput)):
-            if override:
-                input_dict[key] = func(value)
-            else:
-                func(value)
-        if isinstance(key, (Node, NodeOutput)):
-            if override:
-                key = func(key)
-                input_dict[key] = input_dict.pop(key)
-            else:
-                func(key)
-        if isinstance(value, (list, tuple)):
-            _process_list(value, func, override)
-        elif isinstance(value, dict):
-            _process_dict(value, func, override)
-
-
-def _process_value(value, func, override=False):
-    if override:
-        value_copy = deepcopy(value)
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, (list, tuple)):
+        items = enumerate(value)
     else:
-        value_copy = value
-    if isinstance(value_copy, dict):
-        _process_dict(value_copy, func, override)
-        return value_copy
-    elif isinstance(value_copy, (list, tuple)):
-        _process_list(value_copy, func, override)
-        return value_copy
-    return value
+        return None
+    paths = []
+    for key, item in items:
+        if isinstance(item, (Node, NodeOutput)):
+            references.append(item)
+            path = _REFERENCE
+        else:
+            path = _compile_paths(item, references)
+        key_is_reference = isinstance(key, (Node, NodeOutput))
+        if key_is_reference:
+            references.append(key)
+        if path is not None or key_is_reference:
+            paths.append((key, key_is_reference, path))
+    return paths or None
+
+
+def _rebuild(value: Any, paths: List[Tuple[Any, bool, Any]], resolve_reference: Callable):
+    is_tuple = isinstance(value, tuple)
+    value_copy = list(value) if is_tuple else value.copy()
+    for key, key_is_reference, path in paths:
+        item = value[key]
+        if path is _REFERENCE:
+            item = resolve_reference(item)
+        elif path is not None:
+            item = _rebuild(item, path, resolve_reference)
+        if key_is_reference:
+            del value_copy[key]
+            key = resolve_reference(key)
+        value_copy[key] = item
+    return tuple(value_copy) if is_tuple else value_copy
 
 
 class NodeInput:
@@ -69,7 +112,7 @@ class NodeInput:
     Attributes
     ----------
     id : uuid.UUID
-        An unique ID generated on the NodeInput creation
+        An unique ID generated the first time it is needed
     name : str
         Name of the input
     input_type : type
@@ -79,8 +122,28 @@ class NodeInput:
     hidden : bool
         If "hidden" is True, the input can only have a value
         through its fallback value (no connection to an output)
+    value : Any
+        Fallback value used when no output is connected
+    stamp : int
+        Stamp (see pineapple_core.core.epoch) of the last time the value
+        or the connection of the NodeInput changed
     """
 
+    __slots__ = (
+        "_id",
+        "name",
+        "node",
+        "input_type",
+        "connected_output",
+        "hidden",
+        "optional",
+        "_value_template",
+        "stamp_template",
+    )
+
+    _value = RunState()
+    stamp = RunState()
+
     def __init__(
         self,
         node,
@@ -89,7 +152,7 @@ class NodeInput:
         hidden: bool = False,
         optional: bool = False,
     ):
-        self.id = uuid4()
+        self._id = None
         self.name = name
         self.node = node
         self.input_type = input_type
@@ -98,6 +161,25 @@ class NodeInput:
         self.optional = optional
         self.value = None
 
+    @property
+    def id(self) -> UUID:
+        if self._id is None:
+            self._id = uuid4()
+        return self._id
+
+    @id.setter
+    def id(self, id: UUID):
+        self._id = id
+
+    @property
+    def value(self) -> Any:
+        return self._value
+
+    @value.setter
+    def value(self, value: Any):
+        self._value = value
+        self.stamp = next_stamp()
+
     def connect(self, output: NodeOutput):
         """
         Connects an input to an existing output
@@ -111,6 +193,8 @@ class NodeInput:
         # Should check for output.output_type
         if not self.hidden:
             self.connected_output = output
+            self.stamp = next_stamp()
+            invalidate_plans()
             if self.node.on.connect_input:
                 self.node.on.connect_input(self.node, self, output)
         else:
@@ -119,13 +203,22 @@ class NodeInput:
     def set(self, value: Any):
         """Sets the default value of the NodeInput
         This value will be returned if the NodeInput is not connected to a NodeOutput
+        The compiled ExecutionPlans are invalidated when the previous or the new value
+        is wrapped, the Nodes and NodeOutputs it references are dependencies
 
         Parameters
         ==========
         value: Any
             Default value you want to set for the current NodeInput
         """
+        from pineapple_core.core.node import OutputWrapper
+
+        if isinstance(value, OutputWrapper):
+            value.template  # Compiled once, when the value is set
+        wrapped = isinstance(value, OutputWrapper) or isinstance(self.value, OutputWrapper)
         self.value = value
+        if wrapped:
+            invalidate_plans()
         if self.node.on.set_input_value:
             self.node.on.set_input_value(self.node, self, value)
 
@@ -146,35 +239,10 @@ class NodeInput:
             return self.connected_output.value
         from pineapple_core.core.node import OutputWrapper
 
-        if isinstance(self.value, OutputWrapper):
-            return _process_value(
-                self.value.underlying_value,
-                lambda item: extract_output(item).get(),
-                override=True,
-            )
-        else:
-            return self.value
-
-    def backtrigger(self):
-        from pineapple_core.core.node import Node, OutputWrapper
-
-        def backtrigger_in_value(item):
-            base_node = None
-            if isinstance(item, NodeOutput):
-                base_node = item.node
-            elif isinstance(item, Node):
-                base_node = item
-            if base_node.autotrigger:
-                if self.node.on.trigger_input:
-                    self.node.on.trigger_input(self.node, self, base_node)
-                base_node.trigger()
-
-        if self.connected_output and self.connected_output.node.autotrigger:
-            if self.node.on.trigger_input:
-                self.node.on.trigger_input(self.node, self, self.connected_output.node)
-            self.connected_output.node.trigger()
-        elif isinstance(self.value, OutputWrapper):
-            _process_value(self.value.underlying_value, backtrigger_in_value)
+        value = self.value
+        if isinstance(value, OutputWrapper):
+            return value.template.resolve(lambda item: extract_output(item).get())
+        return value
 
     def __repr__(self):
         """
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""This module contains everything that is related to Node models.
+A NodeModel holds everything a Node derives from its function (argument spec,
+inputs, input flags and output types), it is computed once per function and
+every Node created from it reuses it instead of introspecting the function again.
+"""
+
+from inspect import getfullargspec, isfunction
+from typing import Any, Callable, Dict
+
+from pineapple_core.core.exceptions import InvalidNodeFunctionReturnTypeError
+from pineapple_core.core.input_flags import Hidden, Optional, InputFlag, contains_flag
+from pineapple_core.core.types import PineappleType
+from pineapple_core.core.validators import compile_validator
+
+_MODELS_ATTRIBUTE = "__pineapple_node_models__"
+
+
+class NodeModel:
+    """Class that represents the immutable description of a kind of Node
+
+    Attributes
+    ==========
+    function: Callable
+        The function of the Nodes
+    module: str
+        Module of the Nodes
+    name: str
+        Name of the Nodes
+    autotrigger: bool
+        See autotrigger attribute on Node class
+    pure: bool
+        See pure attribute on Node class
+    process: bool
+        See process attribute on Node class
+    batch: bool
+        See batch attribute on Node class
+    function_arg_spec: FullArgSpec
+        Argument spec of the function
+    inputs: Tuple[Tuple[str, type, bool, bool]]
+        Name, type, hidden and optional flags of each input, in the order of the
+        annotations of the function
+    outputs: Tuple[Tuple[Any, type, Callable]]
+        Name, type and compiled validator (see pineapple_core.core.validators)
+        of each output
+    allow_args: bool
+        Whether the function accepts variadic unnamed arguments
+    allow_kwargs: bool
+        Whether the function accepts variadic named arguments
+    is_aware: bool
+        Whether the function receives the Node itself (self argument)
+    """
+
+    __slots__ = (
+        "function",
+        "module",
+        "name",
+        "autotrigger",
+        "pure",
+        "process",
+        "batch",
+        "function_arg_spec",
+        "inputs",
+        "outputs",
+        "allow_args",
+        "allow_kwargs",
+        "is_aware",
+    )
+
+    def __init__(
+        self,
+        function: Callable,
+        module: str,
+        name: str,
+        autotrigger: bool,
+        pure: bool = False,
+        process: bool = False,
+        batch: bool = False,
+    ):
+        """NodeModel constructor, introspects the function
+
+        Parameters
+        ==========
+        function: Callable
+            The function of the Nodes
+        module: str
+            Module of the Nodes
+        name: str
+            Name of the Nodes
+        autotrigger: bool
+            See autotrigger attribute on Node class
+        pure: bool [False]
+            See pure attribute on Node class
+        process: bool [False]
+            See process attribute on Node class
+        batch: bool [False]
+            See batch attribute on Node class
+
+        Raises
+        ======
+        InvalidNodeFunctionReturnTypeError:
+            If the return annotation of the function is not valid
+        """
+        function_arg_spec = getfullargspec(function)
+        variadic_names = ["return", function_arg_spec.varargs, function_arg_spec.varkw]
+        inputs = tuple(
+            (
+                input_name,
+                value.underlying_type if isinstance(value, InputFlag) else value,
+                contains_flag(value, Hidden),
+                contains_flag(value, Optional),
+            )
+            for input_name, value in function.__annotations__.items()
+            if input_name not in variadic_names
+        )
+        for attribute, value in (
+            ("function", function),
+            ("module", module),
+            ("name", name),
+            ("autotrigger", autotrigger),
+            ("pure", pure),
+            ("process", process),
+            ("batch", batch),
+            ("function_arg_spec", function_arg_spec),
+            ("inputs", inputs),
+            ("outputs", ()),
+            ("allow_args", function_arg_spec.varargs is not None),
+            ("allow_kwargs", function_arg_spec.varkw is not None),
+            ("is_aware", any(input_name == "self" for input_name, *_ in inputs)),
+        ):
+            object.__setattr__(self, attribute, value)
+        object.__setattr__(
+            self,
+            "outputs",
+            tuple(
+                (key, output_type, compile_validator(output_type))
+                for key, output_type in self._build_return_types().items()
+            ),
+        )
+
+    def _build_return_types(self) -> Dict[Any, Any]:
+        return_types = self.function.__annotations__.get("return")
+        if isinstance(return_types, (list, tuple)):
+            return {key: value for key, value in enumerate(return_types)}
+        if isinstance(return_types, (PineappleType, type)):
+            return {"out": return_types}
+        if return_types is None:
+            return {}
+        if not isinstance(return_types, dict):
+            raise InvalidNodeFunctionReturnTypeError(self, self.function)
+        return return_types
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"NodeModel {self.full_name()} is immutable")
+
+    def __copy__(self) -> "NodeModel":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "NodeModel":
+        return self
+
+    def full_name(self) -> str:
+        """Returns a string that represents the full name of the model
+
+        Returns
+        =======
+        str:
+            A string that is composed of module.name
+        """
+        return f"{self.module}.{self.name}"
+
+    def create(self) -> "Node":
+        """Creates a new Node from the model
+
+        Returns
+        =======
+        Node:
+            Reference to the newly created Node
+        """
+        from pineapple_core.core.node import Node
+
+        return Node(
+            self.function,
+            self.module,
+            self.name,
+            self.autotrigger,
+            self.pure,
+            self.process,
+            self.batch,
+            model=self,
+        )
+
+    def dump(self) -> Dict[str, Any]:
+        """Dumps the model like the passive representation of a Node (see Node.dump)
+
+        Returns
+        =======
+        dict:
+            A dictionnary containing all the fields that defines a Node
+        """
+        return self.create().dump(False)
+
+    def __repr__(self) -> str:
+        return f"NodeModel({self.full_name()})"
+
+
+def get_node_model(
+    function: Callable,
+    module: str,
+    name: str,
+    autotrigger: bool,
+    pure: bool = False,
+    process: bool = False,
+    batch: bool = False,
+) -> NodeModel:
+    """Gets the NodeModel of a function, it is only computed the first time.
+    Models are cached in the __dict__ of the function so they are released along
+    with it (other callables are introspected every time)
+
+    Parameters
+    ==========
+    function: Callable
+        The function of the Nodes
+    module: str
+        Module of the Nodes
+    name: str
+        Name of the Nodes
+    autotrigger: bool
+        See autotrigger attribute on Node class
+    pure: bool [False]
+        See pure attribute on Node class
+    process: bool [False]
+        See process attribute on Node class
+    batch: bool [False]
+        See batch attribute on Node class
+
+    Returns
+    =======
+    NodeModel:
+        The model of the Nodes
+    """
+    if not isfunction(function):
+        return NodeModel(function, module, name, autotrigger, pure, process, batch)
+    models = function.__dict__.get(_MODELS_ATTRIBUTE)
+    # functools.wraps copies the __dict__ of the wrapped function, its models included
+    if models is None or any(model.function is not function for model in models.values()):
+        models = function.__dict__[_MODELS_ATTRIBUTE] = {}
+    key = (module, name, autotrigger, pure, process, batch)
+    if key not in models:
+        models[key] = NodeModel(function, module, name, autotrigger, pure, process, batch)
+    return models[key]
@@ -3,18 +3,14 @@
 This module contains the NodeOutput class.
 """
 
-import sys
-from typing import Any, Dict
-from uuid import uuid4
+from typing import Any, Callable, Dict
+from uuid import UUID, uuid4
 
-from klotan import match
-
-from pineapple_core.core.exceptions import InvalidNodeOutputTypeError
+from pineapple_core.core.epoch import next_stamp
+from pineapple_core.core.runs import RunState
+from pineapple_core.core.type_checks import get_type_check_policy
 from pineapple_core.core.types import PineappleType
-from pineapple_core.utils.klotan_adapter import (
-    type_dict_to_klotan_dict,
-    type_list_to_klotan_list,
-)
+from pineapple_core.core.validators import compile_validator
 
 
 class NodeOutput:
@@ -24,22 +20,59 @@ class NodeOutput:
     Attributes
     ----------
     id: uuid.UUID
-        An unique ID generated on the NodeOutput creation
+        An unique ID generated the first time it is needed
     name: str
         Name of the output
     output_type: type
         Will check if the type of value set on the output
         is equal to output_type
+    validator: Callable[[Any], bool]
+        The output_type compiled once (see pineapple_core.core.validators)
+    checks: int
+        Amount of values set, used by the sampled type check policy
     value: Any
         Can be of any type, it holds the current value of the output
+    stamp: int
+        Stamp (see pineapple_core.core.epoch) of the last time a value was set
     """
 
-    def __init__(self, node: "Node", name: str, output_type: type):
-        self.id = uuid4()
+    __slots__ = (
+        "_id",
+        "node",
+        "name",
+        "output_type",
+        "validator",
+        "checks",
+        "value_template",
+        "stamp_template",
+    )
+
+    value = RunState()
+    stamp = RunState()
+
+    def __init__(
+        self, node: "Node", name: str, output_type: type, validator: Callable = None
+    ):
+        self._id = None
         self.node = node
         self.name = name
         self.output_type = output_type
+        self.validator = (
+            validator if validator is not None else compile_validator(output_type)
+        )
+        self.checks = 0
         self.value = None
+        self.stamp = 0
+
+    @property
+    def id(self) -> UUID:
+        if self._id is None:
+            self._id = uuid4()
+        return self._id
+
+    @id.setter
+    def id(self, id: UUID):
+        self._id = id
 
     def get(self) -> Any:
         """
@@ -51,16 +84,17 @@ class NodeOutput:
         """
         Sets the value of the contained value of the NodeOutput
         It will raise an exception if the type of the new value
-        is not equal to output_type
+        is not equal to output_type, depending on the type check policy
+        of the Node (see pineapple_core.core.type_checks)
 
         Parameters
         ----------
         value : any
             Value that will be set to the NodeOutput
         """
-        if not _type_check(self.output_type, value):
-            raise InvalidNodeOutputTypeError(self, value)
+        get_type_check_policy(self.node).check(self, value)
         self.value = value
+        self.stamp = next_stamp()
 
     def __repr__(self) -> str:
         """
@@ -113,7 +147,9 @@ class NodeOutput:
         NodeOutput:
             Reference to the newly copied NodeOutput
         """
-        node_output_copy = NodeOutput(self.node, self.name, self.output_type)
+        node_output_copy = NodeOutput(
+            self.node, self.name, self.output_type, self.validator
+        )
         node_output_copy.id = self.id
         node_output_copy.value = self.value
         return node_output_copy
@@ -124,28 +160,3 @@ def check_pineapple_type(base: PineappleType, value: Any) -> bool:
         return False
     else:
         return True
-
-
-def _type_check(base: Any, value: Any) -> bool:
-    if isinstance(base, PineappleType):
-        if not check_pineapple_type(base, value):
-            return False
-    elif isinstance(base, (list, tuple, dict)):
-        if isinstance(base, (list, tuple)):
-            base = type_list_to_klotan_list(base)
-        elif isinstance(base, dict):
-            base = type_dict_to_klotan_dict(base)
-        match_result = match.match(base, value)
-        if not match_result.is_valid():
-            print(f"Invalid type matching {match_result.to_string()}", file=sys.stderr)
-            return False
-    elif (
-        not type(value) == base
-    ):  # Don't change this to isinstance (typing incompatibility)
-        result = False
-        try:
-            result = isinstance(value, base.__args__)
-        except AttributeError:
-            return False
-        return result
-    return True
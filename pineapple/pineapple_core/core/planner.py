@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+"""This module contains everything that is related to execution plans.
+An ExecutionPlan is the compiled list of autotrigger Nodes that have to be triggered
+(in topological order) before a Node can execute its function.
+Plans are cached on the Nodes and invalidated whenever the graph changes.
+"""
+
+import asyncio
+from concurrent.futures import Executor, wait
+from contextlib import ExitStack
+from contextvars import copy_context
+from typing import Any, List
+
+from pineapple_core.core.exceptions import AutotriggerCycleError
+from pineapple_core.core.node_output import NodeOutput
+
+_graph_version = 0
+
+
+def invalidate_plans():
+    """Invalidates every compiled ExecutionPlan.
+    Should be called every time the graph changes (inputs connected, flows connected,
+    outputs added), plans will be compiled again on their next use.
+    """
+    global _graph_version
+    _graph_version += 1
+
+
+class PlanStep:
+    """Class that represents a single autotrigger in an ExecutionPlan
+
+    Attributes
+    ==========
+    node: Node
+        Reference to the Node that needs the value
+    node_input: NodeInput
+        Reference to the NodeInput that requires the value
+    autotriggered_node: Node
+        Reference to the Node to trigger
+    sources: List[NodeOutput]
+        NodeOutputs the autotriggered Node reads its values from
+    level: int
+        Length of the longest chain of autotriggered Nodes the autotriggered Node
+        depends on, steps with the same level are independent from each other
+    """
+
+    __slots__ = ("node", "node_input", "autotriggered_node", "sources", "level")
+
+    def __init__(self, node: "Node", node_input: "NodeInput", autotriggered_node: "Node"):
+        self.node = node
+        self.node_input = node_input
+        self.autotriggered_node = autotriggered_node
+        self.sources = get_sources(autotriggered_node)
+        self.level = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"PlanStep({self.node}[{self.node_input.name}] <= {self.autotriggered_node})"
+        )
+
+
+class ExecutionPlan:
+    """Class that represents the compiled autotrigger dependencies of a Node
+
+    Attributes
+    ==========
+    node: Node
+        Reference to the Node the plan was compiled for
+    version: int
+        Version of the graph when the plan was compiled
+    steps: List[PlanStep]
+        Autotriggers to execute, each autotriggered Node comes after
+        all the autotriggered Nodes it depends on
+    levels: List[List[PlanStep]]
+        Steps grouped by level, all the steps of a level can be executed concurrently
+        once the previous levels are done
+    """
+
+    __slots__ = ("node", "version", "steps", "levels")
+
+    def __init__(self, node: "Node", steps: List[PlanStep]):
+        """ExecutionPlan constructor
+
+        Parameters
+        ==========
+        node: Node
+            Reference to the Node the plan was compiled for
+        steps: List[PlanStep]
+            Autotriggers to execute in topological order
+        """
+        self.node = node
+        self.version = _graph_version
+        self.steps = steps
+        self.levels = []
+        for step in steps:
+            while len(self.levels) <= step.level:
+                self.levels.append([])
+            self.levels[step.level].append(step)
+
+    def is_valid(self) -> bool:
+        """Checks whether the graph changed since the plan was compiled
+
+        Returns
+        =======
+        bool:
+            True if the plan can still be used, False otherwise
+        """
+        return self.version == _graph_version
+
+    def execute(self, executor: Executor = None):
+        """Triggers all the autotriggered Nodes of the plan, in order.
+        The inputs of the autotriggered Nodes are already resolved by
+        the previous steps so they are triggered without resolving them again.
+        Autotriggered Nodes that are still fresh for the current evaluation epoch
+        are skipped.
+        The plan_lock of an autotriggered Node is held from its freshness check to the
+        end of its execution : when several threads need the same Node (parallel
+        Flows sharing an autotrigger dependency) the first one executes it and the
+        other ones wait and find it fresh.
+
+        Parameters
+        ==========
+        executor: Executor [None]
+            If given, the steps of a same level are independent so they are
+            submitted concurrently to the executor. trigger_input callbacks are still
+            called in the order of the steps and if several steps fail,
+            the Exception of the first one is raised.
+        """
+        from pineapple_core.core.scheduler import FlowScheduler
+
+        if executor is None:
+            for step in self.steps:
+                with step.autotriggered_node.plan_lock:
+                    if step.autotriggered_node.is_fresh(step.sources):
+                        continue
+                    if step.node.on.trigger_input:
+                        step.node.on.trigger_input(
+                            step.node, step.node_input, step.autotriggered_node
+                        )
+                    FlowScheduler(step.autotriggered_node, resolve_inputs=False).run()
+            return
+
+        for level in self.levels:
+            # Locks are always taken in the same order so that two plans sharing
+            # several Nodes of a level can't wait for each other
+            with ExitStack() as locks:
+                for step in sorted(level, key=lambda step: id(step.autotriggered_node)):
+                    locks.enter_context(step.autotriggered_node.plan_lock)
+                self._execute_level(level, executor)
+
+    def _execute_level(self, level: List[PlanStep], executor: Executor):
+        """Triggers the autotriggered Nodes of a level that are not fresh concurrently,
+        the plan_locks of all the Nodes of the level are held by the caller
+
+        Parameters
+        ==========
+        level: List[PlanStep]
+            Independent steps to execute
+        executor: Executor
+            Executor the steps are submitted to when there are several of them
+        """
+        from pineapple_core.core.scheduler import FlowScheduler
+
+        steps = [step for step in level if not step.autotriggered_node.is_fresh(step.sources)]
+        for step in steps:
+            if step.node.on.trigger_input:
+                step.node.on.trigger_input(step.node, step.node_input, step.autotriggered_node)
+        if len(steps) == 1:
+            FlowScheduler(steps[0].autotriggered_node, resolve_inputs=False).run()
+            return
+        futures = [
+            executor.submit(
+                copy_context().run,
+                FlowScheduler(step.autotriggered_node, resolve_inputs=False).run,
+            )
+            for step in steps
+        ]
+        wait(futures)
+        for future in futures:
+            future.result()
+
+    async def aexecute(self):
+        """Asynchronous version of execute, the steps of a same level are
+        independent so they are awaited concurrently.
+        trigger_input callbacks are called in the order of the steps and if several
+        steps fail, the Exception of the first one is raised.
+        """
+        from pineapple_core.core.scheduler import AsyncFlowScheduler
+
+        for level in self.levels:
+            steps = [
+                step for step in level if not step.autotriggered_node.is_fresh(step.sources)
+            ]
+            for step in steps:
+                if step.node.on.trigger_input:
+                    step.node.on.trigger_input(
+                        step.node, step.node_input, step.autotriggered_node
+                    )
+            results = await asyncio.gather(
+                *[
+                    AsyncFlowScheduler(step.autotriggered_node, resolve_inputs=False).run()
+                    for step in steps
+                ],
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+    def __repr__(self) -> str:
+        return f"ExecutionPlan({self.node}, steps={self.steps})"
+
+
+def get_autotrigger_dependencies(node: "Node") -> List[Any]:
+    """Lists the autotrigger Nodes a Node directly depends on
+
+    Parameters
+    ==========
+    node: Node
+        Reference to the Node you want to get the dependencies of
+
+    Returns
+    =======
+    List[Tuple[NodeInput, Node]]:
+        Couples of NodeInput and the autotrigger Node that provides its value,
+        in the order the inputs are declared
+    """
+    from pineapple_core.core.node import Node, OutputWrapper
+
+    dependencies = []
+    for node_input in node._find_all_possible_inputs():
+        if node_input.connected_output:
+            if node_input.connected_output.node.autotrigger:
+                dependencies.append((node_input, node_input.connected_output.node))
+        elif isinstance(node_input.value, OutputWrapper):
+            for item in node_input.value.template.references:
+                base_node = item.node if isinstance(item, NodeOutput) else item
+                if isinstance(base_node, Node) and base_node.autotrigger:
+                    dependencies.append((node_input, base_node))
+    return dependencies
+
+
+def get_sources(node: "Node") -> List[NodeOutput]:
+    """Lists the NodeOutputs a Node reads its values from, through connected
+    NodeInputs or NodeOutputs / Nodes wrapped in the values of its NodeInputs
+
+    Parameters
+    ==========
+    node: Node
+        Reference to the Node you want to get the sources of
+
+    Returns
+    =======
+    List[NodeOutput]:
+        NodeOutputs the Node depends on
+    """
+    from pineapple_core.core.node import Node, OutputWrapper
+
+    sources = []
+    for node_input in node._find_all_possible_inputs():
+        if node_input.connected_output:
+            sources.append(node_input.connected_output)
+        elif isinstance(node_input.value, OutputWrapper):
+            for item in node_input.value.template.references:
+                if isinstance(item, NodeOutput):
+                    sources.append(item)
+                elif isinstance(item, Node):
+                    sources.extend(item.outputs.values())
+    return sources
+
+
+def compile_plan(node: "Node") -> ExecutionPlan:
+    """Compiles the ExecutionPlan of a Node.
+    The autotrigger dependencies are walked depth-first with an explicit stack,
+    every autotriggered Node appears once, after all its own dependencies.
+
+    Parameters
+    ==========
+    node: Node
+        Reference to the Node you want to compile the plan of
+
+    Returns
+    =======
+    ExecutionPlan:
+        The compiled plan
+
+    Raises
+    ======
+    AutotriggerCycleError:
+        If an autotriggered Node depends (directly or not) on itself
+    """
+    steps = []
+    done = {}
+    in_progress = {node: None}
+    dependencies = get_autotrigger_dependencies(node)
+    stack = [(None, dependencies, iter(dependencies))]
+    while stack:
+        step, dependencies, remaining_dependencies = stack[-1]
+        for node_input, autotriggered_node in remaining_dependencies:
+            if autotriggered_node in in_progress:
+                cycle = list(in_progress)
+                cycle = cycle[cycle.index(autotriggered_node):] + [autotriggered_node]
+                raise AutotriggerCycleError(node, cycle)
+            if autotriggered_node in done:
+                continue
+            in_progress[autotriggered_node] = None
+            next_dependencies = get_autotrigger_dependencies(autotriggered_node)
+            stack.append(
+                (
+                    PlanStep(node_input.node, node_input, autotriggered_node),
+                    next_dependencies,
+                    iter(next_dependencies),
+                )
+            )
+            break
+        else:
+            stack.pop()
+            in_progress.popitem()
+            if step is not None:
+                step.level = max(
+                    [done[dependency] + 1 for _, dependency in dependencies], default=0
+                )
+                done[step.autotriggered_node] = step.level
+                steps.append(step)
+    return ExecutionPlan(node, steps)
+
+
+def get_plan(node: "Node") -> ExecutionPlan:
+    """Gets the cached ExecutionPlan of a Node, compiles it if the graph changed
+
+    Parameters
+    ==========
+    node: Node
+        Reference to the Node you want to get the plan of
+
+    Returns
+    =======
+    ExecutionPlan:
+        A valid plan for the current graph
+    """
+    if node.plan is None or not node.plan.is_valid():
+        node.plan = compile_plan(node)
+    return node.plan
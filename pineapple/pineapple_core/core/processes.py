@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""This module contains everything that is related to running Node functions
+in other processes.
+Node functions are not pickled directly (the @node decorator replaces them by the
+Node factory), a worker process finds them back through the model_store
+using the module of the function and the name of the Node model.
+"""
+
+import importlib
+import inspect
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List
+
+from pineapple_core.core.exceptions import InvalidProcessNodeError
+from pineapple_core.core.store import model_store
+
+_process_pool = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Gets the ProcessPoolExecutor used by the Nodes running in other processes,
+    a default one (one worker per CPU) is created on first use
+
+    Returns
+    =======
+    ProcessPoolExecutor:
+        The process pool shared by all the Nodes
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor()
+    return _process_pool
+
+
+def set_process_pool(process_pool: ProcessPoolExecutor):
+    """Replaces the ProcessPoolExecutor used by the Nodes running in other processes
+    (to configure the amount of workers for example)
+
+    Parameters
+    ==========
+    process_pool: ProcessPoolExecutor
+        The process pool to use from now on
+    """
+    global _process_pool
+    _process_pool = process_pool
+
+
+def check_process_node(node: "Node"):
+    """Checks whether the function of a Node can be executed in another process
+
+    Parameters
+    ==========
+    node: Node
+        Reference to the Node to check
+
+    Raises
+    ======
+    InvalidProcessNodeError:
+        If the function can't be found back by a worker process
+    """
+    function = node.function
+    if node.is_aware:
+        raise InvalidProcessNodeError(node, "the function needs the Node itself (self)")
+    if inspect.iscoroutinefunction(function) or inspect.isgeneratorfunction(function):
+        raise InvalidProcessNodeError(node, "the function is asynchronous or a generator")
+    if "<" in function.__qualname__:
+        raise InvalidProcessNodeError(
+            node, "the function is not defined at the top-level of its module"
+        )
+    model = model_store.get(f"{node.module}.{node.name}")
+    if model is None or model.function is not function:
+        raise InvalidProcessNodeError(
+            node, "the function is not the registered model of the Node"
+        )
+
+
+def run_node_function(
+    module_name: str, model_name: str, args: List[Any], kwargs: Dict[str, Any]
+) -> Any:
+    """Function for internal use only
+    Executed in a worker process, finds back the function of a Node model and calls it
+
+    Parameters
+    ==========
+    module_name: str
+        Module where the function is defined
+    model_name: str
+        Name of the Node model in the model_store
+    args: List[Any]
+        Positional arguments of the function
+    kwargs: Dict[str, Any]
+        Named arguments of the function
+
+    Returns
+    =======
+    Any:
+        Result of the function
+    """
+    if model_name not in model_store:
+        importlib.import_module(module_name)
+    return model_store[model_name].function(*args, **kwargs)
+
+
+def submit_node_function(
+    node: "Node", args: List[Any], kwargs: Dict[str, Any]
+) -> Future:
+    """Submits the function of a Node to the process pool
+
+    Parameters
+    ==========
+    node: Node
+        Reference to the Node whose function has to be called
+    args: List[Any]
+        Positional arguments of the function (they have to be picklable)
+    kwargs: Dict[str, Any]
+        Named arguments of the function (they have to be picklable)
+
+    Returns
+    =======
+    Future:
+        Future holding the result of the function
+    """
+    return get_process_pool().submit(
+        run_node_function,
+        node.function.__module__,
+        f"{node.module}.{node.name}",
+        args,
+        kwargs,
+    )
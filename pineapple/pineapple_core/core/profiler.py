@@ -0,0 +1,423 @@
+# -*- coding: utf-8 -*-
+"""This module contains everything that is related to the profiling of scenarios.
+A Profiler subscribes to the execution hooks (see pineapple_core.core.hooks) and
+records the nested frames of the triggers with their timings, every frame is
+labelled with the full name of its Node :
+    - "Module.Name(id)": whole trigger of the Node
+    - "Module.Name(id) [inputs]": resolution of the inputs, the triggers of the
+      autotriggered Nodes (backtriggers) are nested in it
+    - "Module.Name(id) [function]": function of the Node
+    - "Module.Name(id) [set outputs]": setting of the result in the NodeOutputs,
+      where the type checks happen
+    - "Module.Name(id) [flow]": scheduling of a Flow of the Node, until the Node
+      of the Flow is triggered
+Flows are recorded one after another instead of being nested in each other so long
+chains of flows and loops don't create deep stacks.
+Each thread (and asyncio task) has its own timeline. The profile can be exported as
+a speedscope file (https://www.speedscope.app) or as folded stacks (flamegraph.pl),
+the folded stacks sum all the triggers recorded by the Profiler so profiling many
+iterations of a scenario aggregates them.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Tuple
+
+from pineapple_core.core.hooks import HookRegistry, global_hooks
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+_LABELS = {
+    "trigger": "{}",
+    "inputs": "{} [inputs]",
+    "function": "{} [function]",
+    "outputs": "{} [set outputs]",
+    "flow": "{} [flow]",
+}
+
+
+class ProfileTimeline:
+    """Class that holds the frames recorded on a single thread (or asyncio task)
+
+    Attributes
+    ==========
+    name: str
+        Name of the thread (or asyncio task)
+    stack: List[List[Any]]
+        Frames that are currently open : index of the frame, start, time spent
+        in the nested frames, Node and kind of the frame
+    events: List[Tuple[str, int, float]]
+        Opening ("O") and closing ("C") of the frames with their index and time,
+        only kept when the Profiler records timelines
+    folded: Counter
+        Self time of the frames in seconds, by stack of frame indexes
+    last: float
+        Time of the last recorded event
+    """
+
+    __slots__ = ("name", "stack", "events", "folded", "last")
+
+    def __init__(self, name: str):
+        """ProfileTimeline constructor
+
+        Parameters
+        ==========
+        name: str
+            Name of the thread (or asyncio task)
+        """
+        self.name = name
+        self.stack = []
+        self.events = []
+        self.folded = Counter()
+        self.last = None
+
+
+class Profiler:
+    """Class that records the triggers of the Nodes between start and stop
+    (it can also be used as a context manager), see the documentation of the module
+
+    Attributes
+    ==========
+    registry: HookRegistry
+        Registry the Profiler subscribes to, the global one observes every Node
+    timeline: bool
+        Whether the opening and closing of every frame is kept, needed to export
+        the timelines to speedscope. Without timeline only the folded stacks are kept
+        so the memory used doesn't grow with the amount of triggers
+    frames: List[str]
+        Labels of the frames, by index
+    timelines: Dict[Any, ProfileTimeline]
+        Timeline of each thread (or asyncio task)
+    start_time: float
+        perf_counter when the Profiler was started
+    end_time: float
+        perf_counter when the Profiler was stopped
+    """
+
+    __slots__ = (
+        "registry",
+        "timeline",
+        "frames",
+        "timelines",
+        "start_time",
+        "end_time",
+        "_frame_indexes",
+        "_lock",
+        "_hooks",
+    )
+
+    def __init__(self, registry: HookRegistry = None, timeline: bool = True):
+        """Profiler constructor
+
+        Parameters
+        ==========
+        registry: HookRegistry [None]
+            Registry to subscribe to, global_hooks if None
+        timeline: bool [True]
+            Whether the opening and closing of every frame is kept
+        """
+        self.registry = registry if registry is not None else global_hooks
+        self.timeline = timeline
+        self.frames = []
+        self.timelines = {}
+        self.start_time = None
+        self.end_time = None
+        self._frame_indexes = {}
+        self._lock = threading.Lock()
+        self._hooks = {
+            "after_flow": self._on_after_flow,
+            "before_flow": self._on_before_flow,
+            "failure": self._on_failure,
+            "function_start": self._on_function_start,
+            "outputs_set": self._on_outputs_set,
+            "trigger_end": self._on_trigger_end,
+            "trigger_start": self._on_trigger_start,
+        }
+
+    def start(self) -> "Profiler":
+        """Starts recording
+
+        Returns
+        =======
+        Profiler:
+            The Profiler itself
+        """
+        if self.start_time is None:
+            self.start_time = time.perf_counter()
+        self.end_time = None
+        for event, hook in self._hooks.items():
+            self.registry.subscribe(event, hook)
+        return self
+
+    def stop(self) -> "Profiler":
+        """Stops recording, the frames that are still open are closed
+
+        Returns
+        =======
+        Profiler:
+            The Profiler itself
+        """
+        for event, hook in self._hooks.items():
+            self.registry.unsubscribe(event, hook)
+        self.end_time = time.perf_counter()
+        for timeline in self.timelines.values():
+            while timeline.stack:
+                self._pop(timeline, self.end_time)
+        return self
+
+    def __enter__(self) -> "Profiler":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any):
+        self.stop()
+
+    def folded_stacks(self) -> Dict[Tuple[str, ...], float]:
+        """Sums the self time of the frames of all the timelines
+
+        Returns
+        =======
+        Dict[Tuple[str, ...], float]:
+            Self time in seconds by stack of frame labels (outermost first)
+        """
+        return {
+            tuple(self.frames[index] for index in stack): duration
+            for stack, duration in self._merge_folded().items()
+        }
+
+    def to_folded(self) -> str:
+        """Exports the profile as folded stacks, one line per stack with
+        its self time in microseconds (stacks below a microsecond are omitted)
+
+        Returns
+        =======
+        str:
+            The folded stacks
+        """
+        lines = []
+        for stack, duration in sorted(self.folded_stacks().items()):
+            microseconds = round(duration * 1e6)
+            if microseconds:
+                labels = ";".join(label.replace(";", ",") for label in stack)
+                lines.append(f"{labels} {microseconds}\n")
+        return "".join(lines)
+
+    def to_speedscope(self, name: str = "pineapple") -> Dict[str, Any]:
+        """Exports the profile in the speedscope file format, with an evented profile
+        by timeline or a single sampled profile of the folded stacks when
+        the Profiler does not keep timelines
+
+        Parameters
+        ==========
+        name: str ["pineapple"]
+            Name of the profile
+
+        Returns
+        =======
+        dict:
+            The speedscope file (trivially convertable to JSON)
+        """
+        profiles = (
+            [self._evented_profile(timeline) for timeline in list(self.timelines.values())]
+            if self.timeline
+            else [self._sampled_profile(name)]
+        )
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "shared": {"frames": [{"name": label} for label in self.frames]},
+            "profiles": profiles,
+            "name": name,
+            "activeProfileIndex": 0,
+            "exporter": "pineapple",
+        }
+
+    def write_folded(self, path: str):
+        """Writes the folded stacks in a file (see to_folded)
+
+        Parameters
+        ==========
+        path: str
+            Path of the file
+        """
+        with open(path, "w") as folded_file:
+            folded_file.write(self.to_folded())
+
+    def write_speedscope(self, path: str, name: str = "pineapple"):
+        """Writes the speedscope file (see to_speedscope)
+
+        Parameters
+        ==========
+        path: str
+            Path of the file
+        name: str ["pineapple"]
+            Name of the profile
+        """
+        with open(path, "w") as speedscope_file:
+            json.dump(self.to_speedscope(name), speedscope_file)
+
+    def _evented_profile(self, timeline: ProfileTimeline) -> Dict[str, Any]:
+        origin = self.start_time
+        end = (self.end_time if self.end_time is not None else time.perf_counter()) - origin
+        events = [
+            {"type": kind, "frame": frame, "at": at - origin}
+            for kind, frame, at in list(timeline.events)
+        ]
+        events.extend(
+            {"type": "C", "frame": entry[0], "at": end} for entry in reversed(timeline.stack)
+        )
+        return {
+            "type": "evented",
+            "name": timeline.name,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": end,
+            "events": events,
+        }
+
+    def _sampled_profile(self, name: str) -> Dict[str, Any]:
+        total = self._merge_folded()
+        samples, weights = list(total.keys()), list(total.values())
+        return {
+            "type": "sampled",
+            "name": name,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": [list(stack) for stack in samples],
+            "weights": weights,
+        }
+
+    def _merge_folded(self) -> Counter:
+        total = Counter()
+        for timeline in list(self.timelines.values()):
+            total.update(timeline.folded)
+        return total
+
+    def _frame(self, node: "Node", kind: str) -> int:
+        key = (node, kind)
+        index = self._frame_indexes.get(key)
+        if index is None:
+            with self._lock:
+                index = self._frame_indexes.get(key)
+                if index is None:
+                    index = len(self.frames)
+                    self.frames.append(_LABELS[kind].format(node.full_name()))
+                    self._frame_indexes[key] = index
+        return index
+
+    def _get_timeline(self) -> ProfileTimeline:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key = ("task", id(task)) if task is not None else ("thread", threading.get_ident())
+        timeline = self.timelines.get(key)
+        if timeline is None:
+            with self._lock:
+                name = threading.current_thread().name
+                if task is not None:
+                    name = f"{name} (task {id(task):x})"
+                timeline = self.timelines.setdefault(key, ProfileTimeline(name))
+        return timeline
+
+    def _push(self, timeline: ProfileTimeline, node: "Node", kind: str, at: float):
+        frame = self._frame(node, kind)
+        timeline.stack.append([frame, at, 0.0, node, kind])
+        timeline.last = at
+        if self.timeline:
+            timeline.events.append(("O", frame, at))
+
+    def _pop(self, timeline: ProfileTimeline, at: float):
+        stack = timeline.stack
+        frame, start, nested, *_ = stack.pop()
+        duration = at - start
+        timeline.folded[tuple(entry[0] for entry in stack) + (frame,)] += max(
+            duration - nested, 0.0
+        )
+        if stack:
+            stack[-1][2] += duration
+        timeline.last = at
+        if self.timeline:
+            timeline.events.append(("C", frame, at))
+
+    def _pop_until(self, timeline: ProfileTimeline, node: "Node", kind: str, at: float):
+        stack = timeline.stack
+        for position in range(len(stack) - 1, -1, -1):
+            if stack[position][3] is node and stack[position][4] == kind:
+                while len(stack) > position:
+                    self._pop(timeline, at)
+                return
+
+    def _pop_flows(self, timeline: ProfileTimeline, at: float):
+        while timeline.stack and timeline.stack[-1][4] == "flow":
+            self._pop(timeline, at)
+
+    def _on_trigger_start(self, node: "Node"):
+        at, timeline = time.perf_counter(), self._get_timeline()
+        self._pop_flows(timeline, at)
+        self._push(timeline, node, "trigger", at)
+        self._push(timeline, node, "inputs", at)
+
+    def _on_function_start(self, node: "Node"):
+        at, timeline = time.perf_counter(), self._get_timeline()
+        self._pop_until(timeline, node, "inputs", at)
+        self._push(timeline, node, "function", at)
+
+    def _on_outputs_set(self, node: "Node", duration: float):
+        at, timeline = time.perf_counter(), self._get_timeline()
+        start = at - duration
+        if timeline.last is not None and start < timeline.last:
+            start = timeline.last
+        self._push(timeline, node, "outputs", start)
+        self._pop(timeline, at)
+
+    def _on_trigger_end(self, node: "Node", duration: float):
+        at, timeline = time.perf_counter(), self._get_timeline()
+        self._pop_until(timeline, node, "trigger", at)
+
+    def _on_failure(self, node: "Node", exception: Exception):
+        at, timeline = time.perf_counter(), self._get_timeline()
+        self._pop_until(timeline, node, "trigger", at)
+
+    def _on_before_flow(self, node: "Node", flow: "Flow"):
+        at, timeline = time.perf_counter(), self._get_timeline()
+        self._pop_flows(timeline, at)
+        self._push(timeline, node, "flow", at)
+
+    def _on_after_flow(self, node: "Node", flow: "Flow"):
+        at, timeline = time.perf_counter(), self._get_timeline()
+        self._pop_flows(timeline, at)
+
+    def __repr__(self) -> str:
+        return f"Profiler(frames={len(self.frames)}, timelines={len(self.timelines)})"
+
+
+def profile_scenario(
+    start_node: "Node",
+    iterations: int = 1,
+    timeline: bool = True,
+    registry: HookRegistry = None,
+) -> Profiler:
+    """Triggers a scenario several times while profiling it
+
+    Parameters
+    ==========
+    start_node: Node
+        Starting Node of the scenario
+    iterations: int [1]
+        Amount of triggers of the scenario, they are aggregated in the profile
+    timeline: bool [True]
+        Whether the Profiler keeps the timelines (see Profiler)
+    registry: HookRegistry [None]
+        Registry the Profiler subscribes to, global_hooks if None
+
+    Returns
+    =======
+    Profiler:
+        The stopped Profiler holding the profile
+    """
+    with Profiler(registry, timeline) as profiler:
+        for _ in range(iterations):
+            start_node.trigger()
+    return profiler
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""This module contains everything that is related to runs of scenario templates.
+A ScenarioTemplate shares its Nodes (structure, functions and types) between many runs,
+each run only holds its own state in a RunContext : values of the NodeInputs and
+NodeOutputs, Flows of the Nodes (so enabling or disabling a Flow only affects the run),
+trigger logs and stamps.
+Attributes that belong to the runs are declared with the RunState descriptor, they are
+read from and written to the active RunContext (stored in a context variable)
+and fall back on the attribute of the object itself when the run did not set them.
+Outside of any run, RunState attributes behave like plain attributes.
+"""
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from operator import attrgetter
+from typing import Any, Callable, Iterator
+
+_current_run = ContextVar("pineapple_current_run", default=None)
+
+
+class RunState:
+    """Descriptor of an attribute whose value belongs to the active RunContext.
+    The value of the object itself is stored in its __dict__, or in the slot named
+    like the attribute followed by "_template" when the class defines __slots__
+
+    Attributes
+    ==========
+    name: str
+        Name of the attribute
+    copy: Callable
+        Function used to copy the value of the object the first time a run reads it,
+        needed for mutable values that are modified in place (None to share the value)
+    """
+
+    def __init__(self, copy: Callable = None):
+        """RunState constructor
+
+        Parameters
+        ==========
+        copy: Callable [None]
+            Function used to copy the value of the object the first time a run reads it
+        """
+        self.name = None
+        self.copy = copy
+        self._slot = None
+        self._get_template = None
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+        self._slot = owner.__dict__.get(f"{name}_template")
+        if self._slot is not None:
+            self._get_template = attrgetter(f"{name}_template")
+        else:
+            self._get_template = lambda instance: instance.__dict__[name]
+
+    def __get__(self, instance: Any, owner: type = None) -> Any:
+        if instance is None:
+            return self
+        run = _current_run.get()
+        if run is None:
+            return self._get_template(instance)
+        state = run.states.get(instance)
+        if state is not None and self.name in state:
+            return state[self.name]
+        value = self._get_template(instance)
+        if self.copy is not None:
+            value = self.copy(value)
+            run.states.setdefault(instance, {})[self.name] = value
+        return value
+
+    def __set__(self, instance: Any, value: Any):
+        run = _current_run.get()
+        if run is None or not self._is_initialised(instance):
+            if self._slot is not None:
+                self._slot.__set__(instance, value)
+            else:
+                instance.__dict__[self.name] = value
+        else:
+            run.states.setdefault(instance, {})[self.name] = value
+
+    def _is_initialised(self, instance: Any) -> bool:
+        try:
+            self._get_template(instance)
+        except (AttributeError, KeyError):
+            return False
+        return True
+
+
+class RunContext:
+    """Class that holds the state of a single run, see RunState
+
+    Attributes
+    ==========
+    states: Dict[Any, Dict[str, Any]]
+        Values of the RunState attributes set during the run, by object
+    executor: Executor
+        Executor used by every trigger of the run to resolve independent autotrigger
+        Nodes concurrently, None to resolve them one after another
+    """
+
+    def __init__(self, executor: Executor = None):
+        """RunContext constructor
+
+        Parameters
+        ==========
+        executor: Executor [None]
+            Executor used to resolve independent autotrigger Nodes concurrently,
+            it is not shut down by the run
+        """
+        self.states = {}
+        self.executor = executor
+
+    @contextmanager
+    def activate(self) -> Iterator["RunContext"]:
+        """Makes the run the active one for the current context (thread or asyncio task)
+        until the with block exits
+
+        Returns
+        =======
+        Iterator[RunContext]:
+            Context manager yielding the run itself
+        """
+        token = _current_run.set(self)
+        try:
+            yield self
+        finally:
+            _current_run.reset(token)
+
+    def get(self, item: Any) -> Any:
+        """Gets the value of a NodeOutput (or NodeInput) for this run
+
+        Parameters
+        ==========
+        item: Union[NodeOutput, NodeInput]
+            Reference to the NodeOutput or NodeInput
+
+        Returns
+        =======
+        Any:
+            Value of the item during the run
+        """
+        with self.activate():
+            return item.get()
+
+    def __repr__(self) -> str:
+        return f"RunContext(states={len(self.states)})"
+
+
+def current_run() -> RunContext:
+    """Gets the active RunContext
+
+    Returns
+    =======
+    RunContext:
+        The active run, None if the scenario is not executed as a run of a template
+    """
+    return _current_run.get()
+
+
+class ScenarioTemplate:
+    """Class that represents a scenario shared by many runs.
+    Nodes are never copied, every run only stores the state it changes, so
+    many runs (concurrent or not) can use the same template.
+    The structure of the scenario (connections, callbacks) should not be modified
+    while runs are executing.
+
+    Attributes
+    ==========
+    start_node: Node
+        Reference to the starting Node of the scenario
+    nodes: List[Node]
+        All the Nodes of the scenario (see get_whole_scenario)
+    executor: Executor
+        Thread pool shared by the runs created by the template to resolve independent
+        autotrigger Nodes concurrently (useful for I/O-bound Node functions),
+        None to resolve them one after another
+    """
+
+    def __init__(self, start_node: "Node", max_workers: int = None):
+        """ScenarioTemplate constructor
+
+        Parameters
+        ==========
+        start_node: Node
+            Reference to the starting Node of the scenario
+        max_workers: int [None]
+            If given, the runs created by the template share a thread pool of this size,
+            it is shut down by close
+        """
+        from pineapple_core.core.node import get_whole_scenario
+
+        self.start_node = start_node
+        self.nodes = get_whole_scenario(start_node)
+        self.executor = ThreadPoolExecutor(max_workers) if max_workers is not None else None
+
+    def new_run(self) -> RunContext:
+        """Creates a run of the template, using the thread pool of the template
+
+        Returns
+        =======
+        RunContext:
+            The new run
+        """
+        return RunContext(self.executor)
+
+    def run(self, run: RunContext = None) -> RunContext:
+        """Triggers the starting Node within a run
+
+        Parameters
+        ==========
+        run: RunContext [None]
+            Run to continue (its state is kept between triggers), a new one if None
+
+        Returns
+        =======
+        RunContext:
+            The run, holding the state of the scenario after the trigger
+        """
+        run = run if run is not None else self.new_run()
+        with run.activate():
+            self.start_node.trigger()
+        return run
+
+    async def arun(self, run: RunContext = None) -> RunContext:
+        """Asynchronous version of run, using Node.atrigger
+
+        Parameters
+        ==========
+        run: RunContext [None]
+            Run to continue (its state is kept between triggers), a new one if None
+
+        Returns
+        =======
+        RunContext:
+            The run, holding the state of the scenario after the trigger
+        """
+        run = run if run is not None else self.new_run()
+        with run.activate():
+            await self.start_node.atrigger()
+        return run
+
+    def close(self):
+        """Shuts down the thread pool of the template once its runs are done
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    def __repr__(self) -> str:
+        return f"ScenarioTemplate({self.start_node}, nodes={len(self.nodes)})"
@@ -0,0 +1,678 @@
+# -*- coding: utf-8 -*-
+"""This module contains everything that is related to flow scheduling.
+It contains three classes : TriggerFrame, PendingFlow and FlowScheduler
+TriggerFrame holds the state of a Node that is currently going through its flows
+PendingFlow holds the last Flows of released frames until their callbacks are called
+FlowScheduler drives the flows of a scenario iteratively using a stack of TriggerFrames
+"""
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Iterator, List, Union
+
+from pineapple_core.core import hooks
+from pineapple_core.core.epoch import current_epoch, new_epoch
+from pineapple_core.core.flows import FlowQueue
+
+
+class TriggerFrame:
+    """Class that represents a Node that has been triggered and is
+    currently executing its flows
+
+    Attributes
+    ==========
+    node: Node
+        Reference to the triggered Node
+    priorities: List[int]
+        Priorities of the Flows of the Node before it was triggered,
+        restored once the frame is done
+    flow_queue: FlowQueue
+        Enabled Flows of the Node that have not been executed by this frame yet
+    current_flow: Flow
+        Flow that is currently being executed (None if no flow has started yet)
+    stream: Iterator
+        Generator returned by the function of the Node (None if the Node does not
+        stream), its items are pulled one by one and the Flows of the Node
+        are executed again for each of them
+    """
+
+    __slots__ = ("node", "priorities", "flow_queue", "current_flow", "stream")
+
+    def __init__(self, node: "Node", priorities: List[int], stream: Iterator = None):
+        """TriggerFrame constructor
+
+        Parameters
+        ==========
+        node: Node
+            Reference to the triggered Node
+        priorities: List[int]
+            Priorities of the Flows of the Node before it was triggered
+        stream: Iterator [None]
+            Generator returned by the function of the Node
+        """
+        self.node = node
+        self.priorities = priorities
+        self.flow_queue = FlowQueue(node.flows)
+        self.current_flow = None
+        self.stream = stream
+
+    def next_flow(self) -> "Flow":
+        """Gets the next Flow to execute, priorities are evaluated lazily
+        so a Flow enabled or disabled by a previous Flow is taken into account.
+        When the Node streams, the next item is pulled once all the Flows
+        of the current one are done.
+
+        Returns
+        =======
+        Flow:
+            Reference to the next Flow to execute or None if there is none left
+        """
+        if self.stream is not None and self.current_flow is None:
+            if not self.next_item():
+                return None
+        while True:
+            flow = self.flow_queue.pop()
+            if flow is not None:
+                self.current_flow = flow
+                return flow
+            if self.stream is None or not self.next_item():
+                self.current_flow = None
+                return None
+
+    def next_item(self) -> bool:
+        """Pulls the next item of the stream and sets it in the outputs of the Node,
+        the Flows of the Node are reset so they are all executed again.
+        Items are only pulled when the previous one has been fully processed,
+        the generator stays suspended in the meantime.
+
+        Returns
+        =======
+        bool:
+            True if an item was pulled, False if the stream is exhausted
+        """
+        try:
+            item = next(self.stream)
+        except StopIteration:
+            self.stream = None
+            return False
+        self.node._set_result(item)
+        self.node.restore_priorities(self.priorities)
+        self.flow_queue.reset()
+        return True
+
+    def parallel_flows(self, flow: "Flow") -> List["Flow"]:
+        """Gets a parallel Flow along with the enabled parallel Flows that directly
+        follow it in the order of priority, they are all marked as executed
+
+        Parameters
+        ==========
+        flow: Flow
+            Reference to the parallel Flow returned by next_flow
+
+        Returns
+        =======
+        List[Flow]:
+            Flows that can be executed concurrently
+        """
+        flows = [flow]
+        next_flow = self.flow_queue.peek()
+        while next_flow is not None and next_flow.parallel:
+            flows.append(self.flow_queue.pop())
+            next_flow = self.flow_queue.peek()
+        return flows
+
+    def is_tail(self) -> bool:
+        """Checks whether the frame can be released before its current Flow
+        completes. It is the case when no other Flow is pending and the Node
+        does not stream, the callbacks that have to be called once the Flow
+        is done are kept in a PendingFlow (see needs_callbacks).
+
+        Returns
+        =======
+        bool:
+            True if the frame can be released early, False otherwise
+        """
+        return self.stream is None and self.flow_queue.peek() is None
+
+    def needs_callbacks(self) -> bool:
+        """Checks whether something has to be called once the current Flow is done
+        (after_flow or flow_failure callbacks of the Node or hooks)
+
+        Returns
+        =======
+        bool:
+            True if a PendingFlow has to replace the frame when it is released early
+        """
+        return bool(self.node.on.after_flow or self.node.on.flow_failure or hooks.enabled)
+
+    def finish(self):
+        """Releases the frame, restoring the priorities of the Flows of the Node
+        """
+        self.node.restore_priorities(self.priorities)
+
+
+class PendingFlow:
+    """Class that replaces TriggerFrames released before their last Flow completed,
+    when the after_flow or flow_failure callbacks (or hooks) of their Nodes still have
+    to be called. It only keeps what these callbacks need : the Node and its last Flow.
+    The PendingFlows stacked by a loop repeat the same cycle of Nodes and Flows, they are
+    merged in a single PendingFlow that holds the cycle once along with the amount of
+    stacked entries it stands for, so a loop does not grow the stack.
+
+    Attributes
+    ==========
+    chain: List[Tuple[Node, Flow]]
+        Released Nodes with their last Flow, in the order they were stacked,
+        the PendingFlow stands for this cycle repeated until length is reached
+    length: int
+        Amount of stacked entries the PendingFlow stands for
+    node: Node
+        Reference to the Node of the entry at the top
+    current_flow: Flow
+        Last Flow of the Node of the entry at the top, which is still being executed
+    """
+
+    __slots__ = ("chain", "length")
+
+    def __init__(self, node: "Node", flow: "Flow"):
+        """PendingFlow constructor
+
+        Parameters
+        ==========
+        node: Node
+            Reference to the released Node
+        flow: Flow
+            Last Flow of the Node
+        """
+        self.chain = [(node, flow)]
+        self.length = 1
+
+    @property
+    def node(self) -> "Node":
+        return self.chain[(self.length - 1) % len(self.chain)][0]
+
+    @property
+    def current_flow(self) -> "Flow":
+        return self.chain[(self.length - 1) % len(self.chain)][1]
+
+    def is_single(self) -> bool:
+        """Checks whether the PendingFlow stands for a single entry
+
+        Returns
+        =======
+        bool:
+            True if the PendingFlow has not been merged with another one
+        """
+        return self.length == 1 and len(self.chain) == 1
+
+    def extend(self, node: "Node", flow: "Flow") -> bool:
+        """Merges a new entry with the PendingFlow when it is the next one of the cycle
+
+        Parameters
+        ==========
+        node: Node
+            Reference to the released Node
+        flow: Flow
+            Last Flow of the Node
+
+        Returns
+        =======
+        bool:
+            True if the entry was merged, False otherwise
+        """
+        next_node, next_flow = self.chain[self.length % len(self.chain)]
+        if next_node is node and next_flow is flow:
+            self.length += 1
+            return True
+        return False
+
+    def next_flow(self) -> "Flow":
+        """The released Node has no Flow left
+
+        Returns
+        =======
+        Flow:
+            Always None
+        """
+        return None
+
+    def finish(self):
+        """Nothing to restore, the frames were already finished when they were released
+        """
+
+
+class FlowScheduler:
+    """Class that executes a Node and all the Nodes reachable through its flows
+    without nesting Python calls : every triggered Node is pushed on an explicit
+    stack of TriggerFrame, so the depth of the Python stack stays constant
+    whatever the length of the scenario or the amount of loop iterations.
+
+    Callbacks are called in the same order as a depth-first traversal would do :
+        - before_flow is called before the Node of the Flow is triggered
+        - after_flow is called once the Node of the Flow and all its
+          own flows are done
+        - flow_failure is called when the Node of the Flow (or one of its
+          own flows) raises an Exception, the Exception is forwarded to the
+          previous Node if there is no flow_failure callback
+
+    Enabled parallel Flows that follow each other in the order of priority are
+    executed concurrently (on threads, or as asyncio tasks with AsyncFlowScheduler),
+    each branch by its own scheduler. before_flow is called for every branch before
+    they start, after_flow (or flow_failure) for every branch, in order,
+    once they are all done. Barrier Nodes (Join) reached by the branches are
+    triggered once, after all the branches succeeded.
+
+    Nodes whose function returns a generator stream their results : the items are
+    pulled one at a time, set in the outputs and the Flows of the Node are executed
+    for each of them before the next item is pulled.
+
+    A frame whose last Flow starts is released right away, only a PendingFlow is kept
+    when callbacks or hooks have to be called once the Flow is done. The PendingFlows
+    of a loop (through one or several Nodes) are merged, the stack does not grow with
+    the amount of iterations.
+
+    Attributes
+    ==========
+    node: Node
+        Node the scheduler starts from
+    resolve_inputs: bool
+        Whether the inputs of the starting Node have to be resolved (autotriggered)
+        before it is executed
+    executor: Executor
+        Executor used to resolve independent autotriggered inputs concurrently,
+        None to resolve them one after another
+    barriers: List[Node]
+        Barrier Nodes reached by the flows when the scheduler executes a parallel
+        branch (they are not triggered by the branch), None otherwise
+    stack: List[Union[TriggerFrame, PendingFlow]]
+        Frames of the Nodes that are still executing their flows
+    pending: Dict[Tuple[Node, Flow], Tuple[int, PendingFlow]]
+        Last single PendingFlow stacked for each Node and Flow along with its position
+        in the stack, used to find the start of a cycle
+    """
+
+    def __init__(
+        self,
+        node: "Node",
+        resolve_inputs: bool = True,
+        executor: Executor = None,
+        barriers: List["Node"] = None,
+    ):
+        """FlowScheduler constructor
+
+        Parameters
+        ==========
+        node: Node
+            Node the scheduler will start from
+        resolve_inputs: bool [True]
+            Whether the inputs of the starting Node have to be resolved before it
+            is executed, the Nodes reached through flows always resolve their inputs
+        executor: Executor [None]
+            Executor used to resolve independent autotriggered inputs concurrently
+        barriers: List[Node] [None]
+            List the barrier Nodes reached by a parallel branch are appended to
+        """
+        self.node = node
+        self.resolve_inputs = resolve_inputs
+        self.executor = executor
+        self.barriers = barriers
+        self.stack = []
+        self.pending = {}
+
+    def run(self):
+        """Triggers the starting Node and executes all the flows until
+        the whole scenario is done
+        """
+        self._push(self.node, self.resolve_inputs)
+        while self.stack:
+            flows = self._next_flows()
+            if len(flows) > 1:
+                self._run_parallel(flows)
+            elif flows:
+                try:
+                    self._push(flows[0].node)
+                except Exception as exception:
+                    self._fail(exception, released=True)
+
+    def _next_flows(self) -> List["Flow"]:
+        """Gets the next Flow of the frame at the top of the stack (along with the
+        parallel Flows that follow it) and calls their before_flow callback.
+        Frames that are done are released.
+
+        Returns
+        =======
+        List[Flow]:
+            References to the Flows whose Nodes have to be triggered next,
+            empty if the top of the stack changed without any Flow to execute
+        """
+        frame = self.stack[-1]
+        try:
+            flow = frame.next_flow()
+            if flow is None:
+                self._release()
+                if self.stack:
+                    self._after_flow(self.stack[-1])
+                return []
+            flows = frame.parallel_flows(flow) if flow.parallel else [flow]
+            if frame.node.on.before_flow:
+                for flow in flows:
+                    frame.node.on.before_flow(frame.node, flow)
+            if hooks.enabled:
+                for flow in flows:
+                    hooks.emit(frame.node, "before_flow", flow)
+        except Exception as exception:
+            self._fail(exception)
+            return []
+        if len(flows) > 1:
+            return flows
+        if self.barriers is not None and flow.node.barrier:
+            self.barriers.append(flow.node)
+            self._after_flow(frame)
+            return []
+        if frame.is_tail():
+            self.stack.pop()
+            frame.finish()
+            if frame.needs_callbacks():
+                self._keep_pending(frame)
+        return flows
+
+    def _keep_pending(self, frame: TriggerFrame):
+        """Stacks a PendingFlow in place of a released frame, or merges it with the
+        PendingFlow at the top of the stack when it continues its cycle.
+        When the same Node and Flow are already kept by a single PendingFlow and only
+        single PendingFlows were stacked since, they form a cycle and are merged.
+
+        Parameters
+        ==========
+        frame: TriggerFrame
+            Frame that has just been released
+        """
+        top = self.stack[-1] if self.stack else None
+        if isinstance(top, PendingFlow) and top.extend(frame.node, frame.current_flow):
+            return
+        key = (frame.node, frame.current_flow)
+        position, pending = self.pending.get(key, (None, None))
+        if (
+            pending is not None
+            and position < len(self.stack)
+            and self.stack[position] is pending
+            and pending.is_single()
+            and all(
+                isinstance(entry, PendingFlow) and entry.is_single()
+                for entry in self.stack[position + 1:]
+            )
+        ):
+            pending.chain = [(entry.node, entry.current_flow) for entry in self.stack[position:]]
+            pending.length = len(pending.chain) + 1
+            del self.stack[position + 1:]
+            return
+        pending = PendingFlow(frame.node, frame.current_flow)
+        self.pending[key] = (len(self.stack), pending)
+        self.stack.append(pending)
+
+    def _release(self):
+        """Releases the frame at the top of the stack once all its Flows are done,
+        a merged PendingFlow only releases its top entry
+        """
+        frame = self.stack[-1]
+        if isinstance(frame, PendingFlow) and frame.length > 1:
+            frame.length -= 1
+        else:
+            self.stack.pop().finish()
+
+    def _run_parallel(self, flows: List["Flow"]):
+        """Executes the Nodes of parallel Flows concurrently, each one on its own
+        thread, then the barrier Nodes they reached
+
+        Parameters
+        ==========
+        flows: List[Flow]
+            Flows of the frame at the top of the stack to execute concurrently
+        """
+        frame = self.stack[-1]
+        barriers = [[] for _ in flows]
+        with ThreadPoolExecutor(max_workers=len(flows)) as branch_executor:
+            futures = [
+                branch_executor.submit(
+                    copy_context().run, self._run_branch, flow.node, branch_barriers
+                )
+                for flow, branch_barriers in zip(flows, barriers)
+            ]
+        exceptions = [future.exception() for future in futures]
+        for barrier in self._join(frame, flows, exceptions, barriers):
+            try:
+                type(self)(barrier, executor=self.executor, barriers=self.barriers).run()
+            except Exception as exception:
+                self._fail(exception, released=True)
+                break
+
+    def _run_branch(self, node: "Node", barriers: List["Node"]):
+        """Executes a parallel branch with its own scheduler
+
+        Parameters
+        ==========
+        node: Node
+            Reference to the first Node of the branch
+        barriers: List[Node]
+            List the barrier Nodes reached by the branch are appended to
+        """
+        if node.barrier:
+            barriers.append(node)
+        else:
+            type(self)(node, executor=self.executor, barriers=barriers).run()
+
+    def _join(
+        self,
+        frame: TriggerFrame,
+        flows: List["Flow"],
+        exceptions: List[Exception],
+        barriers: List[List["Node"]],
+    ) -> List["Node"]:
+        """Calls the after_flow (or flow_failure) callbacks of parallel Flows once
+        all of them are done
+
+        Parameters
+        ==========
+        frame: TriggerFrame
+            Frame the parallel Flows belong to
+        flows: List[Flow]
+            Parallel Flows that were executed
+        exceptions: List[Exception]
+            Exception raised by each branch (None if it succeeded)
+        barriers: List[List[Node]]
+            Barrier Nodes reached by each branch
+
+        Returns
+        =======
+        List[Node]:
+            Barrier Nodes to trigger now, empty if one of the branches failed
+        """
+        for flow, exception in zip(flows, exceptions):
+            if not self.stack or self.stack[-1] is not frame:
+                return []
+            frame.current_flow = flow
+            if exception is None:
+                self._after_flow(frame)
+            else:
+                self._fail(exception, released=True)
+        if any(exception is not None for exception in exceptions) or (
+            not self.stack or self.stack[-1] is not frame
+        ):
+            return []
+        return list(dict.fromkeys(node for branch in barriers for node in branch))
+
+    def _push(self, node: "Node", resolve_inputs: bool = True):
+        """Triggers a Node (inputs and function) and stacks its frame
+        so its flows are executed next
+
+        Parameters
+        ==========
+        node: Node
+            Reference to the Node to trigger
+        resolve_inputs: bool [True]
+            Whether the inputs of the Node have to be resolved first
+        """
+        _start_loop_iteration(node, resolve_inputs)
+        priorities = node._trigger_self(resolve_inputs, self.executor)
+        self.stack.append(TriggerFrame(node, priorities, _take_stream(node)))
+
+    def _after_flow(self, frame: Union[TriggerFrame, PendingFlow]):
+        """Calls the after_flow callback and hooks of a frame once its current
+        Flow is done
+
+        Parameters
+        ==========
+        frame: Union[TriggerFrame, PendingFlow]
+            Frame whose current Flow is done
+        """
+        try:
+            if frame.node.on.after_flow:
+                frame.node.on.after_flow(frame.node, frame.current_flow)
+            if hooks.enabled:
+                hooks.emit(frame.node, "after_flow", frame.current_flow)
+        except Exception as exception:
+            self._fail(exception)
+
+    def _fail(self, exception: Exception, released: bool = False):
+        """Handles an Exception raised by the frame at the top of the stack.
+        The frame is released and the Exception is forwarded to the previous frames
+        until one of them handles it with a flow_failure callback.
+        If no frame handles it, the Exception is raised again.
+
+        Parameters
+        ==========
+        exception: Exception
+            Reference to the Exception
+        released: bool [False]
+            Whether the failing frame has already been released from the stack
+        """
+        if not released:
+            self._release()
+        while self.stack:
+            frame = self.stack[-1]
+            if frame.node.on.flow_failure:
+                try:
+                    frame.node.on.flow_failure(frame.node, frame.current_flow, exception)
+                    if frame.node.on.after_flow:
+                        frame.node.on.after_flow(frame.node, frame.current_flow)
+                    return
+                except Exception as callback_exception:
+                    exception = callback_exception
+            self._release()
+        raise exception
+
+
+class AsyncFlowScheduler(FlowScheduler):
+    """Class that works exactly like FlowScheduler but awaits the Nodes,
+    Node functions defined with "async def" don't block the event loop
+    and independent autotrigger Nodes are resolved concurrently
+    """
+
+    async def run(self):
+        """Triggers the starting Node and executes all the flows until
+        the whole scenario is done
+        """
+        await self._push(self.node, self.resolve_inputs)
+        while self.stack:
+            flows = self._next_flows()
+            if len(flows) > 1:
+                await self._run_parallel(flows)
+            elif flows:
+                try:
+                    await self._push(flows[0].node)
+                except Exception as exception:
+                    self._fail(exception, released=True)
+
+    async def _push(self, node: "Node", resolve_inputs: bool = True):
+        """Triggers a Node (inputs and function) and stacks its frame
+        so its flows are executed next
+
+        Parameters
+        ==========
+        node: Node
+            Reference to the Node to trigger
+        resolve_inputs: bool [True]
+            Whether the inputs of the Node have to be resolved first
+        """
+        _start_loop_iteration(node, resolve_inputs)
+        priorities = await node._atrigger_self(resolve_inputs)
+        self.stack.append(TriggerFrame(node, priorities, _take_stream(node)))
+
+    async def _run_parallel(self, flows: List["Flow"]):
+        """Executes the Nodes of parallel Flows concurrently, each one in its own
+        asyncio task, then the barrier Nodes they reached
+
+        Parameters
+        ==========
+        flows: List[Flow]
+            Flows of the frame at the top of the stack to execute concurrently
+        """
+        frame = self.stack[-1]
+        barriers = [[] for _ in flows]
+        results = await asyncio.gather(
+            *[
+                self._run_branch(flow.node, branch_barriers)
+                for flow, branch_barriers in zip(flows, barriers)
+            ],
+            return_exceptions=True,
+        )
+        exceptions = [
+            result if isinstance(result, BaseException) else None for result in results
+        ]
+        for barrier in self._join(frame, flows, exceptions, barriers):
+            try:
+                await type(self)(barrier, barriers=self.barriers).run()
+            except Exception as exception:
+                self._fail(exception, released=True)
+                break
+
+    async def _run_branch(self, node: "Node", barriers: List["Node"]):
+        """Executes a parallel branch with its own scheduler
+
+        Parameters
+        ==========
+        node: Node
+            Reference to the first Node of the branch
+        barriers: List[Node]
+            List the barrier Nodes reached by the branch are appended to
+        """
+        if node.barrier:
+            barriers.append(node)
+        else:
+            await type(self)(node, barriers=barriers).run()
+
+
+def _start_loop_iteration(node: "Node", resolve_inputs: bool):
+    """Starts a new evaluation epoch if the Node was already triggered
+    during the current one (the scenario loops), the values computed for
+    the previous iteration are outdated
+
+    Parameters
+    ==========
+    node: Node
+        Reference to the Node about to be triggered
+    resolve_inputs: bool
+        Whether the Node is triggered through a flow (autotriggered Nodes
+        don't start new epochs)
+    """
+    if resolve_inputs and node.epoch == current_epoch():
+        new_epoch()
+
+
+def _take_stream(node: "Node") -> Iterator:
+    """Takes the generator returned by the function of a Node, so that
+    the Node can be triggered again while its frame consumes it
+
+    Parameters
+    ==========
+    node: Node
+        Reference to the Node that has just been triggered
+
+    Returns
+    =======
+    Iterator:
+        The generator returned by the function, None if the Node does not stream
+    """
+    stream, node.stream = node.stream, None
+    return stream
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""This module contains everything that is related to type check policies.
+A TypeCheckPolicy decides how the values set on NodeOutputs are checked against
+their types :
+    - strict: every value is checked, InvalidNodeOutputTypeError is raised on mismatch
+    - sampled: one value in sample_rate is checked (per NodeOutput), mismatches are
+      counted and reported with a RuntimeWarning instead of raising
+    - off: values are not checked
+The global policy applies to every Node, a scenario can use its own policy
+(see set_type_check_policy) without changing the definition of its Nodes.
+"""
+
+import warnings
+from collections import Counter
+from typing import Any, Dict
+
+from pineapple_core.core.exceptions import (
+    InvalidNodeOutputTypeError,
+    InvalidTypeCheckPolicyError,
+)
+
+STRICT, SAMPLED, OFF = "strict", "sampled", "off"
+MODES = (STRICT, SAMPLED, OFF)
+
+
+class TypeCheckPolicy:
+    """Class that represents how values set on NodeOutputs are checked
+
+    Attributes
+    ==========
+    mode: str
+        One of "strict", "sampled" or "off"
+    sample_rate: int
+        In sampled mode, one value in sample_rate is checked for each NodeOutput
+    mismatches: Counter
+        In sampled mode, amount of mismatching values by NodeOutput (like Module.Name[out])
+    """
+
+    __slots__ = ("mode", "sample_rate", "mismatches", "check")
+
+    def __init__(self, mode: str = STRICT, sample_rate: int = 100):
+        """TypeCheckPolicy constructor
+
+        Parameters
+        ==========
+        mode: str ["strict"]
+            One of "strict", "sampled" or "off"
+        sample_rate: int [100]
+            In sampled mode, one value in sample_rate is checked for each NodeOutput
+
+        Raises
+        ======
+        InvalidTypeCheckPolicyError:
+            If the mode or the sample rate is not valid
+        """
+        if mode not in MODES:
+            raise InvalidTypeCheckPolicyError(f"mode should be one of {MODES}, got '{mode}'")
+        if sample_rate < 1:
+            raise InvalidTypeCheckPolicyError("sample_rate should be positive")
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.mismatches = Counter()
+        self.check = {
+            STRICT: self._check_strict,
+            SAMPLED: self._check_sampled,
+            OFF: self._check_off,
+        }[mode]
+
+    def _check_strict(self, node_output: "NodeOutput", value: Any):
+        if not node_output.validator(value):
+            raise InvalidNodeOutputTypeError(node_output, value)
+
+    def _check_sampled(self, node_output: "NodeOutput", value: Any):
+        checks = node_output.checks
+        node_output.checks = checks + 1
+        if checks % self.sample_rate or node_output.validator(value):
+            return
+        node = node_output.node
+        output_name = f"{node.module}.{node.name}[{node_output.name}]"
+        self.mismatches[output_name] += 1
+        warnings.warn(str(InvalidNodeOutputTypeError(node_output, value)), RuntimeWarning)
+
+    def _check_off(self, node_output: "NodeOutput", value: Any):
+        pass
+
+    def dump(self) -> Dict[str, Any]:
+        """Dumps the policy
+
+        Returns
+        =======
+        dict:
+            A dictionnary representing the policy (trivially convertable to JSON)
+        """
+        return {"mode": self.mode, "sample_rate": self.sample_rate}
+
+    def __repr__(self) -> str:
+        return f"TypeCheckPolicy(mode={self.mode}, sample_rate={self.sample_rate})"
+
+
+_global_policy = TypeCheckPolicy()
+
+
+def get_type_check_policy(node: "Node" = None) -> TypeCheckPolicy:
+    """Gets the policy that applies to a Node
+
+    Parameters
+    ==========
+    node: Node [None]
+        Reference to the Node, the global policy is returned if None
+
+    Returns
+    =======
+    TypeCheckPolicy:
+        The policy of the scenario of the Node if it has one, the global policy otherwise
+    """
+    policy = getattr(node, "type_check_policy", None)
+    return policy if policy is not None else _global_policy
+
+
+def set_type_check_policy(policy: TypeCheckPolicy, start_node: "Node" = None):
+    """Sets the global policy or the policy of a scenario
+
+    Parameters
+    ==========
+    policy: TypeCheckPolicy
+        The policy to use, None to make the scenario use the global policy again
+    start_node: Node [None]
+        Starting Node of the scenario, all its Nodes (see get_whole_scenario) use
+        the policy. The global policy is set if None
+    """
+    global _global_policy
+    if start_node is None:
+        _global_policy = policy if policy is not None else TypeCheckPolicy()
+        return
+    from pineapple_core.core.node import get_whole_scenario
+
+    for node in get_whole_scenario(start_node):
+        node.type_check_policy = policy
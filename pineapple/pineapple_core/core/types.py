@@ -4,6 +4,11 @@
 
 import typing
 
+try:
+    import numpy
+except ImportError:  # NumPy is optional, it is only needed by the Array Nodes
+    numpy = None
+
 
 class PineappleType:
     """This class represents a type with custom checks.
@@ -84,7 +89,8 @@ class SumType(PineappleType):
         Parameters
         ==========
         *args: type
-            List of types that the SumType should accept
+            List of types that the SumType should accept,
+            PineappleType instances are accepted as well
         """
         super().__init__()
         self.accepted_types = args
@@ -104,7 +110,10 @@ class SumType(PineappleType):
             True if the value's type is one of the accepted types, False otherwise
         """
         for accepted_type in self.accepted_types:
-            if isinstance(value, accepted_type):
+            if isinstance(accepted_type, PineappleType):
+                if accepted_type.check(value):
+                    return True
+            elif isinstance(value, accepted_type):
                 return True
         return False
 
@@ -115,6 +124,37 @@ class SumType(PineappleType):
 Numeric = SumType(int, float, complex)
 
 
+class NumericArray(PineappleType):
+    """This class represents a NumPy array of numbers (booleans, integers, floats
+    or complex numbers), NumPy scalars are accepted as well since they are
+    the result of reductions (sum, mean..) over arrays.
+    NumPy is an optional dependency, no value is accepted if it is not installed.
+    """
+
+    def check(self, value: Any) -> bool:
+        """Checks whether value is a numeric NumPy array or scalar
+
+        Parameters
+        ==========
+        value: Any
+            Value you want to check the type of
+
+        Returns
+        =======
+        bool:
+            True if the value is a numeric NumPy array or scalar, False otherwise
+        """
+        if numpy is None or not isinstance(value, (numpy.ndarray, numpy.generic)):
+            return False
+        return value.dtype.kind in "biufc"
+
+    def __repr__(self) -> str:
+        return "NumericArray"
+
+
+NumericOrArray = SumType(int, float, complex, NumericArray())
+
+
 class Nullable(PineappleType):
     def __init__(self, accepted_type: type):
         super().__init__()
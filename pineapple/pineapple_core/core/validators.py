@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""This module contains everything that is related to type validators.
+A validator is a function compiled once from the type of a NodeOutput, it returns
+whether a value matches the type. The structure of list / tuple / dict types is
+resolved when compiling so checking a value only walks the value itself.
+The rules are the ones of the klotan criterias that were used before :
+    - a type only matches values of exactly this type
+    - a PineappleType uses its check method
+    - a list / tuple matches lists and tuples whose items all match one of its types
+    - a dict matches dicts holding all its keys (except OptionalKeys) with matching values
+    - callables nested in a list / dict (like PineappleTypes) are ignored
+    - other types (like typing ones) match values of one of their __args__
+"""
+
+import typing
+from typing import Any, Callable, Dict, List
+
+from klotan.match import OptionalKey
+
+from pineapple_core.core.types import PineappleType
+
+_optional_class = typing.Optional[str].__class__
+
+
+def compile_validator(output_type: Any) -> Callable[[Any], bool]:
+    """Compiles the type of a NodeOutput into a validator
+
+    Parameters
+    ==========
+    output_type: Any
+        Type to compile
+
+    Returns
+    =======
+    Callable[[Any], bool]:
+        Function returning whether a value matches the type, it raises RuntimeError
+        when called if the type contains items that are not types
+    """
+    if isinstance(output_type, PineappleType):
+        return output_type.check
+    if isinstance(output_type, (list, tuple, dict)):
+        try:
+            return _compile_structure(output_type)
+        except RuntimeError as error:
+            return _invalid_validator(error)
+    if hasattr(output_type, "__args__"):
+        return _compile_typing(output_type)
+    return lambda value: type(value) is output_type
+
+
+def _compile_typing(output_type: Any) -> Callable[[Any], bool]:
+    def validate(value: Any) -> bool:
+        return type(value) is output_type or isinstance(value, output_type.__args__)
+
+    return validate
+
+
+def _invalid_validator(error: RuntimeError) -> Callable[[Any], bool]:
+    def validate(value: Any) -> bool:
+        raise error
+
+    return validate
+
+
+def _is_leaf(item_type: Any) -> bool:
+    return isinstance(item_type, type) or isinstance(item_type, _optional_class)
+
+
+def _compile_structure(output_type: Any) -> Callable[[Any], bool]:
+    if isinstance(output_type, dict):
+        return _compile_dict(output_type)
+    return _compile_list(output_type)
+
+
+def _compile_item(item_type: Any, container: Any) -> Callable[[Any], bool]:
+    if _is_leaf(item_type):
+        return lambda value: type(value) is item_type
+    if isinstance(item_type, (list, tuple, dict)):
+        return _compile_structure(item_type)
+    if callable(item_type):
+        return None
+    raise RuntimeError(
+        f"Non-klotan item in {type(container).__name__} {item_type}, "
+        "expected (type, list, dict, tuple, callable)"
+    )
+
+
+def _compile_list(list_type: List[Any]) -> Callable[[Any], bool]:
+    leaves = tuple(item_type for item_type in list_type if _is_leaf(item_type))
+    validators = [
+        validator
+        for validator in (_compile_item(item_type, list_type) for item_type in list_type)
+        if validator is not None
+    ]
+    if not validators:
+        return lambda value: isinstance(value, (list, tuple))
+    if len(leaves) == len(validators):  # Fast path for lists of plain types
+
+        def validate_leaves(value: Any) -> bool:
+            if not isinstance(value, (list, tuple)):
+                return False
+            for item in value:
+                if type(item) not in leaves:
+                    return False
+            return True
+
+        return validate_leaves
+
+    def validate(value: Any) -> bool:
+        if not isinstance(value, (list, tuple)):
+            return False
+        for item in value:
+            if not any(validator(item) for validator in validators):
+                return False
+        return True
+
+    return validate
+
+
+def _compile_dict(dict_type: Dict[Any, Any]) -> Callable[[Any], bool]:
+    required, optional = [], []
+    for key, item_type in dict_type.items():
+        validator = _compile_item(item_type, dict_type)
+        if validator is None:
+            continue
+        if isinstance(key, OptionalKey):
+            optional.append((key.key, validator))
+        elif _is_leaf(item_type):
+            required.append((key, item_type, None))
+        else:
+            required.append((key, None, validator))
+    if all(validator is None for _, _, validator in required) and not optional:
+        leaves = tuple((key, item_type) for key, item_type, _ in required)
+
+        def validate_leaves(value: Any) -> bool:  # Fast path for flat dicts of plain types
+            if not isinstance(value, dict):
+                return False
+            try:
+                for key, item_type in leaves:
+                    if type(value[key]) is not item_type:
+                        return False
+            except KeyError:
+                return False
+            return True
+
+        return validate_leaves
+
+    def validate(value: Any) -> bool:
+        if not isinstance(value, dict):
+            return False
+        for key, item_type, validator in required:
+            if key not in value:
+                return False
+            item = value[key]
+            if validator is None:
+                if type(item) is not item_type:
+                    return False
+            elif not validator(item):
+                return False
+        for key, validator in optional:
+            if key in value and not validator(value[key]):
+                return False
+        return True
+
+    return validate
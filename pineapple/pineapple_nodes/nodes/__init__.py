@@ -1,3 +1,4 @@
+from pineapple_nodes.nodes import array_nodes
 from pineapple_nodes.nodes import assertion_nodes
 from pineapple_nodes.nodes import comparison_nodes
 from pineapple_nodes.nodes import datetime_nodes
@@ -13,6 +14,7 @@ from pineapple_nodes.nodes import time_nodes
 from pineapple_nodes.nodes import value_nodes
 
 __all__ = [
+    array_nodes,
     assertion_nodes,
     comparison_nodes,
     datetime_nodes,
@@ -0,0 +1,175 @@
+from pineapple_core.core.node import node
+from pineapple_core.core.types import Any, NumericArray, NumericOrArray
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, Array Nodes raise when triggered without it
+    numpy = None
+
+
+def _numpy():
+    if numpy is None:
+        raise ImportError(
+            "Array Nodes require NumPy, install it with 'pip install sg_pineapple[numpy]'"
+        )
+    return numpy
+
+
+@node(module="Array", name="FromList", autotrigger=True, pure=True)
+def from_list_node(values: list) -> NumericArray():
+    return _numpy().asarray(values)
+
+
+@node(module="Array", name="ToList", autotrigger=True, pure=True)
+def to_list_node(array: NumericArray()) -> list:
+    return array.tolist()
+
+
+@node(module="Array", name="Add", autotrigger=True, pure=True)
+def add_node(a: NumericOrArray, b: NumericOrArray) -> NumericOrArray:
+    return _numpy().add(a, b)
+
+
+@node(module="Array", name="Subtract", autotrigger=True, pure=True)
+def subtract_node(a: NumericOrArray, b: NumericOrArray) -> NumericOrArray:
+    return _numpy().subtract(a, b)
+
+
+@node(module="Array", name="Multiply", autotrigger=True, pure=True)
+def multiply_node(a: NumericOrArray, b: NumericOrArray) -> NumericOrArray:
+    return _numpy().multiply(a, b)
+
+
+@node(module="Array", name="Divide", autotrigger=True, pure=True)
+def divide_node(a: NumericOrArray, b: NumericOrArray) -> NumericOrArray:
+    return _numpy().divide(a, b)
+
+
+@node(module="Array", name="Cosinus", autotrigger=True, pure=True)
+def cosinus_node(a: NumericOrArray) -> NumericOrArray:
+    return _numpy().cos(a)
+
+
+@node(module="Array", name="Sinus", autotrigger=True, pure=True)
+def sinus_node(a: NumericOrArray) -> NumericOrArray:
+    return _numpy().sin(a)
+
+
+@node(module="Array", name="Tangent", autotrigger=True, pure=True)
+def tangent_node(a: NumericOrArray) -> NumericOrArray:
+    return _numpy().tan(a)
+
+
+@node(module="Array", name="Ceil", autotrigger=True, pure=True)
+def ceil_node(a: NumericOrArray) -> NumericOrArray:
+    return _numpy().ceil(a)
+
+
+@node(module="Array", name="Floor", autotrigger=True, pure=True)
+def floor_node(a: NumericOrArray) -> NumericOrArray:
+    return _numpy().floor(a)
+
+
+@node(module="Array", name="CopySign", autotrigger=True, pure=True)
+def copysign_node(a: NumericOrArray, b: NumericOrArray) -> NumericOrArray:
+    return _numpy().copysign(a, b)
+
+
+@node(module="Array", name="Abs", autotrigger=True, pure=True)
+def abs_node(a: NumericOrArray) -> NumericOrArray:
+    return _numpy().abs(a)
+
+
+@node(module="Array", name="Modulo", autotrigger=True, pure=True)
+def modulo_node(a: NumericOrArray, b: NumericOrArray) -> NumericOrArray:
+    return _numpy().mod(a, b)
+
+
+@node(module="Array", name="IsInfinite", autotrigger=True, pure=True)
+def is_infinite_node(a: NumericOrArray) -> NumericOrArray:
+    return _numpy().isinf(a)
+
+
+@node(module="Array", name="Sum", autotrigger=True, pure=True)
+def sum_node(*arrays: NumericOrArray) -> NumericOrArray:
+    return sum(_numpy().sum(array) for array in arrays)
+
+
+@node(module="Array", name="Exp", autotrigger=True, pure=True)
+def exp_node(a: NumericOrArray) -> NumericOrArray:
+    return _numpy().exp(a)
+
+
+@node(module="Array", name="Log", autotrigger=True, pure=True)
+def log_node(a: NumericOrArray, base: NumericOrArray) -> NumericOrArray:
+    return _numpy().log(a) / _numpy().log(base)
+
+
+@node(module="Array", name="Pow", autotrigger=True, pure=True)
+def pow_node(a: NumericOrArray, b: NumericOrArray) -> NumericOrArray:
+    return _numpy().power(a, b)
+
+
+@node(module="Array", name="Sqrt", autotrigger=True, pure=True)
+def sqrt_node(a: NumericOrArray) -> NumericOrArray:
+    return _numpy().sqrt(a)
+
+
+@node(module="Array", name="Min", autotrigger=True, pure=True)
+def min_node(array: NumericArray()) -> NumericOrArray:
+    return _numpy().min(array)
+
+
+@node(module="Array", name="Max", autotrigger=True, pure=True)
+def max_node(array: NumericArray()) -> NumericOrArray:
+    return _numpy().max(array)
+
+
+@node(module="Array", name="Mean", autotrigger=True, pure=True)
+def mean_node(array: NumericArray()) -> NumericOrArray:
+    return _numpy().mean(array)
+
+
+@node(module="Array", name="Percentile", autotrigger=True, pure=True)
+def percentile_node(array: NumericArray(), percentile: NumericOrArray) -> NumericOrArray:
+    return _numpy().percentile(array, percentile)
+
+
+@node(module="Array", name="Equals", autotrigger=True, pure=True)
+def equals_node(a: Any(), b: Any()) -> NumericOrArray:
+    return _numpy().equal(a, b)
+
+
+@node(module="Array", name="Different", autotrigger=True, pure=True)
+def different_node(a: Any(), b: Any()) -> NumericOrArray:
+    return _numpy().not_equal(a, b)
+
+
+@node(module="Array", name="MoreThan", autotrigger=True, pure=True)
+def more_than_node(a: NumericOrArray, b: NumericOrArray) -> NumericOrArray:
+    return _numpy().greater(a, b)
+
+
+@node(module="Array", name="LessThan", autotrigger=True, pure=True)
+def less_than_node(a: NumericOrArray, b: NumericOrArray) -> NumericOrArray:
+    return _numpy().less(a, b)
+
+
+@node(module="Array", name="MoreOrEqual", autotrigger=True, pure=True)
+def more_or_equal_node(a: NumericOrArray, b: NumericOrArray) -> NumericOrArray:
+    return _numpy().greater_equal(a, b)
+
+
+@node(module="Array", name="LessOrEqual", autotrigger=True, pure=True)
+def less_or_equal_node(a: NumericOrArray, b: NumericOrArray) -> NumericOrArray:
+    return _numpy().less_equal(a, b)
+
+
+@node(module="Array", name="All", autotrigger=True, pure=True)
+def all_node(array: NumericArray()) -> bool:
+    return bool(_numpy().all(array))
+
+
+@node(module="Array", name="Any", autotrigger=True, pure=True)
+def any_node(array: NumericArray()) -> bool:
+    return bool(_numpy().any(array))
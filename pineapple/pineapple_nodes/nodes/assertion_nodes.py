@@ -6,7 +6,7 @@ from pineapple_core.core.input_flags import Optional
 equals_result = {"out": {"result": bool, "message": str}}
 
 
-@node(module="Comparison", name="AssertEquals", autotrigger=True)
+@node(module="Comparison", name="AssertEquals", autotrigger=True, pure=True)
 def assert_equals_node(a: Any(), b: Any(), message: Optional(str)) -> equals_result:
     result = a == b
     return {"result": result, "message": message.format(str(a), str(b))}
@@ -15,7 +15,7 @@ def assert_equals_node(a: Any(), b: Any(), message: Optional(str)) -> equals_res
 list_compare_result = {"out": {"result": bool, "message": str}}
 
 
-@node(module="Comparison", name="AssertInList", autotrigger=True)
+@node(module="Comparison", name="AssertInList", autotrigger=True, pure=True)
 def assert_in_list_node(
     list_input: list, key: str, value: Any()
 ) -> list_compare_result:
@@ -33,7 +33,7 @@ def assert_in_list_node(
     }
 
 
-@node(module="Comparison", name="AssertNotInList", autotrigger=True)
+@node(module="Comparison", name="AssertNotInList", autotrigger=True, pure=True)
 def assert_not_in_list_node(
     list_input: list, key: str, value: Any()
 ) -> list_compare_result:
@@ -13,7 +13,7 @@ def datetime_now_node(*args: Any, **kwargs: Any) -> datetime.datetime:
     return datetime.datetime.now(*args, **kwargs)
 
 
-@node(module="Datetime", name="IsoFormat", autotrigger=True)
+@node(module="Datetime", name="IsoFormat", autotrigger=True, pure=True)
 def isoformat_node(
         timestamp: SumType(
             datetime.datetime,
@@ -24,7 +24,7 @@ def isoformat_node(
     return timestamp.isoformat(*args, **kwargs)
 
 
-@node(module="Datetime", name="DatetimeMinusDatetime", autotrigger=True)
+@node(module="Datetime", name="DatetimeMinusDatetime", autotrigger=True, pure=True)
 def datetime_minus_datetime(
             datetime1: datetime.datetime,
             datetime2: datetime.datetime
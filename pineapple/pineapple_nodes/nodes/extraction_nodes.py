@@ -16,13 +16,14 @@ def extract_from_list_node_helper(node):
                 node.add_output(NodeOutput(node, output.name, output.output_type))
             del node.outputs["out"]
 
-    node.on.connect_input.add(on_connect_input)
+    node.on.add("connect_input", on_connect_input)
 
 
 @node(
     module="Extraction",
     name="ExtractFromList",
     autotrigger=True,
+    pure=True,
     helper_function=extract_from_list_node_helper,
 )
 def extract_from_list_node(
@@ -41,6 +42,7 @@ def extract_from_list_node(
     module="Extraction",
     name="ExtractWithFilter",
     autotrigger=True,
+    pure=True,
     helper_function=extract_from_list_node_helper,
 )
 def extract_item_with_filter_node(list_input: list, key: str, to_match: Any()) -> Any():
@@ -70,6 +72,7 @@ def smart_extract_helper(self, *args, **kwargs):
     module="Extraction",
     name="SmartExtract",
     autotrigger=True,
+    pure=True,
     helper_function=smart_extract_helper,
 )
 def smart_extract_node(self: Node, iterable: Any(), flags: Any()) -> Any():
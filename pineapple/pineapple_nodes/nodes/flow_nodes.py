@@ -1,6 +1,8 @@
-from pineapple_core.core.node import node, Node
+from pineapple_core.core.node import is_awaited, node, Node
+from pineapple_core.core.runs import RunState
 from pineapple_core.core.types import Any
 from pineapple_core.static_analysis.static_analysis import analyse_scenario
+import asyncio
 import time
 
 
@@ -33,6 +35,8 @@ class NotANodeError(Exception):
 
 
 class NodeContainer(object):
+    done = RunState()
+
     def __init__(self, parent, node_container_id, node_container_name, disabled=False):
         object.__setattr__(self, "nodes", {})
         object.__setattr__(self, "parent", parent)
@@ -58,7 +62,7 @@ class NodeContainer(object):
 
     def __lshift__(self, node):
         ref = object
-        node.on.before_flow.add(lambda x, y: ref.__setattr__(self, "done", False))
+        node.on.add("before_flow", lambda x, y: ref.__setattr__(self, "done", False))
         object.__getattribute__(self, "parent").connect_flow(
             node,
             object.__getattribute__(self, "container_id"),
@@ -133,16 +137,16 @@ def sequence_helper(self: Node):
             self.__failure_node_container << self.__failure_node_container.failure
             return self.__failure_node_container.failure
         else:
-            self.on.flow_failure.add(on_flow_failure)
+            self.on.add("flow_failure", on_flow_failure)
             return self.__failure_node_container
 
     def on_trigger(self):
         analyse_scenario(self)
 
-    self.on.before_flow.add(on_before_flow)
-    self.on.trigger.add(on_trigger)
-    self.on.after_flow.add(on_after_flow)
-    self.on.flow_failure.add(on_flow_failure)
+    self.on.add("before_flow", on_before_flow)
+    self.on.add("trigger", on_trigger)
+    self.on.add("after_flow", on_after_flow)
+    self.on.add("flow_failure", on_flow_failure)
     self.global_nodes = global_nodes
     self.failure_step = failure_step
     self.step = step
@@ -153,9 +157,20 @@ def sequence_node():
     pass
 
 
+def _sleep(delay: float):
+    if is_awaited():
+        return asyncio.sleep(delay)
+    time.sleep(delay)
+
+
 @node(module="Flow", name="Sleep")
 def sleep_node(delay: float):
-    time.sleep(delay)
+    return _sleep(delay)
+
+
+@node(module="Flow", name="AsyncSleep")
+async def async_sleep_node(delay: float):
+    await asyncio.sleep(delay)
 
 
 class SwitchNodeDefault:
@@ -185,7 +200,7 @@ def wait_until_helper(node, *args, **kwargs):
         if flow.name is True:
             flow.disable()
 
-    node.on.connect_flow.add(on_connect_flow)
+    node.on.add("connect_flow", on_connect_flow)
 
 
 @node(module="Flow", name="WaitUntil", helper_function=wait_until_helper)
@@ -193,7 +208,24 @@ def wait_until_node(self: Node, condition: bool, delay: float):
     if condition:
         self.get_flow(False).disable()
     else:
-        time.sleep(delay)
+        return _sleep(delay)
+
+
+@node(module="Flow", name="AsyncWaitUntil", helper_function=wait_until_helper)
+async def async_wait_until_node(self: Node, condition: bool, delay: float):
+    if condition:
+        self.get_flow(False).disable()
+    else:
+        await asyncio.sleep(delay)
+
+
+def join_helper(node, *args, **kwargs):
+    node.barrier = True
+
+
+@node(module="Flow", name="Join", helper_function=join_helper)
+def join_node():
+    pass
 
 
 @node(module="Flow", name="Null")
@@ -4,67 +4,67 @@ from pineapple_core.core.types import Numeric
 import math
 
 
-@node(module="Math", name="Add", autotrigger=True)
+@node(module="Math", name="Add", autotrigger=True, pure=True)
 def add_node(a: Numeric, b: Numeric) -> Numeric:
     return a + b
 
 
-@node(module="Math", name="Subtract", autotrigger=True)
+@node(module="Math", name="Subtract", autotrigger=True, pure=True)
 def subtract_node(a: Numeric, b: Numeric) -> Numeric:
     return a - b
 
 
-@node(module="Math", name="Mutiply", autotrigger=True)
+@node(module="Math", name="Mutiply", autotrigger=True, pure=True)
 def multiply_node(a: Numeric, b: Numeric) -> Numeric:
     return a * b
 
 
-@node(module="Math", name="Divide", autotrigger=True)
+@node(module="Math", name="Divide", autotrigger=True, pure=True)
 def divide_node(a: Numeric, b: Numeric) -> Numeric:
     return a / b
 
 
-@node(module="Math", name="Cosinus", autotrigger=True)
+@node(module="Math", name="Cosinus", autotrigger=True, pure=True)
 def cosinus_node(a: Numeric) -> Numeric:
     return math.cos(a)
 
 
-@node(module="Math", name="Sinus", autotrigger=True)
+@node(module="Math", name="Sinus", autotrigger=True, pure=True)
 def sinus_node(a: Numeric) -> Numeric:
     return math.sin(a)
 
 
-@node(module="Math", name="Tangent", autotrigger=True)
+@node(module="Math", name="Tangent", autotrigger=True, pure=True)
 def tangent_node(a: Numeric) -> Numeric:
     return math.tan(a)
 
 
-@node(module="Math", name="Ceil", autotrigger=True)
+@node(module="Math", name="Ceil", autotrigger=True, pure=True)
 def ceil_node(a: Numeric) -> Numeric:
     return math.ceil(a)
 
 
-@node(module="Math", name="Floor", autotrigger=True)
+@node(module="Math", name="Floor", autotrigger=True, pure=True)
 def floor_node(a: Numeric) -> Numeric:
     return math.floor(a)
 
 
-@node(module="Math", name="CopySign", autotrigger=True)
+@node(module="Math", name="CopySign", autotrigger=True, pure=True)
 def copysign_node(a: Numeric, b: Numeric) -> Numeric:
     return math.copysign(a, b)
 
 
-@node(module="Math", name="Abs", autotrigger=True)
+@node(module="Math", name="Abs", autotrigger=True, pure=True)
 def abs_node(a: Numeric) -> Numeric:
     return abs(a)
 
 
-@node(module="Math", name="Factorial", autotrigger=True)
+@node(module="Math", name="Factorial", autotrigger=True, pure=True)
 def factorial_node(a: Numeric) -> Numeric:
     return math.factorial(a)
 
 
-@node(module="Math", name="Modulo", autotrigger=True)
+@node(module="Math", name="Modulo", autotrigger=True, pure=True)
 def modulo_node(a: Numeric, b: Numeric) -> Numeric:
     if isinstance(a, Numeric) and isinstance(b, Numeric):
         return a % b
@@ -72,12 +72,12 @@ def modulo_node(a: Numeric, b: Numeric) -> Numeric:
         return math.fmod(a, b)
 
 
-@node(module="Math", name="IsInfinite", autotrigger=True)
+@node(module="Math", name="IsInfinite", autotrigger=True, pure=True)
 def is_infinite_node(a: Numeric) -> bool:
     return math.isinf(a)
 
 
-@node(module="Math", name="Sum", autotrigger=True)
+@node(module="Math", name="Sum", autotrigger=True, pure=True)
 def sum_node(*numbers: Numeric) -> Numeric:
     result = math.fsum(numbers)
     if result == int(result):
@@ -86,26 +86,26 @@ def sum_node(*numbers: Numeric) -> Numeric:
         return result
 
 
-@node(module="Math", name="GCD", autotrigger=True)
+@node(module="Math", name="GCD", autotrigger=True, pure=True)
 def gcd_node(a: Numeric, b: Numeric) -> Numeric:
     return math.gcd(a, b)
 
 
-@node(module="Math", name="Exp", autotrigger=True)
+@node(module="Math", name="Exp", autotrigger=True, pure=True)
 def exp_node(a: Numeric) -> Numeric:
     return math.exp(a)
 
 
-@node(module="Math", name="Log", autotrigger=True)
+@node(module="Math", name="Log", autotrigger=True, pure=True)
 def log_node(a: Numeric, base: Numeric) -> Numeric:
     return math.log(a, base)
 
 
-@node(module="Math", name="Pow", autotrigger=True)
+@node(module="Math", name="Pow", autotrigger=True, pure=True)
 def pow_node(a: Numeric, b: Numeric) -> Numeric:
     return math.pow(a, b)
 
 
-@node(module="Math", name="Sqrt", autotrigger=True)
+@node(module="Math", name="Sqrt", autotrigger=True, pure=True)
 def sqrt_node(a: Numeric) -> Numeric:
     return math.sqrt(a)
@@ -5,7 +5,7 @@ from pineapple_core.core.types import Any
 report_result = {"passed": bool, "report": str}
 
 
-@node(module="Comparison", name="Report", autotrigger=True)
+@node(module="Comparison", name="Report", autotrigger=True, pure=True)
 def report_node(*args: Any) -> report_result:
     report = ""
     success = True
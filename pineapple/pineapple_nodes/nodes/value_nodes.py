@@ -4,27 +4,27 @@ from pineapple_core.core.types import Any
 from pineapple_core.core.node_output import NodeOutput
 
 
-@node(module="Value", name="String", autotrigger=True)
+@node(module="Value", name="String", autotrigger=True, pure=True)
 def string_node(a: Hidden(str)) -> str:
     return a
 
 
-@node(module="Value", name="Int", autotrigger=True)
+@node(module="Value", name="Int", autotrigger=True, pure=True)
 def int_node(a: Hidden(int)) -> int:
     return a
 
 
-@node(module="Value", name="Bool", autotrigger=True)
+@node(module="Value", name="Bool", autotrigger=True, pure=True)
 def bool_node(a: Hidden(bool)) -> bool:
     return a
 
 
-@node(module="Value", name="List", autotrigger=True)
+@node(module="Value", name="List", autotrigger=True, pure=True)
 def list_node(a: Hidden(list)) -> list:
     return a
 
 
-@node(module="Value", name="Dict", autotrigger=True)
+@node(module="Value", name="Dict", autotrigger=True, pure=True)
 def dict_node(a: Hidden(dict)) -> dict:
     return a
 
@@ -49,13 +49,14 @@ def decompose_node_helper(node):
         for output_name, output_value in output.output_type.items():
             node.add_output(NodeOutput(node, output_name, output_value))
 
-    node.on.connect_input.add(on_connect_input)
+    node.on.add("connect_input", on_connect_input)
 
 
 @node(
     module="Value",
     name="Decompose",
     autotrigger=True,
+    pure=True,
     helper_function=decompose_node_helper,
 )
 def decompose_node(item: Any()):
@@ -28,7 +28,7 @@ async def server(websocket, path):
                 json.dumps(
                     {
                         "rid": command["rid"],
-                        "data": model_store[command["node_name"]].dump(False),
+                        "data": model_store[command["node_name"]].dump(),
                     }
                 )
             )
@@ -47,6 +47,17 @@ async def server(websocket, path):
                     }
                 )
             )
+        elif command["type"] == "on_trigger_node":
+            triggered_node = node_store[command["node_id"]]
+            await triggered_node.atrigger()
+            await websocket.send(
+                json.dumps(
+                    {
+                        "rid": command["rid"],
+                        "data": triggered_node.dump(True),
+                    }
+                )
+            )
 
         """command = command.split(" ")
         print("Received :", command)
@@ -39,9 +39,16 @@ setuptools.setup(
     ],
     package_data={'': ['pineapple/VERSION']},
     install_requires=["klotan==1.7.0", "nq==4.0.2"],
-    extras_require={"tests": ["pytest", "flake8", "pytest-cov"]},
+    extras_require={
+        "tests": ["pytest", "flake8", "pytest-cov", "numpy"],
+        "numpy": ["numpy"],
+    },
     entry_points={
-        "console_scripts": ["pineapple_server=pineapple_server.server.webserver:run"]
+        "console_scripts": [
+            "pineapple_server=pineapple_server.server.webserver:run",
+            "pineapple_load=pineapple_core.core.load_testing:main",
+            "pineapple_replay=pineapple_core.core.journal:main",
+        ]
     },
     project_urls={
         "Bug Reports": "https://sgithub.fr.world.socgen/ktollec111518/Pineapple/issues",
@@ -0,0 +1,110 @@
+import asyncio
+import time
+
+import pytest
+
+from pineapple_core.core.exceptions import RunningEventLoopError
+from pineapple_core.core.node import node
+from pineapple_core.core.types import Any
+from pineapple_nodes.nodes.flow_nodes import async_sleep_node, sleep_node, wait_until_node
+
+
+@node(module="Test", name="SlowValue", autotrigger=True)
+async def slow_value_node(value: int, delay: float) -> int:
+    await asyncio.sleep(delay)
+    return value
+
+
+@node(module="Test", name="Pair")
+def pair_node(a: Any(), b: Any()) -> Any():
+    return (a, b)
+
+
+@node(module="Test", name="AsyncFailure")
+async def async_failure_node():
+    raise RuntimeError("Async failure")
+
+
+def build_pair(delay):
+    pair = pair_node()
+    pair.connect_input(
+        a=slow_value_node().connect_input(value=1, delay=delay),
+        b=slow_value_node().connect_input(value=2, delay=delay),
+    )
+    return pair
+
+
+def test_async_node_with_trigger():
+    pair = build_pair(0)
+
+    pair.trigger()
+
+    assert pair["out"].get() == (1, 2)
+
+
+def test_atrigger_resolves_independent_inputs_concurrently():
+    pair = build_pair(0.2)
+
+    start = time.perf_counter()
+    asyncio.run(pair.atrigger())
+
+    assert pair["out"].get() == (1, 2)
+    assert time.perf_counter() - start < 0.35
+
+
+def test_atrigger_runs_scenarios_concurrently():
+    after_sleep = pair_node()
+    after_sleep.connect_input(a=1, b=2)
+    sleeps = [async_sleep_node() for _ in range(10)]
+    for sleep in sleeps:
+        sleep.connect_input(delay=0.2)
+        sleep.connect_flow(after_sleep)
+
+    async def run_all():
+        await asyncio.gather(*[sleep.atrigger() for sleep in sleeps])
+
+    start = time.perf_counter()
+    asyncio.run(run_all())
+
+    assert time.perf_counter() - start < 1
+    assert after_sleep.trigger_log["success"] == 10
+
+
+def test_sleep_nodes_do_not_block_atrigger():
+    sleep = sleep_node().connect_input(delay=0.2)
+    wait_until = wait_until_node().connect_input(condition=False, delay=0.2)
+    wait_until.get_flow(False).disable()
+
+    async def run_all():
+        await asyncio.gather(sleep.atrigger(), wait_until.atrigger())
+
+    start = time.perf_counter()
+    asyncio.run(run_all())
+
+    assert time.perf_counter() - start < 0.35
+    assert sleep.trigger_log["success"] == 1
+    assert wait_until.trigger_log["success"] == 1
+
+
+def test_atrigger_failure_with_retries():
+    failure = async_failure_node()
+    failure.set_retries(2)
+
+    with pytest.raises(RuntimeError, match="Async failure"):
+        asyncio.run(failure.atrigger())
+    assert failure.trigger_log["failure"] == 1
+
+
+def test_sync_trigger_from_running_loop():
+    sleep = sleep_node().connect_input(delay=0)
+    async_sleep = async_sleep_node().connect_input(delay=0)
+
+    async def trigger_both():
+        sleep.trigger()
+        with pytest.raises(RunningEventLoopError, match="atrigger"):
+            async_sleep.trigger()
+
+    asyncio.run(trigger_both())
+    assert sleep.trigger_log["success"] == 1
+    async_sleep.trigger()
+    assert async_sleep.trigger_log["success"] == 1
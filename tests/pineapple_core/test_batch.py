@@ -0,0 +1,96 @@
+import pytest
+
+from pineapple_core.core.exceptions import InvalidBatchInputError
+from pineapple_core.core.node import node
+from pineapple_core.core.types import Any
+from pineapple_nodes.nodes.assertion_nodes import assert_equals_node
+from pineapple_nodes.nodes.math_nodes import add_node
+from pineapple_nodes.nodes.value_nodes import int_node
+
+calls = {"constant": 0, "column": 0}
+
+
+@node(module="TestBatch", name="Constant", autotrigger=True)
+def constant_node(value: Any()) -> Any():
+    calls["constant"] += 1
+    return value
+
+
+@node(module="TestBatch", name="Double", autotrigger=True, batch=True)
+def double_column_node(values: Any()) -> Any():
+    calls["column"] += 1
+    return [value * 2 for value in values]
+
+
+@node(module="TestBatch", name="Inverse", autotrigger=True)
+def inverse_node(value: Any()) -> Any():
+    return 1 / value
+
+
+def test_batch_evaluates_every_row():
+    entry = int_node().connect_input(a=0)
+    offset = constant_node().connect_input(value=10)
+    addition = add_node().connect_input(a=entry["out"], b=offset["out"])
+    assertion = assert_equals_node().connect_input(
+        a=addition["out"], b=13, message="{} == {}"
+    )
+    calls["constant"] = 0
+
+    result = assertion.trigger_batch({entry: [1, 2, 3, 4]})
+
+    assert result.size == 4
+    assert result.column(addition["out"]) == [11, 12, 13, 14]
+    assert [outcome["result"] for outcome in result["out"]] == [False, False, True, False]
+    assert result.column(offset["out"]) == [10] * 4
+    assert calls["constant"] == 1
+    assert entry.inputs["a"].value == 0
+
+
+def test_batch_capable_nodes_receive_columns():
+    entry = int_node().connect_input(a=0)
+    double = double_column_node().connect_input(values=entry["out"])
+    calls["column"] = 0
+
+    result = double.trigger_batch({entry.inputs["a"]: list(range(1000))})
+
+    assert result["out"] == [value * 2 for value in range(1000)]
+    assert calls["column"] == 1
+
+
+def test_failed_rows_are_reported_and_skipped():
+    entry = int_node().connect_input(a=0)
+    inverse = inverse_node().connect_input(value=entry["out"])
+    double = double_column_node().connect_input(values=inverse["out"])
+
+    result = double.trigger_batch({entry: [1, 0, 4]})
+
+    assert result.failed_rows() == [1]
+    assert isinstance(result.errors[1], ZeroDivisionError)
+    assert result["out"] == [2.0, None, 0.5]
+
+
+def test_batch_columns_must_have_the_same_length():
+    first, second = int_node().connect_input(a=0), int_node().connect_input(a=0)
+    addition = add_node().connect_input(a=first["out"], b=second["out"])
+
+    with pytest.raises(InvalidBatchInputError):
+        addition.trigger_batch({first: [1, 2], second: [1]})
+    with pytest.raises(InvalidBatchInputError):
+        addition.trigger_batch({addition: [1, 2]})
+
+
+def test_batch_restores_the_outputs_that_depend_on_the_batch():
+    entry = int_node().connect_input(a=5)
+    offset = constant_node().connect_input(value=10)
+    addition = add_node().connect_input(a=entry["out"], b=offset["out"])
+    inverse = inverse_node().connect_input(value=addition["out"])
+    inverse.trigger()
+    outputs = (entry["out"], addition["out"], inverse["out"])
+    stamps = [output.stamp for output in outputs]
+
+    result = inverse.trigger_batch({entry: [-9, 10]})
+
+    assert result["out"] == [1.0, 0.05]
+    assert [output.get() for output in outputs] == [5, 15, 1 / 15]
+    assert [output.stamp for output in outputs] == stamps
+    assert offset["out"].get() == 10
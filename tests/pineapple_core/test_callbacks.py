@@ -1,5 +1,6 @@
 import pytest
 
+from pineapple_core.core.callbacks import CallbackManager
 from pineapple_core.core.node import node, wrap
 from pineapple_core.core.node_output import NodeOutput
 from pineapple_core.core.types import Any
@@ -7,6 +8,7 @@ from pineapple_nodes.nodes.flow_nodes import null_node, format_exception_node
 from pineapple_core.core.exceptions import (
     NoCallbacksError,
     CallbackManagerNotFoundError,
+    EmptyCallbackManagerError,
 )
 
 
@@ -29,18 +31,18 @@ def test_add_and_remove_callback():
 
     original = null_node()
     original.id = "success_probe_ok"
-    original.on.trigger.add(on_trigger_callback)
+    original.on.add("trigger", on_trigger_callback)
     original.trigger()
 
     assert success_probe == original.id
 
     success_probe = ":)"
-    original.on.trigger.remove(on_trigger_callback)
+    original.on.remove("trigger", on_trigger_callback)
     original.trigger()
 
     assert success_probe == ":)"
 
-    original.on.trigger.add(on_trigger_callback)
+    original.on.add("trigger", on_trigger_callback)
     original.trigger()
 
     assert success_probe == original.id
@@ -102,21 +104,21 @@ def test_callback_copy():
     original = extensible_node()
     original.id = "original"
 
-    original.on.add_output.add(on_add_output_callback, mirror_on_add_output_callback)
-    original.on.after_flow.add(mirror_on_after_flow_callback)
-    original.on.before_flow.add(mirror_on_before_flow_callback)
-    original.on.connect_flow.add(
-        on_connect_flow_callback, mirror_on_connect_flow_callback
+    original.on.add("add_output", on_add_output_callback, mirror_on_add_output_callback)
+    original.on.add("after_flow", mirror_on_after_flow_callback)
+    original.on.add("before_flow", mirror_on_before_flow_callback)
+    original.on.add(
+        "connect_flow", on_connect_flow_callback, mirror_on_connect_flow_callback
     )
-    original.on.connect_input.add(
-        on_connect_input_callback, mirror_on_connect_input_callback
+    original.on.add(
+        "connect_input", on_connect_input_callback, mirror_on_connect_input_callback
     )
-    original.on.flow_failure.add(mirror_on_flow_failure_callback)
-    original.on.set_input_value.add(
-        on_set_input_value_callback, mirror_on_set_input_value_callback
+    original.on.add("flow_failure", mirror_on_flow_failure_callback)
+    original.on.add(
+        "set_input_value", on_set_input_value_callback, mirror_on_set_input_value_callback
     )
-    original.on.trigger.add(on_trigger_callback, mirror_on_trigger_callback)
-    original.on.trigger_input.add(mirror_on_trigger_input_callback)
+    original.on.add("trigger", on_trigger_callback, mirror_on_trigger_callback)
+    original.on.add("trigger_input", mirror_on_trigger_input_callback)
 
     original.mirror = extensible_node()
     original.mirror.id = "mirror"
@@ -187,3 +189,44 @@ def test_non_existant_callback_manager_get():
     dummy_node = null_node()
     with pytest.raises(CallbackManagerNotFoundError):
         dummy_node.on.dummy_callback = lambda x: x
+
+
+def test_callback_managers_are_created_lazily():
+    def on_trigger_callback(node):
+        pass
+
+    dummy = null_node()
+    assert not dummy.on.trigger
+    assert dummy.on.trigger.callbacks == {}
+    with pytest.raises(NoCallbacksError):
+        dummy.on.trigger(dummy)
+    assert not isinstance(dummy.on.trigger, CallbackManager)
+    assert dummy.on.trigger is null_node().on.trigger
+    with pytest.raises(EmptyCallbackManagerError):
+        dummy.on.trigger.add(on_trigger_callback)
+    with pytest.raises(AttributeError):
+        dummy.on.trigger.name = "other"
+    with pytest.raises(CallbackManagerNotFoundError):
+        dummy.on.add("unknown", on_trigger_callback)
+
+    dummy.on.add("trigger", on_trigger_callback)
+    assert isinstance(dummy.on.trigger, CallbackManager)
+    assert list(dummy.on.trigger.callbacks) == [on_trigger_callback]
+    assert list(dummy.on.copy().trigger.callbacks) == [on_trigger_callback]
+    assert not dummy.on.copy().after_flow
+
+    dummy.on.after_flow = on_trigger_callback
+    assert list(dummy.on.after_flow.callbacks) == [on_trigger_callback]
+
+
+def test_copy_only_copies_created_callback_managers():
+    dummy = null_node()
+    dummy.on.add("trigger", lambda node: None)
+
+    node_callbacks_copy = dummy.on.copy()
+
+    for node_callbacks in (dummy.on, node_callbacks_copy):
+        assert not isinstance(node_callbacks.after_flow, CallbackManager)
+        assert node_callbacks.after_flow is null_node().on.after_flow
+    assert isinstance(node_callbacks_copy.trigger, CallbackManager)
+    assert node_callbacks_copy.trigger is not dummy.on.trigger
@@ -0,0 +1,131 @@
+import pytest
+
+from pineapple_core.core.node import node, Node
+from pineapple_core.core.types import Any
+
+calls = {"shared": 0}
+
+
+@node(module="Test", name="SharedProducer", autotrigger=True)
+def shared_producer_node() -> int:
+    calls["shared"] += 1
+    return calls["shared"]
+
+
+@node(module="Test", name="Increment", autotrigger=True)
+def increment_node(a: int) -> int:
+    return a + 1
+
+
+@node(module="Test", name="Consumer")
+def consumer_node(a: Any(), b: Any()) -> Any():
+    return (a, b)
+
+
+@node(module="Test", name="Counter")
+def counter_node(self: Node, value: int, limit: int) -> int:
+    self.inputs["value"].value = value + 1
+    if value >= limit:
+        self.get_flow("next").disable()
+    return value
+
+
+@node(module="Test", name="Record")
+def record_node(records: list, a: Any()):
+    records.append(a)
+
+
+def test_shared_producer_runs_once_per_trigger():
+    calls["shared"] = 0
+    producer = shared_producer_node()
+    first, second = consumer_node(), consumer_node()
+    first.connect_input(a=producer, b=increment_node().connect_input(a=producer))
+    second.connect_input(a=producer, b=producer)
+    first.connect_flow(second)
+
+    first.trigger()
+
+    assert calls["shared"] == 1
+    assert first["out"].get() == (1, 2)
+    assert second["out"].get() == (1, 1)
+
+    first.trigger()
+
+    assert calls["shared"] == 2
+    assert second["out"].get() == (2, 2)
+
+
+def test_changed_sources_are_recomputed_within_a_trigger():
+    records = []
+    counter = counter_node()
+    counter.connect_input(value=0, limit=3)
+    recorder = record_node()
+    recorder.connect_input(records=records, a=increment_node().connect_input(a=counter))
+    counter.connect_flow(recorder, "next")
+    recorder.connect_flow(counter)
+
+    counter.trigger()
+
+    assert records == [1, 2, 3]
+
+
+def test_autotrigger_without_sources_is_recomputed_in_loops():
+    calls["shared"] = 0
+    records = []
+    counter = counter_node()
+    counter.connect_input(value=0, limit=3)
+    recorder = record_node()
+    recorder.connect_input(records=records, a=shared_producer_node())
+    counter.connect_flow(recorder, "next")
+    recorder.connect_flow(counter)
+
+    counter.trigger()
+
+    assert records == [1, 2, 3]
+
+
+executions = []
+
+
+@node(module="Test", name="PureAdd", autotrigger=True, pure=True)
+def pure_add_node(a: int, b: int) -> int:
+    executions.append((a, b))
+    return a + b
+
+
+def test_pure_autotrigger_nodes_are_only_recomputed_when_inputs_change():
+    executions.clear()
+    left, right = pure_add_node(), pure_add_node()
+    left.connect_input(a=1, b=2)
+    right.connect_input(a=10, b=20)
+    total = pure_add_node()
+    total.connect_input(a=left, b=right)
+    consumer = consumer_node()
+    consumer.connect_input(a=total, b=None)
+
+    consumer.trigger()
+    assert executions == [(1, 2), (10, 20), (3, 30)]
+    assert consumer["out"].get() == (33, None)
+
+    executions.clear()
+    consumer.trigger()
+    assert executions == []
+    assert consumer.trigger_log["success"] == 2
+
+    right.inputs["b"].set(5)
+    consumer.trigger()
+    assert executions == [(10, 5), (3, 15)]
+    assert consumer["out"].get() == (18, None)
+
+
+def test_failed_pure_node_is_executed_again():
+    executions.clear()
+    adder = pure_add_node()
+    adder.connect_input(a=1, b="2")
+    consumer = consumer_node()
+    consumer.connect_input(a=adder, b=None)
+
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            consumer.trigger()
+    assert len(executions) == 2
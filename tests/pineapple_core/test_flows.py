@@ -1,3 +1,6 @@
+import time
+
+from pineapple_core.core.flows import FlowQueue
 from pineapple_core.core.node import node
 from pineapple_nodes.nodes.flow_nodes import null_node
 
@@ -99,3 +102,83 @@ def test_flow_repr():
         dummy.get_flow("test_flow").__repr__()
         == "Flow(name='test_flow', priority=1, node=Flow.Null(dummy2))"
     )
+
+
+def test_flows_are_indexed_by_name():
+    dummy = null_node()
+    dummy.connect_flow(null_node(), "a").connect_flow(null_node(), ["unhashable"])
+    assert dummy.get_flow("a") is dummy.flows[0]
+    assert dummy.get_flow(["unhashable"]) is dummy.flows[1]
+    assert dummy.get_flow("missing") is None
+    dummy.flows = dummy.flows[1:]
+    assert dummy.get_flow("a") is None
+
+
+def test_flow_queue_follows_priority_changes():
+    nodes = [magic_number_node(number) for number in range(4)]
+    seq = null_node()
+    for current in nodes:
+        seq.connect_flow(current)
+    queue = FlowQueue(seq.flows)
+
+    assert queue.pop() is seq.flows[0]
+    seq.flows[3].increase_priority()
+    seq.flows[3].increase_priority()
+    seq.flows[1].disable()
+    assert queue.pop() is seq.flows[3]
+    assert queue.pop() is seq.flows[2]
+    assert queue.pop() is None
+    queue.reset()
+    assert queue.peek() is seq.flows[0]
+
+
+def test_flow_queue_ignores_the_flows_of_other_nodes():
+    seq, other = null_node(), null_node()
+    seq.connect_flow(null_node())
+    seq.connect_flow(null_node())
+    other.connect_flow(null_node())
+    queue = FlowQueue(seq.flows)
+    assert queue.peek() is seq.flows[0]
+    heap = queue._heap
+
+    other.flows[0].disable()
+    assert queue.peek() is seq.flows[0]
+    assert queue._heap is heap
+
+    seq.connect_flow(null_node())
+    assert queue.peek() is seq.flows[0]
+    assert queue._heap is not heap
+
+
+def test_flow_cost_does_not_depend_on_the_amount_of_flows():
+    def cost_per_flow(size):
+        start = null_node()
+        for _ in range(size):
+            start.connect_flow(null_node())
+        best = float("inf")
+        for _ in range(3):
+            begin = time.perf_counter()
+            start.trigger()
+            best = min(best, time.perf_counter() - begin)
+        return best / size
+
+    assert cost_per_flow(2000) < 2 * cost_per_flow(250)
+
+
+def test_trigger_does_not_copy_flows():
+    seen = []
+    seq = null_node()
+    seq.connect_flow(null_node())
+    seq.connect_flow(null_node(), disabled=True)
+    flows = list(seq.flows)
+
+    def on_trigger(node):
+        seen.append(list(node.flows))
+        node.flows[1].enable()
+
+    seq.on.trigger = on_trigger
+    seq.trigger()
+
+    assert seen == [flows]
+    assert seq.flows == flows
+    assert [flow.priority for flow in seq.flows] == [2, -1]
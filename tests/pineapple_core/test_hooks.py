@@ -0,0 +1,79 @@
+import pytest
+
+from pineapple_core.core import hooks
+from pineapple_core.core.hooks import HookRegistry, attach_hooks, global_hooks
+from pineapple_core.core.node import node
+from pineapple_nodes.nodes.flow_nodes import null_node
+from pineapple_nodes.nodes.math_nodes import add_node
+
+
+@node(module="Test", name="Failing")
+def failing_node():
+    raise RuntimeError("failure")
+
+
+def build_scenario():
+    start, end = null_node(), null_node()
+    total = add_node().connect_input(a=1, b=2)
+    start.connect_flow(total)
+    total.connect_flow(end)
+    return start, total, end
+
+
+def test_global_hooks_observe_every_node():
+    start, total, end = build_scenario()
+    events = []
+
+    def on_start(node):
+        events.append(("start", node))
+
+    def on_end(node, duration):
+        events.append(("end", node))
+
+    def on_flow(node, flow):
+        events.append(("flow", node))
+
+    global_hooks.subscribe("trigger_start", on_start)
+    global_hooks.subscribe("trigger_end", on_end)
+    global_hooks.subscribe("after_flow", on_flow)
+    try:
+        assert hooks.enabled
+        start.trigger()
+    finally:
+        global_hooks.clear()
+
+    assert not hooks.enabled
+    assert events == [
+        ("start", start),
+        ("end", start),
+        ("start", total),
+        ("end", total),
+        ("start", end),
+        ("end", end),
+        ("flow", total),
+        ("flow", start),
+    ]
+    start.trigger()
+    assert len(events) == 8
+
+
+def test_scenario_hooks_and_failures():
+    start, total, _ = build_scenario()
+    other_start, _, _ = build_scenario()
+    failing = failing_node()
+    total.connect_flow(failing)
+    registry = HookRegistry()
+    triggered, failures = [], []
+    registry.subscribe("trigger_start", triggered.append)
+    registry.subscribe("failure", lambda node, exception: failures.append(node))
+    attach_hooks(registry, start)
+
+    other_start.trigger()
+    assert triggered == []
+    with pytest.raises(RuntimeError):
+        start.trigger()
+    assert failing in triggered and failures == [failing]
+
+    registry.unsubscribe("trigger_start", triggered.append)
+    registry.clear()
+    assert not hooks.enabled
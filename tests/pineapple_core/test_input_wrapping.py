@@ -1,4 +1,5 @@
 from pineapple_core.core.node import Node, node, wrap
+from pineapple_core.core.types import Any
 
 
 def forward_arg_helper(self, number):
@@ -27,3 +28,21 @@ def test_that_checks_input_wrapping():
     check.connect_input(dictionary=wrap({"a": eleven, "b": [33, twentytwo]}))
     check.trigger()
     assert check["out"].get() is True
+
+
+@node(module="Test", name="NodeThatReturnsItsValue")
+def identity_node(value: Any()) -> Any():
+    return value
+
+
+def test_wrapped_values_share_unchanged_parts():
+    eleven = number_node(11)
+    body = {"headers": {"type": "json"}, "items": [eleven, (1, eleven)], eleven: "key"}
+    identity = identity_node().connect_input(value=wrap(body))
+    identity.trigger()
+
+    result = identity["out"].get()
+    assert result == {"headers": {"type": "json"}, "items": [11, (1, 11)], 11: "key"}
+    assert result["headers"] is body["headers"]
+    assert body["items"][0] is eleven
+    assert identity.inputs["value"].value.template.references == (eleven, eleven, eleven)
@@ -0,0 +1,168 @@
+import json
+
+import pytest
+
+from pineapple_core.core.journal import ExecutionJournal, hash_value, load_journal, main
+from pineapple_core.core.node import node
+from pineapple_core.core.types import Any
+from pineapple_nodes.nodes.flow_nodes import null_node
+
+
+@node(module="Test", name="Source", autotrigger=True)
+def source_node() -> int:
+    return 20
+
+
+@node(module="Test", name="Double")
+def double_node(a: int) -> int:
+    return a * 2
+
+
+@node(module="Test", name="Failing")
+def failing_node(a: int):
+    raise RuntimeError("failure")
+
+
+def build_scenario():
+    start = null_node()
+    source = source_node()
+    double = double_node().connect_input(a=source["out"])
+    start.connect_flow(double)
+    return start, source, double
+
+
+def test_ring_buffer_records_execution():
+    start, source, double = build_scenario()
+    journal = ExecutionJournal(ring_size=50).attach(start)
+    start.trigger()
+    entries = journal.entries()
+    journal.close()
+
+    kinds = [(entry["kind"], entry["node"]) for entry in entries]
+    assert kinds == [
+        ("trigger", start.full_name()),
+        ("result", start.full_name()),
+        ("flow", start.full_name()),
+        ("trigger", double.full_name()),
+        ("autotrigger", double.full_name()),
+        ("trigger", source.full_name()),
+        ("result", source.full_name()),
+        ("result", double.full_name()),
+        ("flow_end", start.full_name()),
+    ]
+    assert [entry["seq"] for entry in entries] == list(range(len(entries)))
+    result = entries[-2]
+    assert result["outputs"] == {"out": 40}
+    assert result["inputs"] == {"a": hash_value(20)}
+    assert entries[2]["target"] == double.full_name()
+
+    for _ in range(10):
+        start.trigger()
+    assert len(journal.entries()) == 9
+    assert not start.on.trigger
+
+
+def test_ring_buffer_is_bounded():
+    start, _, double = build_scenario()
+    journal = ExecutionJournal(ring_size=5).attach(start)
+    for _ in range(3):
+        start.trigger()
+    entries = journal.entries()
+    journal.close()
+    assert len(entries) == 5
+    assert entries[-2]["kind"] == "result" and entries[-2]["node"] == double.full_name()
+
+
+def test_file_journal_and_replay(tmp_path, capsys):
+    start, source, double = build_scenario()
+    failing = failing_node().connect_input(a=double["out"])
+    double.connect_flow(failing)
+    path = str(tmp_path / "journal.ndjson")
+    with ExecutionJournal(path).attach(start) as journal:
+        with pytest.raises(RuntimeError):
+            start.trigger()
+        journal.flush()
+        replay = journal.replay()
+
+    header = json.loads(open(path).readline())
+    assert header["kind"] == "journal"
+    failure = replay.find(kind="failure")
+    assert [entry["node"] for entry in failure] == [failing.full_name()]
+    assert "failure" in failure[0]["exception"]
+
+    replay = load_journal(path)
+    steps = list(replay)
+    assert len(steps) == len(replay.entries) and replay.step() is None
+    assert replay.outputs[double.full_name()] == {"out": 40}
+    replay.seek(0)
+    assert replay.outputs == {}
+    replay.seek(replay.entries.index(replay.find("result", source.full_name())[0]) + 1)
+    assert replay.outputs == {start.full_name(): {}, source.full_name(): {"out": 20}}
+
+    double["out"].value = None
+    replay.seek(len(replay.entries))
+    replay.apply(start)
+    assert double["out"].value == 40
+
+    main([path, "--kind", "result", "--node", double.full_name()])
+    printed = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["outputs"] for line in printed] == [{"out": 40}]
+
+
+class Unrepresentable:
+    def __repr__(self):
+        raise RuntimeError("no repr")
+
+
+@node(module="Test", name="Unrepresentable")
+def unrepresentable_node() -> Any():
+    return Unrepresentable()
+
+
+def test_writer_survives_unserialisable_values(tmp_path):
+    start = unrepresentable_node()
+    after = null_node()
+    start.connect_flow(after)
+    path = str(tmp_path / "journal.ndjson")
+    journal = ExecutionJournal(path).attach(start)
+    start.trigger()
+    start.trigger()
+    assert journal.flush(timeout=5)
+    journal.close(timeout=5)
+    assert not journal.flush()
+
+    entries = load_journal(path).entries
+    assert len(entries) == 2 * 6
+    assert all(entry["node"] for entry in entries)
+    results = [entry for entry in entries if entry["node"] == start.full_name()]
+    assert results[1]["outputs"] == {"out": "<Unrepresentable without repr>"}
+
+
+@node(module="Test", name="Mutable")
+def mutable_node() -> dict:
+    return {"a": 1}
+
+
+@node(module="Test", name="Variadic")
+def variadic_node(*args, **kwargs) -> int:
+    return len(args) + len(kwargs)
+
+
+def test_results_are_snapshots():
+    mutable = mutable_node()
+    variadic = variadic_node().connect_input(1, 2, c=3)
+    journal = ExecutionJournal().attach(mutable).attach(variadic)
+    mutable.trigger()
+    mutable["out"].value["a"] = 999
+    variadic.trigger()
+    entries = journal.entries()
+    journal.close()
+
+    results = [entry for entry in entries if entry["kind"] == "result"]
+    assert results[0]["outputs"] == {"out": {"a": 1}}
+    assert results[1]["inputs"] == {
+        "0": hash_value(1),
+        "1": hash_value(2),
+        "c": hash_value(3),
+    }
+    assert results[1]["outputs"] == {"out": 3}
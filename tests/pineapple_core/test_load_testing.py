@@ -0,0 +1,95 @@
+import json
+import time
+
+import pytest
+
+from pineapple_core.core.exceptions import InvalidLoadTestError
+from pineapple_core.core.load_testing import get_percentiles, main, run_load_test
+from pineapple_core.core.node import node, Node
+from pineapple_nodes.nodes.flow_nodes import null_node, range_node, sleep_node
+
+
+@node(module="TestLoad", name="FailEvery")
+def fail_every_node(self: Node, every: int):
+    if self.trigger_log["trigger"] % every == 0:
+        raise ValueError("Planned failure")
+
+
+@node(module="TestLoad", name="SlowEvery")
+def slow_every_node(self: Node, every: int, delay: float):
+    if self.trigger_log["trigger"] % every == 0:
+        time.sleep(delay)
+
+
+def build_scenario():
+    start = null_node()
+    start.connect_flow(sleep_node().connect_input(delay=0.01))
+    return start
+
+
+def test_threads_run_iterations_concurrently():
+    report = run_load_test(build_scenario(), concurrency=5, iterations=20)
+
+    assert len(report.latencies) == 20
+    assert report.error_count == 0
+    assert report.duration < 0.2
+    dump = report.dump()
+    sleep_stats = [stats for name, stats in dump["nodes"].items() if "Flow.Sleep" in name]
+    assert sleep_stats[0]["count"] == 20
+    assert sleep_stats[0]["p50"] >= 0.01
+
+
+def test_node_percentiles_use_every_trigger():
+    start = range_node().connect_input(start=0, end=10, step=1)
+    start.connect_flow(slow_every_node().connect_input(every=10, delay=0.02))
+
+    report = run_load_test(start, concurrency=2, iterations=4)
+
+    dump = report.dump(percentiles=(50, 95))
+    slow_stats = [stats for name, stats in dump["nodes"].items() if "SlowEvery" in name]
+    assert slow_stats[0]["count"] == 40
+    assert slow_stats[0]["p50"] < 0.005
+    assert slow_stats[0]["p95"] >= 0.02
+
+
+def test_asyncio_mode_and_errors_are_reported():
+    start = null_node()
+    start.connect_flow(fail_every_node().connect_input(every=2))
+
+    report = run_load_test(start, concurrency=2, iterations=8, mode="asyncio")
+
+    assert report.errors == {"ValueError": 4}
+    assert report.throughput > 0
+
+
+def test_processes_mode_loads_the_scenario_by_path():
+    report = run_load_test(
+        f"{__name__}:build_scenario", concurrency=2, iterations=4, mode="processes"
+    )
+
+    assert len(report.latencies) == 4
+    assert report.error_count == 0
+
+
+def test_invalid_load_tests_are_rejected():
+    with pytest.raises(InvalidLoadTestError):
+        run_load_test(build_scenario(), mode="fibers")
+    with pytest.raises(InvalidLoadTestError):
+        run_load_test(build_scenario(), mode="processes")
+
+
+def test_percentiles_use_the_nearest_rank():
+    assert get_percentiles(list(range(1, 101)), (50, 99, 100)) == {
+        "p50": 50,
+        "p99": 99,
+        "p100": 100,
+    }
+    assert get_percentiles([], (50,)) == {"p50": None}
+
+
+def test_command_line_prints_the_report(capsys):
+    main([f"{__name__}:build_scenario", "-c", "2", "-n", "4"])
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["iterations"] == 4
+    assert report["mode"] == "threads"
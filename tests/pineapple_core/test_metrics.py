@@ -0,0 +1,91 @@
+import json
+import time
+
+from pineapple_core.core.metrics import (
+    BOUNDS,
+    LatencyHistogram,
+    aggregate_trigger_logs,
+    get_scenario_metrics,
+)
+from pineapple_core.core.node import node
+from pineapple_core.core.runs import ScenarioTemplate
+from pineapple_nodes.nodes.flow_nodes import null_node
+
+
+@node(module="Test", name="Slow", autotrigger=True)
+def slow_node() -> int:
+    time.sleep(0.002)
+    return 1
+
+
+@node(module="Test", name="Increment")
+def increment_node(a: int) -> int:
+    return a + 1
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+    for _ in range(90):
+        histogram.record(0.001)
+    for _ in range(10):
+        histogram.record(0.1)
+    assert histogram.count == 100
+    assert 0.001 <= histogram.percentile(50) < 0.0012
+    assert 0.001 <= histogram.percentile(90) < 0.0012
+    assert histogram.percentile(95) == 0.1
+    assert histogram.percentile(100) == histogram.maximum == 0.1
+    histogram.record(BOUNDS[-1] * 2)
+    assert histogram.percentile(100) == BOUNDS[-1] * 2
+
+
+def test_histogram_merge_and_copy():
+    first, second = LatencyHistogram(), LatencyHistogram()
+    first.record(0.001)
+    second.record(0.01)
+    second.record(0.01)
+    copy = first.copy()
+    first.merge(second)
+    assert first.count == 3 and first.maximum == 0.01
+    assert abs(first.total - 0.021) < 1e-9
+    assert copy.count == 1
+    assert sum(amount for _, amount in first.dump()["buckets"]) == 3
+
+
+def test_trigger_records_histograms():
+    slow = slow_node()
+    increment = increment_node().connect_input(a=slow["out"])
+    assert "wall_time" not in increment.trigger_log
+    increment.trigger()
+    increment.trigger()
+    trigger_log = increment.trigger_log
+    assert trigger_log["success"] == 2
+    assert trigger_log["wall_time"].count == 2
+    assert trigger_log["self_time"].count == 2
+    assert trigger_log["wait_time"].percentile(50) >= 0.002
+    assert trigger_log["wall_time"].total >= trigger_log["wait_time"].total
+    assert trigger_log["cpu_time"].count == 1
+    assert slow.trigger_log["wait_time"].maximum < 0.002
+    assert slow.trigger_log["self_time"].percentile(50) >= 0.002
+
+
+def test_scenario_metrics():
+    start, end = null_node(), increment_node().connect_input(a=1)
+    start.connect_flow(end)
+    start.trigger()
+    total = aggregate_trigger_logs([start, end])
+    assert total["success"] == 2 and total["self_time"].count == 2
+    metrics = json.loads(json.dumps(get_scenario_metrics(start, percentiles=(50, 99.9))))
+    assert set(metrics["nodes"]) == {start.full_name(), end.full_name()}
+    assert metrics["scenario"]["self_time"]["count"] == 2
+    assert "p99.9" in metrics["scenario"]["wall_time"]
+
+
+def test_runs_do_not_share_histograms():
+    start = null_node()
+    start.trigger()
+    template = ScenarioTemplate(start)
+    run = template.run()
+    assert start.trigger_log["self_time"].count == 1
+    with run.activate():
+        assert start.trigger_log["self_time"].count == 2
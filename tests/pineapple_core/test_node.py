@@ -1,4 +1,4 @@
-from pineapple_core.core.node import wrap, node, copy_scenario_state
+from pineapple_core.core.node import wrap, node, copy_scenario_state, get_whole_scenario
 from pineapple_core.core.types import Any
 from pineapple_core.core.node_output import NodeOutput
 from klotan.match import OptionalKey
@@ -356,6 +356,7 @@ def test_node_dump():
                 "value": None,
             }
         },
+        "type_check_policy": {"mode": "strict", "sample_rate": 100},
         "args_inputs": [],
         "kwargs_inputs": {},
         "flows": [],
@@ -410,3 +411,46 @@ def test_copy_scenario():
 
     assert dummy2.id == scenario_copy.id
     assert len(dummy2.flows) == len(scenario_copy.flows)
+
+
+def test_copy_scenario_rewires_variadic_inputs():
+    dummy4 = dumb_autotrigger_node()
+    dummy5 = dumb_autotrigger_node()
+    dummy6 = dummy_with_args_and_kwargs()
+    dummy6.connect_input(dummy4, x=dummy5)
+
+    scenario_copy = copy_scenario_state(dummy6)
+
+    copied_arg_output = scenario_copy.args_inputs[0].connected_output
+    copied_kwarg_output = scenario_copy.kwargs_inputs["x"].connected_output
+    assert copied_arg_output.id == dummy4["out"].id
+    assert copied_arg_output is not dummy4["out"]
+    assert copied_arg_output.node is not dummy4
+    assert copied_kwarg_output.node.id == dummy5.id
+    assert copied_kwarg_output.node is not dummy5
+
+
+def test_whole_scenario_order_is_stable():
+    first = very_dummy_node()
+    last = first
+    for _ in range(50):
+        next_node = very_dummy_node()
+        last.connect_flow(next_node)
+        last.connect_flow(dumb_autotrigger_node())
+        last = next_node
+
+    scenario = get_whole_scenario(first)
+    scenario_copy = get_whole_scenario(copy_scenario_state(first))
+
+    assert len(scenario) == len(set(scenario)) == 101
+    assert [node.id for node in scenario] == [node.id for node in scenario_copy]
+
+
+def test_core_objects_are_slotted():
+    dummy = dummy_node()
+    dummy.connect_flow(dummy_node())
+    for item in [dummy.flows[0], *dummy.inputs.values(), *dummy.outputs.values()]:
+        assert not hasattr(item, "__dict__")
+    assert dummy.outputs["out"]._id is None
+    output_id = dummy.outputs["out"].id
+    assert dummy.outputs["out"].id == output_id
@@ -0,0 +1,85 @@
+import functools
+import gc
+import weakref
+
+import pytest
+
+from pineapple_core.core.exceptions import InvalidNodeFunctionReturnTypeError
+from pineapple_core.core.input_flags import Hidden, Optional
+from pineapple_core.core.node import Node, node
+from pineapple_core.core.node_model import NodeModel, get_node_model
+from pineapple_core.core.store import model_store
+from pineapple_core.core.types import Any
+
+
+@node(module="Test", name="ModelNode")
+def model_node(a: int, b: Optional(Any()), c: Hidden(int), *args: int) -> (int, int):
+    return a, c
+
+
+def test_model_is_introspected_once():
+    model = model_store["Test.ModelNode"]
+    first_node, second_node = model_node(), model_node()
+
+    assert isinstance(model, NodeModel)
+    assert first_node.model is model and second_node.model is model
+    assert first_node.copy().model is model
+    assert [(name, hidden, optional) for name, _, hidden, optional in model.inputs] == [
+        ("a", False, False),
+        ("b", False, True),
+        ("c", True, False),
+    ]
+    assert list(first_node.outputs) == [0, 1]
+    assert first_node.inputs["c"].hidden and first_node.inputs["b"].optional
+    assert first_node.inputs is not second_node.inputs
+    assert first_node.allow_args and not first_node.allow_kwargs
+
+
+def test_nodes_created_without_model_use_the_cache():
+    def function(a: int) -> int:
+        return a
+
+    first_node = Node(function, "Test", "Cached", True)
+    second_node = Node(function, "Test", "Cached", True)
+
+    assert first_node.model is second_node.model
+    assert get_node_model(function, "Test", "Cached", True) is first_node.model
+
+
+def test_models_are_released_with_their_function():
+    def function(a: int) -> int:
+        return a
+
+    Node(function, "Test", "Released", True)
+    reference = weakref.ref(function)
+    del function
+    gc.collect()
+
+    assert reference() is None
+
+
+def test_wrapped_functions_have_their_own_model():
+    def function(a: int) -> int:
+        return a
+
+    @functools.wraps(function)
+    def wrapper(a: int) -> int:
+        return function(a)
+
+    model = get_node_model(function, "Test", "Wrapped", True)
+    wrapper_model = get_node_model(wrapper, "Test", "Wrapped", True)
+
+    assert model.function is function and wrapper_model.function is wrapper
+    assert get_node_model(function, "Test", "Wrapped", True) is model
+    assert get_node_model(wrapper, "Test", "Wrapped", True) is wrapper_model
+
+
+def test_model_is_immutable_and_validated():
+    with pytest.raises(AttributeError):
+        model_store["Test.ModelNode"].name = "Other"
+
+    def invalid_function() -> 42:
+        pass
+
+    with pytest.raises(InvalidNodeFunctionReturnTypeError):
+        NodeModel(invalid_function, "Test", "Invalid", False)
@@ -39,7 +39,7 @@ def test_that_checks_priority_stacking():
     d = success_node()
     d.id = "d"
 
-    d.on.trigger.add(increase_d_trigger_count)
+    d.on.add("trigger", increase_d_trigger_count)
 
     a.connect_flow(b, 1)
     a.connect_flow(c, 2)
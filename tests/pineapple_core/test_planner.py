@@ -0,0 +1,103 @@
+import pytest
+
+from pineapple_core.core.exceptions import AutotriggerCycleError
+from pineapple_core.core.node import node, wrap
+from pineapple_core.core.planner import get_plan
+from pineapple_core.core.types import Any
+
+
+@node(module="Test", name="Source", autotrigger=True)
+def source_node() -> int:
+    return 2
+
+
+@node(module="Test", name="Double", autotrigger=True)
+def double_node(a: int) -> int:
+    return a * 2
+
+
+@node(module="Test", name="AddTogether", autotrigger=True)
+def add_together_node(a: int, b: int) -> int:
+    return a + b
+
+
+@node(module="Test", name="Collect")
+def collect_node(values: Any()) -> Any():
+    return values
+
+
+def test_plan_is_topologically_ordered():
+    source = source_node()
+    left, right = double_node(), double_node()
+    left.connect_input(a=source)
+    right.connect_input(a=source)
+    merge = add_together_node()
+    merge.connect_input(a=left, b=right)
+    consumer = collect_node()
+    consumer.connect_input(values=merge)
+
+    steps = [step.autotriggered_node for step in get_plan(consumer).steps]
+
+    assert steps == [source, left, right, merge]
+    consumer.trigger()
+    assert consumer["out"].get() == 8
+    assert source.trigger_log["trigger"] == 1
+
+
+def test_plan_follows_wrapped_values():
+    source = source_node()
+    double = double_node()
+    double.connect_input(a=source)
+    consumer = collect_node()
+    consumer.connect_input(values=wrap({"first": source, "second": [double]}))
+
+    consumer.trigger()
+
+    assert consumer["out"].get() == {"first": 2, "second": [4]}
+
+
+def test_plan_is_cached_until_the_graph_changes():
+    source = source_node()
+    consumer = collect_node()
+    consumer.connect_input(values=source)
+
+    plan = get_plan(consumer)
+    consumer.trigger()
+    assert get_plan(consumer) is plan
+
+    double = double_node()
+    double.connect_input(a=source)
+    consumer.connect_input(values=double)
+    assert get_plan(consumer) is not plan
+    consumer.trigger()
+    assert consumer["out"].get() == 4
+
+
+def test_plan_is_invalidated_when_a_wrapped_value_is_set():
+    source = source_node()
+    double = double_node()
+    double.connect_input(a=source)
+    consumer = collect_node()
+    consumer.connect_input(values=1)
+
+    plan = get_plan(consumer)
+    assert plan.steps == []
+    consumer.inputs["values"].set(wrap([double]))
+    assert [step.autotriggered_node for step in get_plan(consumer).steps] == [source, double]
+    consumer.trigger()
+    assert consumer["out"].get() == [4]
+
+    consumer.inputs["values"].set(3)
+    assert get_plan(consumer).steps == []
+
+
+def test_autotrigger_cycle_is_detected():
+    first, second = double_node(), double_node()
+    first.connect_input(a=second)
+    second.connect_input(a=first)
+    consumer = collect_node()
+    consumer.connect_input(values=first)
+
+    with pytest.raises(AutotriggerCycleError):
+        consumer.trigger()
+    assert first.trigger_log["trigger"] == 0
@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from pineapple_core.core.exceptions import (
+    InvalidNodeOutputTypeError,
+    InvalidProcessNodeError,
+)
+from pineapple_core.core.node import node, Node
+
+
+@node(module="TestProcess", name="SumOfSquares", autotrigger=True, process=True)
+def sum_of_squares_node(limit: int) -> int:
+    return sum(i * i for i in range(limit))
+
+
+@node(module="TestProcess", name="Pid", process=True)
+def pid_node() -> int:
+    return os.getpid()
+
+
+@node(module="TestProcess", name="Failing", process=True)
+def failing_node(value: int) -> int:
+    raise ValueError(f"Failing with {value}")
+
+
+@node(module="TestProcess", name="WrongType", process=True)
+def wrong_type_node() -> int:
+    return "not an int"
+
+
+@node(module="TestProcess", name="Consumer")
+def consumer_node(value: int):
+    pass
+
+
+def test_process_node_runs_in_another_process():
+    pid = pid_node()
+    pid.trigger()
+
+    assert pid["out"].get() != os.getpid()
+
+
+def test_process_node_can_be_autotriggered():
+    squares = sum_of_squares_node()
+    squares.connect_input(limit=1000)
+    consumer = consumer_node()
+    consumer.connect_input(value=squares["out"])
+
+    consumer.trigger()
+
+    assert consumer.inputs["value"].get() == sum(i * i for i in range(1000))
+
+
+def test_process_node_failure_is_retried():
+    failing = failing_node()
+    failing.connect_input(value=3)
+    failing.set_retries(2)
+
+    with pytest.raises(ValueError, match="Failing with 3"):
+        failing.trigger()
+    assert failing.trigger_log["failure"] == 1
+
+
+def test_process_node_result_is_type_checked():
+    with pytest.raises(InvalidNodeOutputTypeError):
+        wrong_type_node().trigger()
+
+
+def test_self_aware_process_node_is_rejected():
+    @node(module="TestProcess", name="Aware", process=True)
+    def aware_node(self: Node):
+        pass
+
+    with pytest.raises(InvalidProcessNodeError):
+        aware_node()
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from pineapple_core.core import hooks
+from pineapple_core.core.node import node
+from pineapple_core.core.profiler import Profiler, profile_scenario
+from pineapple_nodes.nodes.flow_nodes import null_node
+
+
+@node(module="Test", name="SlowSource", autotrigger=True)
+def slow_source_node() -> int:
+    time.sleep(0.001)
+    return 1
+
+
+@node(module="Test", name="SlowIncrement")
+def slow_increment_node(a: int) -> int:
+    time.sleep(0.002)
+    return a + 1
+
+
+@node(module="Test", name="Failing")
+def failing_node():
+    raise RuntimeError("failure")
+
+
+def build_scenario():
+    start, end = null_node(), null_node()
+    source = slow_source_node()
+    increment = slow_increment_node().connect_input(a=source["out"])
+    start.connect_flow(increment)
+    increment.connect_flow(end)
+    return start, source, increment, end
+
+
+def test_folded_stacks_are_nested_and_aggregated():
+    start, source, increment, _ = build_scenario()
+    profiler = profile_scenario(start, iterations=3)
+    assert not hooks.enabled
+    stacks = profiler.folded_stacks()
+    name, source_name = increment.full_name(), source.full_name()
+
+    function = stacks[(name, f"{name} [function]")]
+    assert function >= 3 * 0.002
+    backtrigger = (name, f"{name} [inputs]", source_name, f"{source_name} [function]")
+    assert stacks[backtrigger] >= 3 * 0.001
+    assert (name, f"{name} [function]", f"{name} [set outputs]") in stacks
+    assert (f"{start.full_name()} [flow]",) in stacks
+
+    lines = profiler.to_folded().splitlines()
+    assert f"{name};{name} [function] {round(function * 1e6)}" in lines
+
+
+def test_speedscope_timeline(tmp_path):
+    start, _, increment, _ = build_scenario()
+    profiler = profile_scenario(start, iterations=2)
+    path = tmp_path / "profile.speedscope.json"
+    profiler.write_speedscope(str(path), name="scenario")
+    speedscope = json.loads(path.read_text())
+    assert speedscope["name"] == "scenario"
+    frames = [frame["name"] for frame in speedscope["shared"]["frames"]]
+    assert increment.full_name() in frames
+
+    profile = speedscope["profiles"][0]
+    assert profile["type"] == "evented"
+    stack, previous = [], 0
+    for event in profile["events"]:
+        assert event["at"] >= previous
+        previous = event["at"]
+        if event["type"] == "O":
+            stack.append(event["frame"])
+        else:
+            assert stack.pop() == event["frame"]
+    assert stack == [] and previous <= profile["endValue"]
+
+
+def test_aggregated_profile_without_timeline(tmp_path):
+    start, _, increment, _ = build_scenario()
+    profiler = profile_scenario(start, iterations=5, timeline=False)
+    assert all(not timeline.events for timeline in profiler.timelines.values())
+    profile = profiler.to_speedscope()["profiles"][0]
+    assert profile["type"] == "sampled"
+    assert len(profile["samples"]) == len(profile["weights"])
+    assert profile["endValue"] >= 5 * 0.003
+
+    path = tmp_path / "profile.folded"
+    profiler.write_folded(str(path))
+    assert path.read_text() == profiler.to_folded()
+
+
+def test_failures_and_async_triggers():
+    start, _, increment, _ = build_scenario()
+    failing = failing_node()
+    increment.connect_flow(failing)
+    async_start, _, async_increment, _ = build_scenario()
+    with Profiler() as profiler:
+        with pytest.raises(RuntimeError):
+            start.trigger()
+        asyncio.run(async_start.atrigger())
+    assert all(not timeline.stack for timeline in profiler.timelines.values())
+    stacks = profiler.folded_stacks()
+    assert (failing.full_name(), f"{failing.full_name()} [function]") in stacks
+    assert sum(
+        duration
+        for stack, duration in stacks.items()
+        if stack[-1] == f"{async_increment.full_name()} [function]"
+    ) >= 0.002
@@ -0,0 +1,80 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from pineapple_core.core.node import node
+from pineapple_core.core.runs import RunContext, ScenarioTemplate, current_run
+from pineapple_core.core.types import Any
+from pineapple_nodes.nodes.flow_nodes import if_node, null_node
+from pineapple_nodes.nodes.math_nodes import add_node
+from pineapple_nodes.nodes.value_nodes import int_node
+
+
+@node(module="Test", name="RunRecord")
+def run_record_node(logs: Any(), value: Any()):
+    logs.append(value)
+
+
+def build_scenario(logs):
+    value = int_node().connect_input(a=0)
+    total = add_node().connect_input(a=value["out"], b=1)
+    check = if_node().connect_input(condition=True)
+    check.connect_flow(run_record_node().connect_input(logs=logs, value=total["out"]), True)
+    check.connect_flow(run_record_node().connect_input(logs=logs, value="false"), False)
+    return ScenarioTemplate(check), value, total
+
+
+def test_runs_keep_their_own_state():
+    logs = []
+    template, value, total = build_scenario(logs)
+
+    first = RunContext()
+    with first.activate():
+        value.inputs["a"].set(10)
+    template.run(first)
+    second = template.run()
+
+    assert logs == [11, 1]
+    assert first.get(total["out"]) == 11
+    assert second.get(total["out"]) == 1
+    assert total["out"].get() is None
+    assert template.start_node.trigger_log["trigger"] == 0
+    with first.activate():
+        assert template.start_node.trigger_log["trigger"] == 1
+        assert current_run() is first
+    assert current_run() is None
+
+
+def test_flows_toggled_in_a_run_do_not_leak():
+    logs = []
+    template, _, _ = build_scenario(logs)
+
+    run = RunContext()
+    with run.activate():
+        template.start_node.inputs["condition"].set(False)
+    template.run(run)
+    template.run()
+
+    assert logs == ["false", 1]
+    assert all(flow.priority > 0 for flow in template.start_node.flows)
+
+
+def test_concurrent_runs_share_a_template():
+    logs = []
+    start = null_node()
+    start.connect_flow(run_record_node().connect_input(logs=logs, value="done"))
+    template = ScenarioTemplate(start)
+
+    with ThreadPoolExecutor(8) as pool:
+        runs = list(pool.map(lambda _: template.run(), range(32)))
+
+    async def run_many():
+        return await asyncio.gather(*[template.arun() for _ in range(32)])
+
+    runs += asyncio.run(run_many())
+
+    assert len(logs) == 64
+    assert len(template.nodes) == 2
+    for run in runs:
+        with run.activate():
+            assert start.trigger_log["success"] == 1
+    assert start.trigger_log["success"] == 0
@@ -0,0 +1,180 @@
+import pytest
+
+from pineapple_core.core.journal import ExecutionJournal
+from pineapple_core.core.node import node, Node
+from pineapple_core.core.scheduler import FlowScheduler
+from pineapple_nodes.nodes.flow_nodes import null_node, format_exception_node
+
+
+@node(module="Test", name="CountDown")
+def count_down_node(self: Node, remaining: int):
+    self.inputs["remaining"].value = remaining - 1
+    if remaining <= 1:
+        self.get_flow("loop").disable()
+
+
+def test_long_loop_does_not_grow_the_stack():
+    counter = count_down_node()
+    counter.connect_input(remaining=20000)
+    counter.connect_flow(counter, "loop")
+
+    counter.trigger()
+
+    assert counter.trigger_log["success"] == 20000
+    assert counter.inputs["remaining"].value == 0
+
+
+class DepthRecordingScheduler(FlowScheduler):
+    max_depth = 0
+
+    def _push(self, node, resolve_inputs=True):
+        super()._push(node, resolve_inputs)
+        self.max_depth = max(self.max_depth, len(self.stack))
+
+
+def test_long_loop_with_journal_does_not_grow_the_stack():
+    counter = count_down_node()
+    counter.connect_input(remaining=5000)
+    counter.connect_flow(counter, "loop")
+    journal = ExecutionJournal(ring_size=100).attach(counter)
+
+    scheduler = DepthRecordingScheduler(counter)
+    scheduler.run()
+    journal.detach()
+
+    assert counter.trigger_log["success"] == 5000
+    assert scheduler.max_depth <= 2
+    kinds = [entry["kind"] for entry in journal.entries()]
+    assert kinds[-3:] == ["flow_end"] * 3
+
+
+def test_long_loop_through_several_nodes_does_not_grow_the_stack():
+    counter, step = count_down_node(), null_node()
+    counter.connect_input(remaining=5000)
+    counter.connect_flow(step, "loop")
+    step.connect_flow(counter)
+    after_flows = []
+    for current in (counter, step):
+        current.on.add("after_flow", lambda current, flow: after_flows.append(current))
+    journal = ExecutionJournal(ring_size=100).attach(counter)
+
+    scheduler = DepthRecordingScheduler(counter)
+    scheduler.run()
+    journal.detach()
+
+    assert counter.trigger_log["success"] == 5000
+    assert scheduler.max_depth <= 3
+    assert after_flows == [step, counter] * 4999
+
+
+def test_flow_callbacks_order_in_loop_through_several_nodes():
+    logs = []
+    counter, first, second = count_down_node(), null_node(), null_node()
+    counter.id, first.id, second.id = "counter", "first", "second"
+    counter.connect_input(remaining=3)
+    counter.connect_flow(first, "loop")
+    first.connect_flow(second)
+    second.connect_flow(counter)
+    for current in (counter, first, second):
+        current.on.add(
+            "after_flow", lambda current, flow: logs.append(f"{current.id} -> {flow.node.id}")
+        )
+
+    scheduler = DepthRecordingScheduler(counter)
+    scheduler.run()
+
+    assert logs == ["second -> counter", "first -> second", "counter -> first"] * 2
+    assert scheduler.max_depth <= 4
+
+
+def test_flow_failure_in_loop_is_handled_by_the_last_iteration():
+    logs = []
+
+    @node(module="Test", name="FailingCountDown")
+    def failing_count_down_node(self: Node, remaining: int):
+        self.inputs["remaining"].value = remaining - 1
+        if remaining <= 1:
+            raise ValueError("End of loop")
+
+    counter = failing_count_down_node()
+    counter.connect_input(remaining=3)
+    counter.connect_flow(counter, "loop")
+    counter.on.add("after_flow", lambda current, flow: logs.append("after"))
+    counter.on.add(
+        "flow_failure", lambda current, flow, exception: logs.append(f"failure({exception})")
+    )
+
+    scheduler = DepthRecordingScheduler(counter)
+    scheduler.run()
+
+    assert logs == ["failure(End of loop)", "after", "after"]
+    assert scheduler.max_depth <= 2
+
+
+def test_long_chain_does_not_grow_the_stack():
+    first = null_node()
+    last = first
+    for _ in range(5000):
+        next_node = null_node()
+        last.connect_flow(next_node)
+        last = next_node
+
+    first.trigger()
+
+    assert last.trigger_log["success"] == 1
+
+
+def test_flow_callbacks_order_in_nested_flows():
+    logs = []
+    root, child, grand_child, sibling = null_node(), null_node(), null_node(), null_node()
+    root.id, child.id, grand_child.id, sibling.id = "root", "child", "grand_child", "sibling"
+    for current in (root, child):
+        current.on.add(
+            "before_flow",
+            lambda current, flow: logs.append(f"before({current.id}, {flow.node.id})"),
+        )
+        current.on.add(
+            "after_flow",
+            lambda current, flow: logs.append(f"after({current.id}, {flow.node.id})"),
+        )
+    root.connect_flow(child)
+    root.connect_flow(sibling)
+    child.connect_flow(grand_child)
+
+    root.trigger()
+
+    assert logs == [
+        "before(root, child)",
+        "before(child, grand_child)",
+        "after(child, grand_child)",
+        "after(root, child)",
+        "before(root, sibling)",
+        "after(root, sibling)",
+    ]
+
+
+def test_flow_failure_is_forwarded_to_previous_nodes():
+    failures = []
+    root, middle = null_node(), null_node()
+    fail_step = format_exception_node()
+    fail_step.connect_input(exception_name="DeepError", string="Deep failure")
+    root.on.add(
+        "flow_failure", lambda current, flow, exception: failures.append(str(exception))
+    )
+    root.connect_flow(middle)
+    middle.connect_flow(fail_step)
+
+    root.trigger()
+
+    assert failures == ["Deep failure"]
+    assert middle.trigger_log["success"] == 1
+
+
+def test_unhandled_flow_failure_is_raised():
+    root = null_node()
+    fail_step = format_exception_node()
+    fail_step.connect_input(exception_name="DeepError", string="Unhandled failure")
+    root.connect_flow(null_node().connect_flow(fail_step))
+
+    with pytest.raises(Exception, match="Unhandled failure"):
+        root.trigger()
@@ -0,0 +1,74 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pineapple_core.core.node import node
+from pineapple_core.core.runs import RunContext, ScenarioTemplate
+from pineapple_core.core.types import Any
+
+threads = set()
+
+
+@node(module="Test", name="SlowLookup", autotrigger=True)
+def slow_lookup_node(value: Any(), delay: float) -> Any():
+    threads.add(threading.current_thread())
+    time.sleep(delay)
+    if isinstance(value, Exception):
+        raise value
+    return value
+
+
+@node(module="Test", name="FanIn")
+def fan_in_node(*values: Any()) -> Any():
+    return list(values)
+
+
+def build_fan_in(values, delay):
+    fan_in = fan_in_node()
+    fan_in.connect_input(
+        *[slow_lookup_node().connect_input(value=value, delay=delay) for value in values]
+    )
+    return fan_in
+
+
+def test_independent_inputs_are_resolved_concurrently():
+    fan_in = build_fan_in(range(6), 0.2)
+    run = RunContext(ThreadPoolExecutor(max_workers=6))
+
+    start = time.perf_counter()
+    with run.activate():
+        fan_in.trigger()
+
+    assert run.get(fan_in["out"]) == [0, 1, 2, 3, 4, 5]
+    assert time.perf_counter() - start < 0.6
+    run.executor.shutdown()
+
+
+def test_runs_of_a_template_share_its_thread_pool():
+    template = ScenarioTemplate(build_fan_in(range(4), 0.05), max_workers=4)
+    threads.clear()
+
+    start = time.perf_counter()
+    runs = [template.run() for _ in range(3)]
+    run = template.run(runs[0])
+    template.close()
+
+    assert time.perf_counter() - start < 0.6
+    assert all(run.get(template.start_node["out"]) == [0, 1, 2, 3] for run in runs)
+    assert run is runs[0]
+    assert len(threads) <= 4
+
+
+def test_thread_pool_callbacks_and_failures_are_deterministic():
+    logs = []
+    fan_in = build_fan_in([0, ValueError("first"), 2, ValueError("second")], 0)
+    fan_in.on.add(
+        "trigger_input", lambda node, node_input, triggered_node: logs.append(node_input.name)
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as executor, RunContext(executor).activate():
+        with pytest.raises(ValueError, match="first"):
+            fan_in.trigger()
+    assert logs == ["0", "1", "2", "3"]
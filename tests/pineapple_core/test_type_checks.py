@@ -0,0 +1,61 @@
+import pytest
+
+from pineapple_core.core.exceptions import (
+    InvalidNodeOutputTypeError,
+    InvalidTypeCheckPolicyError,
+)
+from pineapple_core.core.node import node
+from pineapple_core.core.type_checks import (
+    TypeCheckPolicy,
+    get_type_check_policy,
+    set_type_check_policy,
+)
+from pineapple_nodes.nodes.flow_nodes import null_node
+
+
+@node(module="Test", name="LyingNode")
+def lying_node(value: int) -> int:
+    return str(value)
+
+
+def test_scenario_policies():
+    start, liar = null_node(), lying_node().connect_input(value=1)
+    start.connect_flow(liar)
+    with pytest.raises(InvalidNodeOutputTypeError):
+        start.trigger()
+
+    set_type_check_policy(TypeCheckPolicy("off"), start)
+    start.trigger()
+    assert liar["out"].get() == "1"
+    assert liar.dump()["type_check_policy"] == {"mode": "off", "sample_rate": 100}
+    assert get_type_check_policy() is not liar.type_check_policy
+
+    set_type_check_policy(None, start)
+    with pytest.raises(InvalidNodeOutputTypeError):
+        start.trigger()
+
+
+def test_sampled_policy_reports_without_raising():
+    liar = lying_node().connect_input(value=1)
+    policy = TypeCheckPolicy("sampled", sample_rate=3)
+    liar.type_check_policy = policy
+
+    with pytest.warns(RuntimeWarning):
+        for _ in range(7):
+            liar.trigger()
+
+    assert policy.mismatches == {"Test.LyingNode[out]": 3}
+
+
+def test_global_policy():
+    liar = lying_node().connect_input(value=1)
+    set_type_check_policy(TypeCheckPolicy("off"))
+    try:
+        liar.trigger()
+        assert liar.dump(False)["type_check_policy"]["mode"] == "off"
+    finally:
+        set_type_check_policy(None)
+    with pytest.raises(InvalidNodeOutputTypeError):
+        liar.trigger()
+    with pytest.raises(InvalidTypeCheckPolicyError):
+        TypeCheckPolicy("sometimes")
@@ -0,0 +1,38 @@
+import typing
+
+import pytest
+from klotan.match import OptionalKey
+
+from pineapple_core.core.types import Any
+from pineapple_core.core.validators import compile_validator
+
+
+def test_flat_types():
+    assert compile_validator(int)(1)
+    assert not compile_validator(int)(True)
+    assert not compile_validator(int)("1")
+    assert compile_validator(typing.Optional[int])(None)
+    assert compile_validator(Any())(object())
+
+
+def test_structures():
+    check_result = compile_validator({"result": bool, "message": str})
+    assert check_result({"result": True, "message": "", "extra": 1})
+    assert not check_result({"result": True})
+    assert not check_result({"result": 1, "message": ""})
+    assert not check_result([True, ""])
+
+    nested = compile_validator({"a": [int], "b": {"c": [[int]]}, OptionalKey("d"): [str, int]})
+    assert nested({"a": [1, 2], "b": {"c": [[1], []]}})
+    assert nested({"a": (), "b": {"c": []}, "d": ["x", 1]})
+    assert not nested({"a": [1], "b": {"c": [[1.0]]}})
+    assert not nested({"a": [1], "b": {"c": []}, "d": [None]})
+    assert compile_validator([int, {"e": str}])([1, {"e": "x"}])
+
+
+def test_callables_are_ignored_and_invalid_items_raise():
+    assert compile_validator({"a": Any(), "b": int})({"b": 1})
+    assert compile_validator([Any()])(["anything"])
+    invalid = compile_validator({"a": 1})
+    with pytest.raises(RuntimeError):
+        invalid({"a": 1})
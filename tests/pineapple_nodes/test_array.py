@@ -0,0 +1,45 @@
+import pytest
+
+from pineapple_core.core.types import NumericArray, NumericOrArray
+from pineapple_nodes.nodes.array_nodes import (
+    add_node,
+    all_node,
+    from_list_node,
+    less_than_node,
+    mean_node,
+    percentile_node,
+    sum_node,
+)
+
+
+def test_numeric_or_array_accepts_scalars():
+    assert NumericOrArray.check(3)
+    assert NumericOrArray.check(2.5)
+    assert not NumericOrArray.check("3")
+    assert not NumericArray().check([1, 2, 3])
+
+
+def test_array_nodes_compute_element_wise():
+    numpy = pytest.importorskip("numpy")
+    latencies = from_list_node().connect_input(values=[120, 80, 250, 40])
+    shifted = add_node().connect_input(a=latencies["out"], b=10)
+    total = sum_node().connect_input(shifted["out"])
+    total.trigger()
+
+    assert numpy.array_equal(shifted["out"].get(), numpy.array([130, 90, 260, 50]))
+    assert total["out"].get() == 530
+
+
+def test_array_nodes_validate_distributions():
+    pytest.importorskip("numpy")
+    latencies = from_list_node().connect_input(values=list(range(1, 1001)))
+    under_limit = less_than_node().connect_input(a=latencies["out"], b=1001)
+    all_under_limit = all_node().connect_input(array=under_limit["out"])
+    p95 = percentile_node().connect_input(array=latencies["out"], percentile=95)
+    mean = mean_node().connect_input(array=latencies["out"])
+    for result in (all_under_limit, p95, mean):
+        result.trigger()
+
+    assert all_under_limit["out"].get() is True
+    assert p95["out"].get() == pytest.approx(950.05)
+    assert mean["out"].get() == pytest.approx(500.5)
@@ -0,0 +1,124 @@
+import asyncio
+import time
+
+import pytest
+
+from pineapple_core.core.node import node
+from pineapple_core.core.types import Any
+from pineapple_nodes.nodes.flow_nodes import async_sleep_node, join_node, null_node
+
+
+@node(module="Test", name="SlowRecord")
+def slow_record_node(logs: Any(), value: Any(), delay: float):
+    time.sleep(delay)
+    if isinstance(value, Exception):
+        raise value
+    logs.append(value)
+
+
+@node(module="Test", name="SlowCount", autotrigger=True)
+def slow_count_node(calls: Any(), delay: float) -> int:
+    calls.append(None)
+    time.sleep(delay)
+    return len(calls)
+
+
+def build_fan_out(logs, values, delay):
+    root, join = null_node(), join_node()
+    for value in values:
+        branch = slow_record_node().connect_input(logs=logs, value=value, delay=delay)
+        branch.connect_flow(join)
+        root.connect_flow(branch, parallel=True)
+    join.connect_flow(slow_record_node().connect_input(logs=logs, value="joined", delay=0))
+    return root, join
+
+
+def test_parallel_flows_run_concurrently_and_join_once():
+    logs = []
+    root, join = build_fan_out(logs, range(8), 0.2)
+
+    start = time.perf_counter()
+    root.trigger()
+
+    assert time.perf_counter() - start < 0.8
+    assert sorted(logs[:-1]) == list(range(8))
+    assert logs[-1] == "joined"
+    assert join.trigger_log["success"] == 1
+
+
+def test_parallel_flows_share_autotrigger_dependencies():
+    logs, calls = [], []
+    producer = slow_count_node().connect_input(calls=calls, delay=0.1)
+    root, join = null_node(), join_node()
+    for _ in range(4):
+        branch = slow_record_node().connect_input(logs=logs, value=producer, delay=0)
+        branch.connect_flow(join)
+        root.connect_flow(branch, parallel=True)
+
+    root.trigger()
+
+    assert len(calls) == 1
+    assert logs == [1, 1, 1, 1]
+    assert producer.trigger_log["success"] == 1
+
+    root.trigger()
+
+    assert len(calls) == 2
+    assert logs[4:] == [2, 2, 2, 2]
+
+
+def test_parallel_flows_with_atrigger():
+    logs = []
+    root, join = null_node(), join_node()
+    for delay in (0.2, 0.2, 0.2):
+        branch = async_sleep_node().connect_input(delay=delay).connect_flow(join)
+        root.connect_flow(branch, parallel=True)
+    join.connect_flow(slow_record_node().connect_input(logs=logs, value="joined", delay=0))
+
+    start = time.perf_counter()
+    asyncio.run(root.atrigger())
+
+    assert time.perf_counter() - start < 0.5
+    assert logs == ["joined"]
+
+
+def test_parallel_flow_callbacks_and_failures():
+    logs, failures = [], []
+    root, join = build_fan_out(logs, [1, ValueError("Branch failure"), 3], 0)
+    root.on.add("before_flow", lambda current, flow: failures.append(f"before {flow.name}"))
+    root.on.add("after_flow", lambda current, flow: failures.append(f"after {flow.name}"))
+    root.on.add(
+        "flow_failure", lambda current, flow, exception: failures.append(f"failure {flow.name}")
+    )
+
+    root.trigger()
+
+    assert sorted(logs) == [1, 3]
+    assert join.trigger_log["trigger"] == 0
+    assert failures == [
+        "before 0",
+        "before 1",
+        "before 2",
+        "after 0",
+        "failure 1",
+        "after 1",
+        "after 2",
+    ]
+
+
+def test_unhandled_parallel_failure_is_raised():
+    root, _ = build_fan_out([], [ValueError("Branch failure"), 2], 0)
+
+    with pytest.raises(ValueError, match="Branch failure"):
+        root.trigger()
+
+
+def test_join_without_parallel_flows_continues():
+    logs = []
+    root, join = null_node(), join_node()
+    root.connect_flow(join)
+    join.connect_flow(slow_record_node().connect_input(logs=logs, value="joined", delay=0))
+
+    root.trigger()
+
+    assert logs == ["joined"]
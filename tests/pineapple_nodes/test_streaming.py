@@ -0,0 +1,101 @@
+import pytest
+
+from pineapple_core.core.node import node, Node
+from pineapple_core.core.types import Any
+from pineapple_nodes.nodes.flow_nodes import if_node, range_node
+
+
+@node(module="Test", name="Record")
+def record_node(logs: Any(), value: Any()):
+    logs.append(("consume", value))
+
+
+@node(module="Test", name="Produce")
+def produce_node(logs: Any(), count: int) -> int:
+    for i in range(count):
+        logs.append(("produce", i))
+        yield i
+
+
+@node(module="Test", name="ProduceThenFail")
+def produce_then_fail_node() -> int:
+    yield 1
+    raise ValueError("Stream failure")
+
+
+@node(module="Test", name="IsEven", autotrigger=True)
+def is_even_node(value: int) -> bool:
+    return value % 2 == 0
+
+
+def test_range_streams_items_to_the_flows():
+    logs = []
+    numbers = range_node().connect_input(start=0, end=5, step=1)
+    numbers.connect_flow(record_node().connect_input(logs=logs, value=numbers["out"]))
+
+    numbers.trigger()
+
+    assert logs == [("consume", i) for i in range(5)]
+    assert numbers.trigger_log["success"] == 1
+
+
+def test_items_are_pulled_lazily():
+    logs = []
+    producer = produce_node().connect_input(logs=logs, count=3)
+    producer.connect_flow(record_node().connect_input(logs=logs, value=producer["out"]))
+
+    producer.trigger()
+
+    assert logs == [
+        ("produce", 0),
+        ("consume", 0),
+        ("produce", 1),
+        ("consume", 1),
+        ("produce", 2),
+        ("consume", 2),
+    ]
+
+
+def test_empty_stream_executes_no_flow():
+    logs = []
+    producer = produce_node().connect_input(logs=[], count=0)
+    producer.connect_flow(record_node().connect_input(logs=logs, value=None))
+
+    producer.trigger()
+
+    assert logs == []
+
+
+def test_flows_are_reset_for_each_item():
+    logs = []
+    numbers = range_node().connect_input(start=0, end=4, step=1)
+    condition = if_node().connect_input(
+        condition=is_even_node().connect_input(value=numbers["out"])
+    )
+    condition.connect_flow(record_node().connect_input(logs=logs, value=numbers["out"]), True)
+    numbers.connect_flow(condition)
+
+    numbers.trigger()
+
+    assert logs == [("consume", 0), ("consume", 2)]
+
+
+def test_stream_failure_is_forwarded():
+    logs, failures = [], []
+    producer = produce_then_fail_node()
+    producer.connect_flow(record_node().connect_input(logs=logs, value=producer["out"]))
+    root = Node(lambda: None, "Test", "Root", False)
+    root.connect_flow(producer)
+    root.on.add(
+        "flow_failure", lambda current, flow, exception: failures.append(str(exception))
+    )
+
+    root.trigger()
+
+    assert logs == [("consume", 1)]
+    assert failures == ["Stream failure"]
+
+
+def test_unhandled_stream_failure_is_raised():
+    with pytest.raises(ValueError, match="Stream failure"):
+        produce_then_fail_node().trigger()